@@ -2,6 +2,11 @@
 # CRYPTO DATA COLLECTOR - CONFIGURATION FILE
 # ============================================================================
 
+from contextvars import ContextVar
+from types import MappingProxyType
+
+# Dictionaries below are read-only views: edit the literals, not the values at runtime
+
 # ----------------------------------------------------------------------------
 # RESET CONFIGURATION
 # ----------------------------------------------------------------------------
@@ -16,19 +21,26 @@ ADD_ALL_TWITTER_ACCOUNTS = False
 # LOGGING CONFIGURATION
 # ----------------------------------------------------------------------------
 
-logger_folder = "default"
+# Log sub-folder of the current cycle; set per cycle with logger_folder.set(...)
+logger_folder = ContextVar("logger_folder", default="default")
 
 # ----------------------------------------------------------------------------
 # DATABASE CONFIGURATION
 # ----------------------------------------------------------------------------
 
-DB_CONFIG = {
+DB_CONFIG = MappingProxyType({
     "host": "localhost",
     "port": 5432,
     "database": "crypto",
     "user": "crypto",
     "password": "crypto",
-}
+})
+DB_POOL_MIN_CONN = 1
+# The trading bot alone holds 10 CryptoDatabase instances (pipeline + 9 layers); keep headroom above it
+DB_POOL_MAX_CONN = 20
+USE_TIMESCALEDB = False
+MARKET_DATA_RETENTION_DAYS = 90
+
 # ----------------------------------------------------------------------------
 # DATA COLLECTION CONFIGURATION
 # ----------------------------------------------------------------------------
@@ -43,22 +55,34 @@ TRADING_DECISION_INTERVAL_MINUTES = 15
 
 API_BASE_DELAY = 2 
 API_BACKOFF_DELAY = 60 
+API_REQUEST_TIMEOUT = 10
+API_MAX_RETRIES = 5
+BINANCE_SYMBOLS_TTL_MINUTES = 360
 NUMBER_OF_CRTYPTO_PER_REQUEST = 10
 NUMBER_OF_PAGES_TO_FETCH = 1
+BINANCE_MAX_WORKERS = 10
+COINGECKO_MAX_WORKERS = 4
+# CoinGecko's public API allows about 30 requests per minute
+COINGECKO_RATE_PER_SEC = 0.5
+MARKET_DB_BATCH_SIZE = 25
 
 # ----------------------------------------------------------------------------
 # SCRAPER CONFIGURATION
 # ----------------------------------------------------------------------------
 
-SCRAPER_CONFIG = {
+SCRAPER_CONFIG = MappingProxyType({
         'html_dir': 'html_output',
         'headless': False,
         'timeout': 15
-    }
+    })
 
 #SENTIMENT_MODEL_NAME = 'cardiffnlp/twitter-roberta-base-sentiment-latest'
 #SENTIMENT_MODEL_NAME = 'ProsusAI/finbert'
 SENTIMENT_MODEL_NAME = "yangheng/deberta-v3-base-absa-v1.1"
+SENTIMENT_BATCH_SIZE = 32
+SENTIMENT_QUEUE_SIZE = 4
+SENTIMENT_FLUSH_TWEETS = 64
+SENTIMENT_FLUSH_SECONDS = 2
 TWEET_RETENTION_DAYS = 7 
 
 NITTER_INSTANCES = [
@@ -98,7 +122,7 @@ ENTRY_SCORE_THRESHOLD_SHORT = -0.55
 TECHNICAL_WEIGHT = 0.85
 SENTIMENT_WEIGHT = 0.15
 
-TECHNICAL_WEIGHTS = {
+TECHNICAL_WEIGHTS = MappingProxyType({
     'ema': 0.22,
     'macd': 0.22,
     'rsi': 0.13,
@@ -106,7 +130,7 @@ TECHNICAL_WEIGHTS = {
     'volatility': 0.20,
     'pivot': 0.07,
     'fibo': 0.07
-}
+})
 
 PANIC_ATR_THRESHOLD = 0.05 
 PANIC_VOLUME_RATIO = 2.0  
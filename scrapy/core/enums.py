@@ -1,18 +1,19 @@
-from enum import Enum, auto
+from enum import IntEnum, auto
 
-class MarketRegime(Enum):
+# IntEnum members compare as plain ints; values (1, 2, ...) are unchanged from auto()
+class MarketRegime(IntEnum):
     TREND_UP = auto()
     TREND_DOWN = auto()
     RANGE = auto()
     PANIC = auto()
     NO_TRADE = auto()
 
-class TakeStop(Enum):
+class TakeStop(IntEnum):
     TakeProfit = auto()
     StopLoss = auto()
     Hold = auto()
 
-class LongShort(Enum):
+class LongShort(IntEnum):
     EnterLong = auto()
     EnterShort = auto()
     NoTrade = auto()
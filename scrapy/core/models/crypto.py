@@ -1,4 +1,6 @@
 class Crypto:
+    __slots__ = ('name', 'symbol', 'id_coingecko', 'rank', 'symbol_binance', 'data')
+
     def __init__(self, name: str, symbol: str, id_coingecko: str, rank: int, symbol_binance: str = None):
         self.name = name
         self.symbol = symbol
@@ -66,11 +68,11 @@ class Crypto:
         self.data['circulating_supply'] = None
         self.data['total_supply'] = None
         self.data['max_supply'] = None
-        self.data['PP'] = None
-        self.data['R1'] = None
-        self.data['R2'] = None
-        self.data['S1'] = None
-        self.data['S2'] = None
+        self.data['pp'] = None
+        self.data['r1'] = None
+        self.data['r2'] = None
+        self.data['s1'] = None
+        self.data['s2'] = None
         self.data['rsi_values'] = None
         self.data['macd_h'] = None
         self.data['signal_line_h'] = None
@@ -82,7 +84,7 @@ class Crypto:
         self.data['sma_200'] = None
         self.data['ema_50'] = None
         self.data['ema_200'] = None
-        self.data['POC'] = None
+        self.data['poc'] = None
         self.data['fib_levels_1'] = None
         self.data['fib_levels_2'] = None
         self.data['fib_levels_3'] = None
@@ -110,6 +112,10 @@ class Crypto:
             return -1
         self.data[key] = value
         return 0
+
+    def update_many(self, values):
+        data = self.data
+        data.update((key, value) for key, value in values if key in data)
     
     def get_data_key(self, key: str):
         return self.data.get(key, None)
\ No newline at end of file
@@ -1,9 +1,550 @@
+from collections import deque
 from datetime import datetime, timedelta
+import io
+import struct
+import sys
+import threading
+from contextlib import contextmanager
+from decimal import Decimal
+import numpy as np
 import psycopg2
+from psycopg2 import sql
+from psycopg2.extras import RealDictCursor, execute_values
+from psycopg2.pool import ThreadedConnectionPool
 from typing import List, Dict, Any, Optional
 import scrapy.utils.logger as Logger
 import scrapy.config.settings as conf
 
+_POOL = None
+_POOL_LOCK = threading.Lock()
+
+class _PooledConnection(psycopg2.extensions.connection):
+    """psycopg2 connection that remembers the statements prepared in its session."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prepared = set()
+
+def _get_pool():
+    """Return the process-wide connection pool, creating it on first use."""
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            _POOL = ThreadedConnectionPool(
+                conf.DB_POOL_MIN_CONN,
+                conf.DB_POOL_MAX_CONN,
+                connection_factory=_PooledConnection,
+                **conf.DB_CONFIG
+            )
+    return _POOL
+
+_CRYPTOS_DDL = """
+CREATE TABLE IF NOT EXISTS cryptos (
+    id SERIAL PRIMARY KEY,
+    name TEXT NOT NULL,
+    symbol TEXT NOT NULL,
+    id_coingecko TEXT UNIQUE NOT NULL,
+    symbol_binance TEXT DEFAULT 'UNKNOWN'
+);
+"""
+
+_CRYPTO_RANKS_DDL = """
+CREATE TABLE IF NOT EXISTS crypto_ranks (
+    id SERIAL PRIMARY KEY,
+    crypto_id INTEGER NOT NULL UNIQUE REFERENCES cryptos(id) ON DELETE CASCADE,
+    rank INTEGER NOT NULL
+);
+"""
+
+_DATA_BASE_DDL = """
+CREATE TABLE IF NOT EXISTS cyptos_data_base (
+    crypto_id INTEGER NOT NULL REFERENCES cryptos(id) ON DELETE CASCADE,
+    price DECIMAL(24,8),
+    high_24h DECIMAL(24,8),
+    low_24h DECIMAL(24,8),
+    dominance DOUBLE PRECISION,
+    variation24h_pst DOUBLE PRECISION,
+    variation24h DECIMAL(24,8),
+    mc_variation24h_pst DOUBLE PRECISION,
+    mc_variation24h DECIMAL(24,8),
+    market_cap DECIMAL(24,2),
+    total_volume DECIMAL(24,2),
+    fully_diluted_valuation DECIMAL(24,2),
+    all_time_high DECIMAL(24,8),
+    all_time_high_timestamp TIMESTAMP,
+    all_time_high_pst DOUBLE PRECISION,
+    timestamp TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+
+    PRIMARY KEY (crypto_id, timestamp)
+);
+"""
+
+_DATA_DETAILS_DDL = """
+CREATE TABLE IF NOT EXISTS cyptos_data_details (
+    crypto_id INTEGER NOT NULL REFERENCES cryptos(id) ON DELETE CASCADE,
+    volume_actuel DOUBLE PRECISION,
+    volume_1j DOUBLE PRECISION,
+    volume_7j DOUBLE PRECISION,
+    volume_30j DOUBLE PRECISION,
+    variation_1j DOUBLE PRECISION,
+    variation_7j DOUBLE PRECISION,
+    variation_30j DOUBLE PRECISION,
+    volume_moyen_30j DOUBLE PRECISION,
+    variation_moyenne_30j DOUBLE PRECISION,
+    volume_moyen_7j DOUBLE PRECISION,
+    variation_moyenne_7j DOUBLE PRECISION,
+    volume_moyen_1j DOUBLE PRECISION,
+    variation_moyenne_1j DOUBLE PRECISION,
+    current_price DOUBLE PRECISION,
+    d1_percentage DOUBLE PRECISION,
+    d1_value DOUBLE PRECISION,
+    d1_vs_avg DOUBLE PRECISION,
+    d1_mean DOUBLE PRECISION,
+    d7_percentage DOUBLE PRECISION,
+    d7_value DOUBLE PRECISION,
+    d7_vs_avg DOUBLE PRECISION,
+    d7_mean DOUBLE PRECISION,
+    d14_percentage DOUBLE PRECISION,
+    d14_value DOUBLE PRECISION,
+    d14_vs_avg DOUBLE PRECISION,
+    d14_mean DOUBLE PRECISION,
+    d30_percentage DOUBLE PRECISION,
+    d30_value DOUBLE PRECISION,
+    d30_vs_avg DOUBLE PRECISION,
+    d30_mean DOUBLE PRECISION,
+    circulating_supply DECIMAL(24,8),
+    total_supply DECIMAL(24,8),
+    max_supply DECIMAL(24,8),
+    pp DOUBLE PRECISION,
+    r1 DOUBLE PRECISION,
+    r2 DOUBLE PRECISION,
+    s1 DOUBLE PRECISION,
+    s2 DOUBLE PRECISION,
+    rsi_values DOUBLE PRECISION,
+    macd_h DOUBLE PRECISION,
+    signal_line_h DOUBLE PRECISION,
+    histogram_h DOUBLE PRECISION,
+    macd_j DOUBLE PRECISION,
+    signal_line_j DOUBLE PRECISION,
+    histogram_j DOUBLE PRECISION,
+    sma_50 DOUBLE PRECISION,
+    sma_200 DOUBLE PRECISION,
+    ema_50 DOUBLE PRECISION,
+    ema_200 DOUBLE PRECISION,
+    poc DOUBLE PRECISION,
+    fib_levels_1 DOUBLE PRECISION,
+    fib_levels_2 DOUBLE PRECISION,
+    fib_levels_3 DOUBLE PRECISION,
+    fib_levels_4 DOUBLE PRECISION,
+    fib_levels_5 DOUBLE PRECISION,
+    fib_levels_6 DOUBLE PRECISION,
+    fib_levels_7 DOUBLE PRECISION,
+    timestamp TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (crypto_id, timestamp)
+);
+"""
+
+_DATA_BINANCE_DDL = """
+CREATE TABLE IF NOT EXISTS cyptos_data_binance (
+    crypto_id INTEGER NOT NULL REFERENCES cryptos(id) ON DELETE CASCADE,
+    bids_price_1 DECIMAL(24,8),
+    bids_quantity_1 DECIMAL(24,8),
+    bids_price_2 DECIMAL(24,8),
+    bids_quantity_2 DECIMAL(24,8),
+    bids_price_3 DECIMAL(24,8),
+    bids_quantity_3 DECIMAL(24,8),
+    asks_price_1 DECIMAL(24,8),
+    asks_quantity_1 DECIMAL(24,8),
+    asks_price_2 DECIMAL(24,8),
+    asks_quantity_2 DECIMAL(24,8),
+    asks_price_3 DECIMAL(24,8),
+    asks_quantity_3 DECIMAL(24,8),
+    funding_rate DECIMAL(24,4),
+    open_interest DECIMAL(24,2),
+    timestamp TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+
+    PRIMARY KEY (crypto_id, timestamp)
+);
+"""
+
+DETAILS_COLS = (
+    'volume_actuel', 'volume_1j', 'volume_7j', 'volume_30j', 'variation_1j', 'variation_7j',
+    'variation_30j', 'volume_moyen_30j', 'variation_moyenne_30j', 'volume_moyen_7j',
+    'variation_moyenne_7j', 'volume_moyen_1j', 'variation_moyenne_1j', 'current_price',
+    'd1_percentage', 'd1_value', 'd1_vs_avg', 'd1_mean', 'd7_percentage', 'd7_value', 'd7_vs_avg',
+    'd7_mean', 'd14_percentage', 'd14_value', 'd14_vs_avg', 'd14_mean', 'd30_percentage',
+    'd30_value', 'd30_vs_avg', 'd30_mean', 'circulating_supply', 'total_supply', 'max_supply',
+    'pp', 'r1', 'r2', 's1', 's2', 'rsi_values', 'macd_h', 'signal_line_h', 'histogram_h', 'macd_j',
+    'signal_line_j', 'histogram_j', 'sma_50', 'sma_200', 'ema_50', 'ema_200', 'poc',
+    'fib_levels_1', 'fib_levels_2', 'fib_levels_3', 'fib_levels_4', 'fib_levels_5', 'fib_levels_6',
+    'fib_levels_7'
+)
+_DETAILS_COPY_SQL = f"COPY cyptos_data_details ({', '.join(('crypto_id',) + DETAILS_COLS)}) FROM STDIN WITH (FORMAT binary)"
+
+def _prepare_sql(name, table, columns):
+    """Build a PREPARE statement for a single-row INSERT into table."""
+    params = ", ".join(f"${i}" for i in range(1, len(columns) + 1))
+    return f"PREPARE {name} AS INSERT INTO {table} ({', '.join(columns)}) VALUES ({params})"
+
+_BASE_COLUMNS = (
+    "crypto_id", "price", "high_24h", "low_24h", "dominance", "variation24h_pst", "variation24h",
+    "mc_variation24h_pst", "mc_variation24h", "market_cap", "total_volume",
+    "fully_diluted_valuation", "all_time_high", "all_time_high_timestamp", "all_time_high_pst"
+)
+_BINANCE_COLUMNS = (
+    "crypto_id", "bids_price_1", "bids_quantity_1", "bids_price_2", "bids_quantity_2",
+    "bids_price_3", "bids_quantity_3", "asks_price_1", "asks_quantity_1",
+    "asks_price_2", "asks_quantity_2", "asks_price_3", "asks_quantity_3",
+    "funding_rate", "open_interest"
+)
+
+_PREPARED_STATEMENTS = {
+    "ins_base": _prepare_sql("ins_base", "cyptos_data_base", _BASE_COLUMNS),
+    "ins_details": _prepare_sql("ins_details", "cyptos_data_details", ("crypto_id",) + DETAILS_COLS),
+    "ins_binance": _prepare_sql("ins_binance", "cyptos_data_binance", _BINANCE_COLUMNS),
+    # Hot single-key lookups of the trading and sentiment loops
+    "sel_last_price": """PREPARE sel_last_price (integer) AS
+        SELECT price FROM cyptos_data_base WHERE crypto_id = $1 ORDER BY timestamp DESC LIMIT 1""",
+    "sel_crypto_id": """PREPARE sel_crypto_id (text) AS
+        SELECT id FROM cryptos WHERE symbol = $1 OR name = $1""",
+    "sel_tweet_exists": """PREPARE sel_tweet_exists (text) AS
+        SELECT EXISTS (SELECT 1 FROM tweet_hash WHERE hash = $1)""",
+    "sel_sentiments_24h": """PREPARE sel_sentiments_24h (integer) AS
+        SELECT array_agg(tc.sentiment_score) FROM tweet_crypto tc JOIN tweet_sentiments ts ON tc.tweet_id = ts.tweet_id
+        WHERE tc.crypto_id = $1 AND ts.timestamp >= EXTRACT(EPOCH FROM (NOW() - INTERVAL '24 hours'))""",
+    "sel_sentiments_12h": """PREPARE sel_sentiments_12h (integer) AS
+        SELECT array_agg(tc.sentiment_score) FROM tweet_crypto tc JOIN tweet_sentiments ts ON tc.tweet_id = ts.tweet_id
+        WHERE tc.crypto_id = $1 AND ts.timestamp >= EXTRACT(EPOCH FROM (NOW() - INTERVAL '12 hours'))""",
+}
+_PREPARED_EXECUTES = {
+    "ins_base": f"EXECUTE ins_base ({', '.join(['%s'] * len(_BASE_COLUMNS))})",
+    "ins_details": f"EXECUTE ins_details ({', '.join(['%s'] * (len(DETAILS_COLS) + 1))})",
+    "ins_binance": f"EXECUTE ins_binance ({', '.join(['%s'] * len(_BINANCE_COLUMNS))})",
+    "sel_last_price": "EXECUTE sel_last_price (%s)",
+    "sel_crypto_id": "EXECUTE sel_crypto_id (%s)",
+    "sel_tweet_exists": "EXECUTE sel_tweet_exists (%s)",
+    "sel_sentiments_24h": "EXECUTE sel_sentiments_24h (%s)",
+    "sel_sentiments_12h": "EXECUTE sel_sentiments_12h (%s)",
+}
+# Prepared single-row insert of each COPY-loaded table, used when rows are sent one at a time
+_ROW_PREPARED = {"cyptos_data_base": "ins_base", "cyptos_data_details": "ins_details", "cyptos_data_binance": "ins_binance"}
+
+def _row_template(width):
+    """Build the placeholder tuple used to mogrify one row of width values."""
+    return "(" + ",".join(["%s"] * width) + ")"
+
+# (prefix, row template, suffix) around a rendered multi-row VALUES list, for the multi-statement cycle insert.
+# Unchanged ranks are left alone so a cycle does not rewrite every crypto_ranks row.
+_BULK_INSERTS = {
+    "crypto_ranks": (
+        b"INSERT INTO crypto_ranks (crypto_id, rank) VALUES ",
+        _row_template(2),
+        b" ON CONFLICT (crypto_id) DO UPDATE SET rank = EXCLUDED.rank"
+        b" WHERE crypto_ranks.rank IS DISTINCT FROM EXCLUDED.rank"
+    ),
+    "cyptos_data_base": (
+        f"INSERT INTO cyptos_data_base ({', '.join(_BASE_COLUMNS)}) VALUES ".encode(), _row_template(len(_BASE_COLUMNS)), b""
+    ),
+    "cyptos_data_binance": (
+        f"INSERT INTO cyptos_data_binance ({', '.join(_BINANCE_COLUMNS)}) VALUES ".encode(), _row_template(len(_BINANCE_COLUMNS)), b""
+    ),
+}
+
+_MARKET_SCHEMA_DDL = (_CRYPTOS_DDL, _CRYPTO_RANKS_DDL, _DATA_BASE_DDL, _DATA_DETAILS_DDL, _DATA_BINANCE_DDL)
+
+_SENTIMENT_SCORES_DDL = """
+CREATE TABLE IF NOT EXISTS crypto_sentiment_scores (
+    crypto_id INTEGER NOT NULL,
+    score_12h FLOAT,
+    count_12h INTEGER,
+    score_24h FLOAT,
+    count_24h INTEGER,
+    timestamp TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP, 
+    PRIMARY KEY (crypto_id, timestamp),
+    FOREIGN KEY (crypto_id) REFERENCES cryptos(id) ON DELETE CASCADE
+);
+"""
+
+_TWEET_HASH_DDL = """
+CREATE TABLE IF NOT EXISTS tweet_hash (
+    tweet_id SERIAL PRIMARY KEY,
+    hash TEXT NOT NULL UNIQUE
+);
+"""
+
+_TWEET_SENTIMENTS_DDL = """
+CREATE TABLE IF NOT EXISTS tweet_sentiments (
+    tweet_id INTEGER PRIMARY KEY,
+    account TEXT,
+    tweet_content TEXT,
+    timestamp BIGINT,
+    FOREIGN KEY (tweet_id) REFERENCES tweet_hash(tweet_id) ON DELETE CASCADE
+);
+CREATE INDEX IF NOT EXISTS tweet_sentiments_timestamp_brin
+    ON tweet_sentiments USING BRIN (timestamp) WITH (pages_per_range = 32);
+"""
+
+_TWEET_CRYPTO_DDL = """
+CREATE TABLE IF NOT EXISTS tweet_crypto (
+    tweet_id INTEGER,
+    crypto_id INTEGER,
+    sentiment_score FLOAT,
+    PRIMARY KEY (tweet_id, crypto_id),
+    FOREIGN KEY (tweet_id) REFERENCES tweet_hash(tweet_id) ON DELETE CASCADE,
+    FOREIGN KEY (crypto_id) REFERENCES cryptos(id) ON DELETE CASCADE
+);
+CREATE INDEX IF NOT EXISTS tweet_crypto_crypto_idx
+    ON tweet_crypto (crypto_id, tweet_id) INCLUDE (sentiment_score);
+"""
+
+_ACCOUNT_DDL = """
+CREATE TABLE IF NOT EXISTS account (
+    account_id SERIAL PRIMARY KEY,
+    account_name TEXT UNIQUE NOT NULL
+);
+"""
+
+_CRYPTO_SCORES_DDL = """
+CREATE TABLE IF NOT EXISTS crypto_scores (
+    crypto_id INTEGER NOT NULL REFERENCES cryptos(id) ON DELETE CASCADE,
+    timestamp TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    score_metric FLOAT,
+    score_total FLOAT,
+    Trend FLOAT,
+    priceUnit FLOAT,
+    PRIMARY KEY (crypto_id, timestamp)
+);
+"""
+
+_TRADE_DATA_DDL = """
+CREATE TABLE IF NOT EXISTS crypto_trade_data (
+    id_trade SERIAL PRIMARY KEY,
+    crypto_id INTEGER NOT NULL REFERENCES cryptos(id) ON DELETE CASCADE,
+    timestamp TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    position_size FLOAT,
+    entry_price FLOAT,
+    direction INTEGER,
+    risk_reward_ratio FLOAT,
+    take_profit_1 FLOAT,
+    stop_loss_1 FLOAT,
+    status_1 INTEGER DEFAULT 0,
+    take_profit_2 FLOAT,
+    status_2 INTEGER DEFAULT 0,
+    stop_loss_2 FLOAT,
+    runner FLOAT,
+    status INTEGER DEFAULT 0
+);
+"""
+
+_PORTFOLIO_DDL = """
+CREATE TABLE IF NOT EXISTS portfolio_performance (
+    id SERIAL PRIMARY KEY,
+    total_balance FLOAT,
+    free_cash FLOAT,
+    unrealized_pnl FLOAT,
+    timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+"""
+
+_SENTIMENT_SCHEMA_DDL = (_SENTIMENT_SCORES_DDL, _TWEET_HASH_DDL, _TWEET_SENTIMENTS_DDL, _TWEET_CRYPTO_DDL, _ACCOUNT_DDL)
+_TRADING_SCHEMA_DDL = (_CRYPTO_SCORES_DDL, _TRADE_DATA_DDL, _PORTFOLIO_DDL)
+
+# Supplies stay exact, every other details column is a computed indicator stored as FLOAT8
+_DETAILS_DECIMAL_COLS = ('circulating_supply', 'total_supply', 'max_supply')
+_DETAILS_IS_DECIMAL = tuple(col in _DETAILS_DECIMAL_COLS for col in DETAILS_COLS)
+# Monetary base columns stay exact, percentages and ratios are stored as FLOAT8
+_BASE_DECIMAL_COLS = (
+    'price', 'high_24h', 'low_24h', 'variation24h', 'mc_variation24h', 'market_cap',
+    'total_volume', 'fully_diluted_valuation', 'all_time_high'
+)
+# Columns kept as NUMERIC per table, every other numeric column is migrated to FLOAT8
+_FLOAT8_MIGRATIONS = {"cyptos_data_details": _DETAILS_DECIMAL_COLS, "cyptos_data_base": _BASE_DECIMAL_COLS}
+
+# PostgreSQL binary COPY framing, see the COPY "Binary Format" documentation
+_COPY_BINARY_HEADER = b"PGCOPY\n\xff\r\n\x00" + struct.pack(">ii", 0, 0)
+_COPY_BINARY_TRAILER = struct.pack(">h", -1)
+_COPY_NULL = struct.pack(">i", -1)
+_COPY_FIELD_COUNT = struct.Struct(">h")
+_COPY_LENGTH = struct.Struct(">i")
+_COPY_ROW_START = struct.Struct(">hii")
+_COPY_FLOAT8 = struct.Struct(">id")
+_COPY_NUMERIC_HEADER = struct.Struct(">ihhHH")
+
+def _copy_numeric(value) -> bytes:
+    """Encode a number as a length-prefixed NUMERIC field of the binary COPY format.
+    
+    NUMERIC is sent as base-10000 digits with a weight, sign and display scale;
+    the server rounds it to the column's declared scale as it does for text input.
+    """
+    d = Decimal(repr(value)) if isinstance(value, float) else Decimal(value)
+    if d.is_nan():
+        return _COPY_NUMERIC_HEADER.pack(8, 0, 0, 0xC000, 0)
+    if not d.is_finite():
+        raise ValueError(f"Cannot store {value} in a NUMERIC column")
+    sign, digits, exp = d.as_tuple()
+    dscale = max(0, -exp)
+    digits = list(digits) + [0] * max(0, exp)
+    int_len = len(digits) - dscale
+    # Align the decimal point on base-10000 digit boundaries
+    digits = [0] * (-int_len % 4) + digits + [0] * (-dscale % 4)
+    groups = [
+        digits[i] * 1000 + digits[i + 1] * 100 + digits[i + 2] * 10 + digits[i + 3]
+        for i in range(0, len(digits), 4)
+    ]
+    weight = (int_len + (-int_len % 4)) // 4 - 1
+    while groups and groups[0] == 0:
+        groups.pop(0)
+        weight -= 1
+    while groups and groups[-1] == 0:
+        groups.pop()
+    if not groups:
+        weight, sign = 0, 0
+    return (
+        _COPY_NUMERIC_HEADER.pack(8 + 2 * len(groups), len(groups), weight, 0x4000 if sign else 0, dscale)
+        + struct.pack(f">{len(groups)}H", *groups)
+    )
+
+# The base table carries an ISO TIMESTAMP string, so it is loaded with a text COPY
+_COPY_TEXT_TABLES = {"cyptos_data_base": f"COPY cyptos_data_base ({', '.join(_BASE_COLUMNS)}) FROM STDIN"}
+# Tables whose columns after crypto_id are all NUMERIC, loaded with a binary COPY
+_COPY_NUMERIC_TABLES = {
+    "cyptos_data_binance": f"COPY cyptos_data_binance ({', '.join(_BINANCE_COLUMNS)}) FROM STDIN WITH (FORMAT binary)"
+}
+_COPY_TEXT_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+def _copy_text_value(value) -> str:
+    """Render a value as a field of the COPY text format (NULL as \\N)."""
+    if value is None:
+        return "\\N"
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float):
+        return repr(value)
+    return str(value).translate(_COPY_TEXT_ESCAPES)
+
+def _safe_float(value, default=0.0):
+    """Convert a value to float, returning default for None or unconvertible values.
+    
+    Python floats are returned as-is before any call or exception handling is set up.
+    """
+    if type(value) is float:
+        return value
+    if value is None:
+        return default
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return default
+
+def _copy_text_buffer(rows) -> io.StringIO:
+    """Render rows as a COPY text-format stream, rewound for reading."""
+    buf = io.StringIO()
+    buf.writelines("\t".join(map(_copy_text_value, row)) + "\n" for row in rows)
+    buf.seek(0)
+    return buf
+
+# Above one execute_values page, listings are upserted through a COPY staging table
+_CRYPTOS_COPY_THRESHOLD = 1000
+# execute_values batches (sentiment, scores) are sent as one multi-row statement per page of this many rows;
+# larger batches are streamed with a text COPY instead
+_BATCH_PAGE_SIZE = 500
+_SCORE_COLUMNS = ("crypto_id", "score_metric", "score_total", "Trend", "priceUnit")
+_TWEET_CRYPTO_COLUMNS = ("tweet_id", "crypto_id", "sentiment_score")
+_TIME_SERIES_TABLES = ("cyptos_data_base", "cyptos_data_details", "cyptos_data_binance")
+# crypto_trade_data columns read by the trade manager (timestamp and risk_reward_ratio are never read back)
+_OPEN_TRADE_COLUMNS = (
+    "id_trade", "crypto_id", "position_size", "entry_price", "direction",
+    "take_profit_1", "stop_loss_1", "status_1", "take_profit_2", "stop_loss_2", "status_2",
+    "runner", "status",
+)
+# crypto_trade_data status column of each take-profit level (3 is the runner, which closes the trade)
+_TRADE_STATUS_COLUMNS = {1: "status_1", 2: "status_2", 3: "status"}
+_TRADE_STATUS_UPDATES = {
+    tp: f"UPDATE crypto_trade_data SET {column}=%s WHERE id_trade=%s"
+    for tp, column in _TRADE_STATUS_COLUMNS.items()
+}
+_TRADE_STATUS_BULK_UPDATES = {
+    tp: f"""
+        UPDATE crypto_trade_data AS t SET {column} = v.status
+        FROM (VALUES %s) AS v(id_trade, status)
+        WHERE t.id_trade = v.id_trade
+    """
+    for tp, column in _TRADE_STATUS_COLUMNS.items()
+}
+# Latest base row of each crypto (base_latest CTE) joined with the details and Binance rows
+# closest in time, found with two (crypto_id, timestamp) primary key probes, and the latest sentiment
+_CRYPTO_INFORMATIONS_SELECT = """
+SELECT 
+    b.*,
+    d.rsi_values as rsi,
+    d.macd_j as macd_j,
+    d.signal_line_j as signal_j,
+    d.macd_h as macd_h,
+    d.signal_line_h as signal_h,
+    d.histogram_h as histogram,
+    d.histogram_j as hist_norm,
+    d.ema_50,
+    d.ema_200,
+    d.sma_50,
+    d.sma_200,
+    d.r1,
+    d.s1,
+    d.pp as pivot,
+    d.fib_levels_3 as fibo_382,
+    d.fib_levels_5 as fibo_618,
+    d.d1_percentage,
+    d.d7_percentage,
+    d.d14_percentage,
+    d.volume_actuel,
+    d.volume_moyen_7j,
+    bn.funding_rate,
+    bn.open_interest,
+    s.score_12h as sentiment_score_12h,
+    s.count_12h as sentiment_count_12h,
+    s.score_24h as sentiment_score_24h,
+    s.count_24h as sentiment_count_24h
+FROM base_latest b
+LEFT JOIN LATERAL (
+    SELECT * FROM (
+        (SELECT * FROM cyptos_data_details
+         WHERE crypto_id = b.crypto_id AND timestamp <= b.timestamp
+         ORDER BY timestamp DESC
+         LIMIT 1)
+        UNION ALL
+        (SELECT * FROM cyptos_data_details
+         WHERE crypto_id = b.crypto_id AND timestamp > b.timestamp
+         ORDER BY timestamp ASC
+         LIMIT 1)
+    ) nearest
+    ORDER BY ABS(EXTRACT(EPOCH FROM (nearest.timestamp - b.timestamp)))
+    LIMIT 1
+) d ON TRUE
+LEFT JOIN LATERAL (
+    SELECT * FROM (
+        (SELECT * FROM cyptos_data_binance
+         WHERE crypto_id = b.crypto_id AND timestamp <= b.timestamp
+         ORDER BY timestamp DESC
+         LIMIT 1)
+        UNION ALL
+        (SELECT * FROM cyptos_data_binance
+         WHERE crypto_id = b.crypto_id AND timestamp > b.timestamp
+         ORDER BY timestamp ASC
+         LIMIT 1)
+    ) nearest
+    ORDER BY ABS(EXTRACT(EPOCH FROM (nearest.timestamp - b.timestamp)))
+    LIMIT 1
+) bn ON TRUE
+LEFT JOIN LATERAL (
+    SELECT * FROM crypto_sentiment_scores 
+    WHERE crypto_id = b.crypto_id
+    ORDER BY timestamp DESC
+    LIMIT 1
+) s ON TRUE
+"""
+
+# Cached price windows re-read this far back so rows committed late by the market writer are picked up
+_PRICE_WINDOW_OVERLAP = timedelta(minutes=15)
+
 class CryptoDatabase:
     """PostgreSQL database interface for cryptocurrency trading system.
     
@@ -15,84 +556,320 @@ class CryptoDatabase:
         """Initialize database connection and logger."""
         self.logger = Logger.get_logger("CryptoDatabase")
         self.conn, self.cur = self.connect()
+        self.in_cycle = False
+        self._schema_ensured = False
+        self.crypto_id_map = {}
+        self._crypto_listing = {}
+        self._price_windows = {}
+        self._price_window_start = {}
 
     def connect(self):
-        """Establish PostgreSQL database connection.
+        """Check out a PostgreSQL connection from the shared pool.
+        
+        Connections are kept open across cycles; each checkout is validated with
+        SELECT 1 and dead connections are discarded.
         
         Returns:
             tuple: (connection, cursor) objects for database operations
         """
-        conn = psycopg2.connect(
-            host=conf.DB_CONFIG['host'],
-            port=conf.DB_CONFIG['port'],
-            database=conf.DB_CONFIG['database'],
-            user=conf.DB_CONFIG['user'],
-            password=conf.DB_CONFIG['password']
-        )
-        cur = conn.cursor()
-        return conn, cur
+        pool = _get_pool()
+        for _ in range(conf.DB_POOL_MAX_CONN):
+            conn = pool.getconn()
+            try:
+                with conn.cursor() as cur:
+                    cur.execute("SELECT 1")
+                conn.rollback()
+                return conn, conn.cursor()
+            except (psycopg2.OperationalError, psycopg2.InterfaceError) as e:
+                self.logger.warning("Discarding dead pooled connection: %s", e)
+                pool.putconn(conn, close=True)
+        raise psycopg2.OperationalError("No usable connection available in the pool")
+
+    @contextmanager
+    def _pooled_cursor(self):
+        """Borrow a validated connection from the pool for the duration of a with-block.
+        
+        Used for work that must not share this instance's connection, such as writes
+        running on worker threads. The connection is returned to the pool on exit;
+        committing or rolling back is left to the caller.
+        
+        Yields:
+            tuple: (connection, cursor) of the borrowed connection
+        """
+        conn, cur = self.connect()
+        try:
+            yield conn, cur
+        finally:
+            cur.close()
+            _get_pool().putconn(conn)
 
     def close(self):
-        """Close database connection and logger handlers."""
+        """Return the database connection to the pool and close logger handlers."""
         if self.cur:
             self.cur.close()
+            self.cur = None
         if self.conn:
-            self.conn.close()
+            _get_pool().putconn(self.conn)
+            self.conn = None
         
         self.logger.info("Database connection and logger closed.")
         self.logger.close()
         
         
-    def _rows_to_dicts(self, rows) -> List[Dict[str, Any]]:
-        """Convert cursor rows to list of dicts using cursor.description for keys."""
-        if rows is None:
-            return []
-        colnames = [desc[0] for desc in self.cur.description]
-        return [dict(zip(colnames, row)) for row in rows]
+    def _dict_cursor(self, name=None):
+        """Open a cursor whose rows are built as dictionaries keyed by column name.
+        
+        Args:
+            name (str): Name of a server-side cursor, client-side cursor if None
+            
+        Returns:
+            RealDictCursor: Cursor to use as a context manager
+        """
+        return self.conn.cursor(name=name, cursor_factory=RealDictCursor)
+
+    def _stream_rows_to_dicts(self, name, query, params=None, itersize=500) -> List[Dict[str, Any]]:
+        """Run a query on a server-side named cursor and collect its rows as dicts.
+        
+        Rows are fetched itersize at a time, so the full result is never held
+        twice in memory.
+        
+        Args:
+            name (str): Name of the server-side cursor
+            query (str): SELECT statement to run
+            params (tuple): Query parameters
+            itersize (int): Number of rows fetched per network round-trip
+            
+        Returns:
+            List[Dict]: One dictionary per row, keyed by column name
+        """
+        with self._dict_cursor(name) as cur:
+            cur.itersize = itersize
+            cur.execute(query, params)
+            return list(cur)
     
-    def _safe_float(self, value, default=0.0):
+    def iter_rows(self, name, query, params=None, itersize=10000):
+        """Yield the rows of a query from a server-side named cursor, itersize at a time.
+        
+        Memory stays bounded by one chunk whatever the size of the result. The rows
+        must be consumed before another query is run on this connection.
+        
+        Args:
+            name (str): Name of the server-side cursor
+            query (str): SELECT statement to run
+            params (tuple): Query parameters
+            itersize (int): Number of rows fetched per network round-trip
+            
+        Yields:
+            tuple: One result row
+        """
+        with self.conn.cursor(name=name) as cur:
+            cur.itersize = itersize
+            cur.execute(query, params)
+            yield from cur
+
+    def begin(self):
+        """Open a cycle transaction in which write methods no longer commit individually.
+        
+        The cycle is restartable, so synchronous_commit is turned off for this
+        transaction to avoid waiting on the WAL flush at commit. JIT is disabled too:
+        compiling the wide details statements costs more than the few rows they touch.
         """
-        Safely convert a value to float. Returns default if conversion fails.
+        self.in_cycle = True
+        self.cur.execute("SET LOCAL synchronous_commit = off; SET LOCAL jit = off")
+
+    def commit_cycle(self):
+        """Commit all writes made since begin() in a single transaction."""
+        self.conn.commit()
+        self.in_cycle = False
+
+    def rollback_cycle(self):
+        """Discard all writes made since begin()."""
+        self.conn.rollback()
+        self.in_cycle = False
+
+    @contextmanager
+    def transaction(self):
+        """Run the writes of a with-block in one cycle transaction.
+        
+        Commits once on exit and rolls back if the block raises. A query that fails
+        inside the block rolls the transaction back and re-raises its error (see
+        _rollback) instead of being swallowed, so the block never continues with a
+        partial transaction.
+        
+        Yields:
+            CryptoDatabase: This instance
         """
+        self.begin()
         try:
-            return float(value) if value is not None else default
-        except (ValueError, TypeError):
-            return default
+            yield self
+        except Exception:
+            if self.in_cycle:
+                self.rollback_cycle()
+            raise
+        if self.in_cycle:
+            self.commit_cycle()
+
+    def _commit(self):
+        """Commit the current write unless it belongs to an open cycle transaction."""
+        if not self.in_cycle:
+            self.conn.commit()
+
+    def _rollback(self):
+        """Roll back after a failed query; must be called from an except block.
+        
+        Inside a cycle the whole cycle is discarded and the exception being handled
+        is re-raised, so a transaction() block aborts as a unit instead of running its
+        remaining writes in autocommit.
+        """
+        self.conn.rollback()
+        if self.in_cycle:
+            self.in_cycle = False
+            self.logger.error("Cycle transaction rolled back: %s", sys.exc_info()[1])
+            raise
+        
+    def _execute_prepared(self, name, params):
+        """Execute a prepared single-row INSERT or lookup, preparing it once per connection.
+        
+        The PREPARE is sent the first time a pooled connection runs the statement and
+        the EXECUTE text is built once at import, so later calls only bind parameters
+        and the server skips parsing and planning. Results are read from self.cur.
+        
+        Args:
+            name (str): Statement name, a key of _PREPARED_STATEMENTS
+            params (tuple): Values bound to the statement parameters
+        """
+        if name not in self.conn.prepared:
+            self.cur.execute(_PREPARED_STATEMENTS[name])
+            self.conn.prepared.add(name)
+        self.cur.execute(_PREPARED_EXECUTES[name], params)
+
+    def base_row(self, crypto_id, data) -> tuple:
+        """Build a cyptos_data_base row tuple from a crypto data dictionary."""
+        return (
+            crypto_id, data.get('current_price'), data.get('high_24h'), data.get('low_24h'), 
+            data.get('dominance'), data.get('price_change_24h_pct'), data.get('price_change_24h'),
+            data.get('market_change_24h_pct'), data.get('market_change_24h'), data.get('market_cap'), 
+            data.get('total_volume'), data.get('fully_diluted_valuation'), data.get('ath'), 
+            data.get('ath_date'), data.get('ath_change_percentage')
+        )
+
+    def details_row(self, crypto_id, data) -> tuple:
+        """Build a cyptos_data_details row tuple from a crypto data dictionary.
+        
+        Every details field is numeric or None, so values (numpy scalars included) are
+        cast with a plain float() instead of a per-value type dispatch.
+        """
+        return (crypto_id, *[None if value is None else float(value) for value in map(data.get, DETAILS_COLS)])
+
+    def binance_row(self, crypto_id, data) -> tuple:
+        """Build a cyptos_data_binance row tuple from a crypto data dictionary."""
+        return (crypto_id, data.get('bids_price_1'), data.get('bids_quantity_1'), data.get('bids_price_2'), data.get('bids_quantity_2'),
+            data.get('bids_price_3'), data.get('bids_quantity_3'), data.get('asks_price_1'), data.get('asks_quantity_1'),
+            data.get('asks_price_2'), data.get('asks_quantity_2'), data.get('asks_price_3'), data.get('asks_quantity_3'),
+            data.get('funding_rate'), data.get('open_interest'))
         
 #------------------------------------------------------------------------------------
 # ------------------------------ Create All Tables ----------------------------------
 #------------------------------------------------------------------------------------
 
+    def ensure_schema(self):
+        """Create all market data tables in a single round-trip.
+        
+        Runs the DDL of the five create_table_* methods as one multi-statement execute.
+        The statements are idempotent, so later calls on the same instance are skipped.
+        """
+        if self._schema_ensured:
+            return
+        self.cur.execute("".join(_MARKET_SCHEMA_DDL))
+        self._commit()
+        self._migrate_to_float8()
+        self._check_backend()
+        if conf.USE_TIMESCALEDB:
+            self.enable_timescale()
+        self._schema_ensured = True
+
+    def _migrate_to_float8(self):
+        """Convert indicator and percentage columns of tables created as DECIMAL to DOUBLE PRECISION.
+        
+        The remaining NUMERIC columns of each table are altered in one ALTER TABLE so it
+        is rewritten once; databases already on the new schema only pay for the lookup.
+        """
+        try:
+            self.cur.execute("""
+                SELECT table_name, column_name FROM information_schema.columns
+                WHERE table_name = ANY(%s) AND data_type = 'numeric'
+            """, (list(_FLOAT8_MIGRATIONS),))
+            columns = {}
+            for table, col in self.cur.fetchall():
+                if col not in _FLOAT8_MIGRATIONS[table]:
+                    columns.setdefault(table, []).append(col)
+            for table, cols in columns.items():
+                self.cur.execute(f"ALTER TABLE {table} " + ", ".join(
+                    f"ALTER COLUMN {col} TYPE DOUBLE PRECISION" for col in cols
+                ))
+                self.logger.info("Converted %d %s columns to DOUBLE PRECISION", len(cols), table)
+            self._commit()
+        except Exception as e:
+            self._rollback()
+            self.logger.error("Error converting columns to DOUBLE PRECISION: %s", e)
+
+    def _check_backend(self):
+        """Warn when a PostgreSQL 18+ server does not use the io_uring I/O method."""
+        try:
+            self.cur.execute("SHOW server_version_num")
+            version = int(self.cur.fetchone()[0])
+            if version >= 180000:
+                self.cur.execute("SHOW io_method")
+                io_method = self.cur.fetchone()[0]
+                if io_method != 'io_uring':
+                    self.logger.warning("PostgreSQL %d uses io_method=%s, set io_method='io_uring' for faster I/O", version // 10000, io_method)
+            self._commit()
+        except Exception as e:
+            self._rollback()
+            self.logger.warning("Unable to check PostgreSQL backend configuration: %s", e)
+
+    def enable_timescale(self):
+        """Convert the market time-series tables to TimescaleDB hypertables.
+        
+        Each table is chunked by day on its timestamp column (existing rows are
+        migrated) and gets a retention policy of MARKET_DATA_RETENTION_DAYS. Failures,
+        e.g. when the extension is not installed on the server, are logged and the
+        tables are left as plain PostgreSQL tables.
+        """
+        statements = ["CREATE EXTENSION IF NOT EXISTS timescaledb"]
+        for table in _TIME_SERIES_TABLES:
+            statements.append(
+                f"SELECT create_hypertable('{table}', 'timestamp', if_not_exists => TRUE, "
+                f"migrate_data => TRUE, chunk_time_interval => INTERVAL '1 day')"
+            )
+            statements.append(
+                f"SELECT add_retention_policy('{table}', INTERVAL '{int(conf.MARKET_DATA_RETENTION_DAYS)} days', "
+                f"if_not_exists => TRUE)"
+            )
+        try:
+            self.cur.execute(";".join(statements))
+            self._commit()
+            self.logger.info("TimescaleDB hypertables enabled for market data tables")
+        except Exception as e:
+            self._rollback()
+            self.logger.warning("Unable to enable TimescaleDB, keeping plain tables: %s", e)
+
     def create_table_listing(self):
         """Create cryptos table for storing cryptocurrency listings.
         
         Stores cryptocurrency identifiers including name, symbol, CoinGecko ID,
         and Binance trading symbol.
         """
-        self.cur.execute("""
-            CREATE TABLE IF NOT EXISTS cryptos (
-                id SERIAL PRIMARY KEY, 
-                name TEXT NOT NULL,
-                symbol TEXT NOT NULL,
-                id_coingecko TEXT UNIQUE NOT NULL,
-                symbol_binance TEXT DEFAULT 'UNKNOWN'
-            );
-        """)
-        self.conn.commit()
+        self.cur.execute(_CRYPTOS_DDL)
+        self._commit()
 
     def create_table_crypto_ranks(self):
         """Create crypto_ranks table for storing market cap rankings.
         
         Maintains the current market cap rank for each tracked cryptocurrency.
         """
-        self.cur.execute("""
-        CREATE TABLE IF NOT EXISTS crypto_ranks (
-            id SERIAL PRIMARY KEY,
-            crypto_id INTEGER NOT NULL UNIQUE REFERENCES cryptos(id) ON DELETE CASCADE,
-            rank INTEGER NOT NULL
-        );
-        """)
-        self.conn.commit()
+        self.cur.execute(_CRYPTO_RANKS_DDL)
+        self._commit()
 
 
     def create_table_base(self):
@@ -101,29 +878,8 @@ class CryptoDatabase:
         Stores fundamental market data including price, 24h high/low, market cap,
         volume, all-time high data, and dominance metrics.
         """
-        self.cur.execute("""
-        CREATE TABLE IF NOT EXISTS cyptos_data_base (
-            crypto_id INTEGER NOT NULL REFERENCES cryptos(id) ON DELETE CASCADE,
-            price DECIMAL(24,8),
-            high_24h DECIMAL(24,8),
-            low_24h DECIMAL(24,8),
-            dominance DECIMAL(24,4),
-            variation24h_pst DECIMAL(10,4),
-            variation24h DECIMAL(24,8),
-            mc_variation24h_pst DECIMAL(10,4),
-            mc_variation24h DECIMAL(24,8),
-            market_cap DECIMAL(24,2),
-            total_volume DECIMAL(24,2),
-            fully_diluted_valuation DECIMAL(24,2),
-            all_time_high DECIMAL(24,8),
-            all_time_high_timestamp TIMESTAMP,
-            all_time_high_pst DECIMAL(24,4),
-            timestamp TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
-            
-            PRIMARY KEY (crypto_id, timestamp)
-        );
-        """)
-        self.conn.commit()
+        self.cur.execute(_DATA_BASE_DDL)
+        self._commit()
 
     def create_table_detail(self):
         """Create cyptos_data_details table for technical analysis data.
@@ -131,71 +887,8 @@ class CryptoDatabase:
         Stores comprehensive technical indicators including volume metrics, price variations,
         supply data, pivot points, RSI, MACD, moving averages, POC, and Fibonacci levels.
         """
-        self.cur.execute("""
-        CREATE TABLE IF NOT EXISTS cyptos_data_details (
-            crypto_id INTEGER NOT NULL REFERENCES cryptos(id) ON DELETE CASCADE,
-            volume_actuel DECIMAL(24,8),
-            volume_1j DECIMAL(24,8),
-            volume_7j DECIMAL(24,8),
-            volume_30j DECIMAL(24,8),
-            variation_1j DECIMAL(24,8),
-            variation_7j DECIMAL(24,8),
-            variation_30j DECIMAL(24,8),
-            volume_moyen_30j DECIMAL(24,8),
-            variation_moyenne_30j DECIMAL(24,8),
-            volume_moyen_7j DECIMAL(24,8),
-            variation_moyenne_7j DECIMAL(24,8),
-            volume_moyen_1j DECIMAL(24,8),
-            variation_moyenne_1j DECIMAL(24,8),
-            current_price DECIMAL(24,8),
-            d1_percentage DECIMAL(24,8),
-            d1_value DECIMAL(24,8),
-            d1_vs_avg DECIMAL(24,8),
-            d1_mean DECIMAL(24,8),
-            d7_percentage DECIMAL(24,8),
-            d7_value DECIMAL(24,8),
-            d7_vs_avg DECIMAL(24,8),
-            d7_mean DECIMAL(24,8),
-            d14_percentage DECIMAL(24,8),
-            d14_value DECIMAL(24,8),
-            d14_vs_avg DECIMAL(24,8),
-            d14_mean DECIMAL(24,8),
-            d30_percentage DECIMAL(24,8),
-            d30_value DECIMAL(24,8),
-            d30_vs_avg DECIMAL(24,8),
-            d30_mean DECIMAL(24,8),
-            circulating_supply DECIMAL(24,8),
-            total_supply DECIMAL(24,8),
-            max_supply DECIMAL(24,8),
-            pp DECIMAL(24,8),
-            r1 DECIMAL(24,8),
-            r2 DECIMAL(24,8),
-            s1 DECIMAL(24,8),
-            s2 DECIMAL(24,8),
-            rsi_values DECIMAL(24,8),
-            macd_h DECIMAL(24,8),
-            signal_line_h DECIMAL(24,8),
-            histogram_h DECIMAL(24,8),
-            macd_j DECIMAL(24,8),
-            signal_line_j DECIMAL(24,8),
-            histogram_j DECIMAL(24,8),
-            sma_50 DECIMAL(24,8),
-            sma_200 DECIMAL(24,8),
-            ema_50 DECIMAL(24,8),
-            ema_200 DECIMAL(24,8),
-            poc DECIMAL(24,8),
-            fib_levels_1 DECIMAL(24,8),
-            fib_levels_2 DECIMAL(24,8),
-            fib_levels_3 DECIMAL(24,8),
-            fib_levels_4 DECIMAL(24,8),
-            fib_levels_5 DECIMAL(24,8),
-            fib_levels_6 DECIMAL(24,8),
-            fib_levels_7 DECIMAL(24,8),
-            timestamp TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
-            PRIMARY KEY (crypto_id, timestamp)
-        );
-        """)
-        self.conn.commit()
+        self.cur.execute(_DATA_DETAILS_DDL)
+        self._commit()
 
     def create_table_data_binance(self):
         """Create cyptos_data_binance table for Binance-specific trading data.
@@ -203,87 +896,27 @@ class CryptoDatabase:
         Stores order book depth (top 3 bid/ask levels), funding rates, and open interest
         for futures contracts.
         """
-        self.cur.execute("""
-        CREATE TABLE IF NOT EXISTS cyptos_data_binance (
-            crypto_id INTEGER NOT NULL REFERENCES cryptos(id) ON DELETE CASCADE,
-            bids_price_1 DECIMAL(24,8),
-            bids_quantity_1 DECIMAL(24,8),
-            bids_price_2 DECIMAL(24,8),
-            bids_quantity_2 DECIMAL(24,8),
-            bids_price_3 DECIMAL(24,8),
-            bids_quantity_3 DECIMAL(24,8),
-            asks_price_1 DECIMAL(24,8),
-            asks_quantity_1 DECIMAL(24,8),
-            asks_price_2 DECIMAL(24,8),
-            asks_quantity_2 DECIMAL(24,8),
-            asks_price_3 DECIMAL(24,8),
-            asks_quantity_3 DECIMAL(24,8),
-            funding_rate DECIMAL(24,4),
-            open_interest DECIMAL(24,2),
-            timestamp TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
-
-            PRIMARY KEY (crypto_id, timestamp)
-        );
-
-        """)
-        self.conn.commit()
+        self.cur.execute(_DATA_BINANCE_DDL)
+        self._commit()
         
     def create_sentiment_tables(self):
         """Create all sentiment analysis related tables.
         
         Creates tables for storing sentiment scores, tweet hashes, tweet content,
-        crypto-tweet associations, and Twitter account tracking.
+        crypto-tweet associations, and Twitter account tracking, in one round-trip.
         """
-        self.cur.execute("""
-                CREATE TABLE IF NOT EXISTS crypto_sentiment_scores (
-                    crypto_id INTEGER NOT NULL,
-                    score_12h FLOAT,
-                    count_12h INTEGER,
-                    score_24h FLOAT,
-                    count_24h INTEGER,
-                    timestamp TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP, 
-                    PRIMARY KEY (crypto_id, timestamp),
-                    FOREIGN KEY (crypto_id) REFERENCES cryptos(id) ON DELETE CASCADE
-                );
-            """)
-            
-        self.cur.execute("""
-                CREATE TABLE IF NOT EXISTS tweet_hash (
-                    tweet_id SERIAL PRIMARY KEY,
-                    hash TEXT NOT NULL UNIQUE
-                );
-            """)
-
-        self.cur.execute("""
-                CREATE TABLE IF NOT EXISTS tweet_sentiments (
-                    tweet_id INTEGER PRIMARY KEY,
-                    account TEXT,
-                    tweet_content TEXT,
-                    timestamp BIGINT,
-                    FOREIGN KEY (tweet_id) REFERENCES tweet_hash(tweet_id) ON DELETE CASCADE
-                );
-            """)
-
-        self.cur.execute("""
-                CREATE TABLE IF NOT EXISTS tweet_crypto (
-                    tweet_id INTEGER,
-                    crypto_id INTEGER,
-                    sentiment_score FLOAT,
-                    PRIMARY KEY (tweet_id, crypto_id),
-                    FOREIGN KEY (tweet_id) REFERENCES tweet_hash(tweet_id) ON DELETE CASCADE,
-                    FOREIGN KEY (crypto_id) REFERENCES cryptos(id) ON DELETE CASCADE
-                );
-            """)
-
-        self.cur.execute("""
-                CREATE TABLE IF NOT EXISTS account (
-                    account_id SERIAL PRIMARY KEY,
-                    account_name TEXT UNIQUE NOT NULL
-                );
-            """)
-        self.conn.commit()
-    
+        self.cur.execute("".join(_SENTIMENT_SCHEMA_DDL))
+        self._commit()
     
+    def ensure_trading_schema(self):
+        """Create the scores, trades and portfolio tables in a single round-trip."""
+        try:
+            self.cur.execute("".join(_TRADING_SCHEMA_DDL))
+            self._commit()
+        except Exception as e:
+            self.logger.error("Error creating trading tables: %s", e)
+            self._rollback()
+
     def create_score_table(self):
         """Create crypto_scores table for trading signal scores.
         
@@ -291,21 +924,11 @@ class CryptoDatabase:
         trend indicators, and price unit data.
         """
         try:
-            self.cur.execute("""
-                CREATE TABLE IF NOT EXISTS crypto_scores (
-                    crypto_id INTEGER NOT NULL REFERENCES cryptos(id) ON DELETE CASCADE,
-                    timestamp TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
-                    score_metric FLOAT,
-                    score_total FLOAT,
-                    Trend FLOAT,
-                    priceUnit FLOAT,
-                    PRIMARY KEY (crypto_id, timestamp)
-                )
-            """)
-            self.conn.commit()
+            self.cur.execute(_CRYPTO_SCORES_DDL)
+            self._commit()
         except Exception as e:
             self.logger.error(f"Error creating scores table: {e}")
-            self.conn.rollback()
+            self._rollback()
 
     def create_trade_table(self):
         """Create crypto_trade_data table for tracking active and historical trades.
@@ -314,29 +937,11 @@ class CryptoDatabase:
         stop-loss/take-profit levels, and status tracking for multi-level exits.
         """
         try:
-            self.cur.execute("""
-                CREATE TABLE IF NOT EXISTS crypto_trade_data (
-                    id_trade SERIAL PRIMARY KEY,
-                    crypto_id INTEGER NOT NULL REFERENCES cryptos(id) ON DELETE CASCADE,
-                    timestamp TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
-                    position_size FLOAT,
-                    entry_price FLOAT,
-                    direction INTEGER,
-                    risk_reward_ratio FLOAT,
-                    take_profit_1 FLOAT,
-                    stop_loss_1 FLOAT,
-                    status_1 INTEGER DEFAULT 0,
-                    take_profit_2 FLOAT,
-                    status_2 INTEGER DEFAULT 0,
-                    stop_loss_2 FLOAT,
-                    runner FLOAT,
-                    status INTEGER DEFAULT 0
-                )
-            """)
-            self.conn.commit()
+            self.cur.execute(_TRADE_DATA_DDL)
+            self._commit()
         except Exception as e:
             self.logger.error(f"Error creating trade data table: {e}")
-            self.conn.rollback()
+            self._rollback()
     
     def create_portfolio_table(self):
         """Create portfolio_performance table for tracking portfolio metrics.
@@ -344,19 +949,11 @@ class CryptoDatabase:
         Stores snapshots of total balance, free cash, and unrealized P&L over time.
         """
         try:
-            self.cur.execute("""
-                CREATE TABLE IF NOT EXISTS portfolio_performance (
-                    id SERIAL PRIMARY KEY,
-                    total_balance FLOAT,
-                    free_cash FLOAT,
-                    unrealized_pnl FLOAT,
-                    timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                );
-            """)
-            self.conn.commit()
+            self.cur.execute(_PORTFOLIO_DDL)
+            self._commit()
         except Exception as e:
             self.logger.error(f"Error creating portfolio table: {e}")
-            self.conn.rollback()
+            self._rollback()
         
 #------------------------------------------------------------------------------------
 # ----------------------------------- All Insert ------------------------------------
@@ -374,10 +971,10 @@ class CryptoDatabase:
                 INSERT INTO portfolio_performance (total_balance, free_cash, unrealized_pnl)
                 VALUES (%s, %s, %s)
             """, (total_balance, free_cash, unrealized_pnl))
-            self.conn.commit()
+            self._commit()
         except Exception as e:
             self.logger.error(f"Error inserting portfolio performance: {e}")
-            self.conn.rollback()
+            self._rollback()
 
     def insert_crypto(self, name, symbol, id_coingecko, symbol_binance):
         """Insert or update cryptocurrency listing.
@@ -401,9 +998,120 @@ class CryptoDatabase:
             RETURNING id;
             """, (name, symbol, id_coingecko, symbol_binance))
         crypto_id = self.cur.fetchone()[0]
-        self.conn.commit()
+        self._commit()
         return crypto_id
 
+    def load_crypto_id_map(self) -> Dict[str, int]:
+        """Load the database IDs of all listed cryptocurrencies with a single SELECT.
+        
+        The mapping and the stored listing attributes are kept on the instance so
+        upsert_cryptos only writes cryptos that are new or changed.
+        
+        Returns:
+            Dict[str, int]: Mapping of CoinGecko ID to database ID
+        """
+        try:
+            self.cur.execute("SELECT id, name, symbol, id_coingecko, symbol_binance FROM cryptos")
+            rows = self.cur.fetchall()
+            self._commit()
+        except Exception as e:
+            self._rollback()
+            self.logger.error("Error loading crypto id map: %s", e)
+            return self.crypto_id_map
+        self.crypto_id_map = {row[3]: row[0] for row in rows}
+        self._crypto_listing = {row[3]: row[1:] for row in rows}
+        return self.crypto_id_map
+
+    def upsert_cryptos(self, cryptos: List[tuple]) -> Dict[str, int]:
+        """Insert or update the new or changed cryptocurrency listings in one statement.
+        
+        Listings identical to the ones loaded by load_crypto_id_map are skipped, so a
+        cycle without listing changes issues no write at all.
+        
+        Args:
+            cryptos (List[tuple]): (name, symbol, id_coingecko, symbol_binance) tuples
+            
+        Returns:
+            Dict[str, int]: Mapping of CoinGecko ID to database ID for all known cryptos
+        """
+        # Deduplicated by id_coingecko since ON CONFLICT cannot update the same row twice
+        changed = list({c[2]: c for c in cryptos if self._crypto_listing.get(c[2]) != tuple(c)}.values())
+        if not changed:
+            return self.crypto_id_map
+        try:
+            if len(changed) > _CRYPTOS_COPY_THRESHOLD:
+                rows = self.upsert_cryptos_bulk(changed)
+            else:
+                rows = execute_values(self.cur, """
+                    INSERT INTO cryptos (name, symbol, id_coingecko, symbol_binance)
+                    VALUES %s
+                    ON CONFLICT (id_coingecko) DO UPDATE
+                    SET name = EXCLUDED.name,
+                        symbol = EXCLUDED.symbol,
+                        symbol_binance = EXCLUDED.symbol_binance
+                    RETURNING id, id_coingecko
+                """, changed, page_size=_CRYPTOS_COPY_THRESHOLD, fetch=True)
+            self._commit()
+        except Exception as e:
+            self._rollback()
+            self.logger.error("Error upserting %d cryptos: %s", len(changed), e)
+            return self.crypto_id_map
+        for crypto_id, id_coingecko in rows:
+            self.crypto_id_map[id_coingecko] = crypto_id
+        for crypto in changed:
+            self._crypto_listing[crypto[2]] = tuple(crypto)
+        return self.crypto_id_map
+
+    def upsert_cryptos_bulk(self, rows: List[tuple]) -> List[tuple]:
+        """Upsert cryptocurrency listings through a COPY-loaded staging table, without committing.
+        
+        The rows are streamed with a binary COPY into a session temporary table (never
+        WAL-logged), then merged into cryptos with a single set-based INSERT ... SELECT.
+        The staging table is created once per connection and emptied after each merge,
+        so repeated loads, including several in one cycle transaction, skip the DDL.
+        
+        Args:
+            rows (List[tuple]): (name, symbol, id_coingecko, symbol_binance) tuples
+            
+        Returns:
+            List[tuple]: (id, id_coingecko) of every inserted or updated crypto
+        """
+        buf = io.BytesIO()
+        write = buf.write
+        write(_COPY_BINARY_HEADER)
+        for row in rows:
+            write(_COPY_FIELD_COUNT.pack(len(row)))
+            for value in row:
+                if value is None:
+                    write(_COPY_NULL)
+                else:
+                    encoded = str(value).encode('utf-8')
+                    write(_COPY_LENGTH.pack(len(encoded)))
+                    write(encoded)
+        write(_COPY_BINARY_TRAILER)
+        buf.seek(0)
+        self.cur.execute("""
+            CREATE TEMP TABLE IF NOT EXISTS staging_cryptos (
+                name TEXT, symbol TEXT, id_coingecko TEXT, symbol_binance TEXT
+            )
+        """)
+        self.cur.copy_expert(
+            "COPY staging_cryptos (name, symbol, id_coingecko, symbol_binance) FROM STDIN WITH (FORMAT binary)", buf
+        )
+        self.cur.execute("""
+            INSERT INTO cryptos (name, symbol, id_coingecko, symbol_binance)
+            SELECT DISTINCT ON (id_coingecko) name, symbol, id_coingecko, symbol_binance
+            FROM staging_cryptos
+            ON CONFLICT (id_coingecko) DO UPDATE
+            SET name = EXCLUDED.name,
+                symbol = EXCLUDED.symbol,
+                symbol_binance = EXCLUDED.symbol_binance
+            RETURNING id, id_coingecko
+        """)
+        rows = self.cur.fetchall()
+        self.cur.execute("TRUNCATE staging_cryptos")
+        return rows
+
     def insert_or_update_rank(self, crypto_id, rank):
         """Insert or update cryptocurrency market cap rank.
         
@@ -416,11 +1124,12 @@ class CryptoDatabase:
                 INSERT INTO crypto_ranks (crypto_id, rank)
                 VALUES (%s, %s)
                 ON CONFLICT (crypto_id) DO UPDATE
-                SET rank = EXCLUDED.rank;
+                SET rank = EXCLUDED.rank
+                WHERE crypto_ranks.rank IS DISTINCT FROM EXCLUDED.rank;
             """, (crypto_id, rank))
-            self.conn.commit()
+            self._commit()
         except Exception as e:
-            self.conn.rollback()
+            self._rollback()
             self.logger.error(f"Error inserting/updating rank (crypto_id={crypto_id}): {e}")
 
     def insert_cyptos_base(self, crypto_id, data):
@@ -431,27 +1140,13 @@ class CryptoDatabase:
             data (dict): Dictionary containing market metrics (price, volume, market cap, ATH, etc.)
         """
         try:
-            self.cur.execute("""
-                INSERT INTO cyptos_data_base (
-                    crypto_id, price, high_24h, low_24h, dominance, variation24h_pst, variation24h,
-                    mc_variation24h_pst, mc_variation24h, market_cap, total_volume,
-                    fully_diluted_valuation, all_time_high, all_time_high_timestamp,
-                    all_time_high_pst
-                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """, (
-                crypto_id, data.get('current_price'), data.get('high_24h'), data.get('low_24h'), 
-                data.get('dominance'), data.get('price_change_24h_pct'), data.get('price_change_24h'),
-                data.get('market_change_24h_pct'), data.get('market_change_24h'), data.get('market_cap'), 
-                data.get('total_volume'), data.get('fully_diluted_valuation'), data.get('ath'), 
-                data.get('ath_date'), data.get('ath_change_percentage')
-            ))
-            self.conn.commit()
+            self._execute_prepared("ins_base", self.base_row(crypto_id, data))
+            self._commit()
 
         except Exception as e:
-            self.conn.rollback()
+            self._rollback()
             self.logger.error(f"Error inserting into cyptos_data_base (crypto_id={crypto_id}): {e}")
 
-
     def insert_cyptos_data_details(self, crypto_id, data):
         """Insert detailed technical analysis data for a cryptocurrency.
         
@@ -464,104 +1159,159 @@ class CryptoDatabase:
             data (dict): Dictionary containing 50+ technical indicator fields
         """
         try:
-            def to_python_type(value):
-                if value is None:
-                    return None
-                if hasattr(value, 'item'): 
-                    return float(value.item())
-                return float(value) if isinstance(value, (int, float)) else value
-            
-            self.cur.execute("""
-                INSERT INTO cyptos_data_details (
-                    crypto_id,
-                    volume_actuel, volume_1j, volume_7j, volume_30j, variation_1j,
-                    variation_7j, variation_30j, volume_moyen_30j, variation_moyenne_30j,
-                    volume_moyen_7j, variation_moyenne_7j, volume_moyen_1j, variation_moyenne_1j,
-                    current_price, d1_percentage, d1_value, d1_vs_avg, d1_mean,
-                    d7_percentage, d7_value, d7_vs_avg, d7_mean,
-                    d14_percentage, d14_value, d14_vs_avg, d14_mean,
-                    d30_percentage, d30_value, d30_vs_avg, d30_mean,
-                    circulating_supply, total_supply, max_supply,
-                    pp, r1, r2, s1, s2,
-                    rsi_values, macd_h, signal_line_h, histogram_h,
-                    macd_j, signal_line_j, histogram_j,
-                    sma_50, sma_200, ema_50, ema_200, poc,
-                    fib_levels_1, fib_levels_2, fib_levels_3, fib_levels_4, fib_levels_5,
-                    fib_levels_6, fib_levels_7
-                ) VALUES (
-                    %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                    %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                    %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                    %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                    %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                    %s, %s, %s, %s, %s, %s, %s, %s
-                )
-            """, (
-                crypto_id,
-                to_python_type(data.get('volume_actuel')),
-                to_python_type(data.get('volume_1j')),
-                to_python_type(data.get('volume_7j')),
-                to_python_type(data.get('volume_30j')),
-                to_python_type(data.get('variation_1j')),
-                to_python_type(data.get('variation_7j')),
-                to_python_type(data.get('variation_30j')),
-                to_python_type(data.get('volume_moyen_30j')),
-                to_python_type(data.get('variation_moyenne_30j')),
-                to_python_type(data.get('volume_moyen_7j')),
-                to_python_type(data.get('variation_moyenne_7j')),
-                to_python_type(data.get('volume_moyen_1j')),
-                to_python_type(data.get('variation_moyenne_1j')),
-                to_python_type(data.get('current_price')),
-                to_python_type(data.get('d1_percentage')),
-                to_python_type(data.get('d1_value')),
-                to_python_type(data.get('d1_vs_avg')),
-                to_python_type(data.get('d1_mean')),
-                to_python_type(data.get('d7_percentage')),
-                to_python_type(data.get('d7_value')),
-                to_python_type(data.get('d7_vs_avg')),
-                to_python_type(data.get('d7_mean')),
-                to_python_type(data.get('d14_percentage')),
-                to_python_type(data.get('d14_value')),
-                to_python_type(data.get('d14_vs_avg')),
-                to_python_type(data.get('d14_mean')),
-                to_python_type(data.get('d30_percentage')),
-                to_python_type(data.get('d30_value')),
-                to_python_type(data.get('d30_vs_avg')),
-                to_python_type(data.get('d30_mean')),
-                to_python_type(data.get('circulating_supply')),
-                to_python_type(data.get('total_supply')),
-                to_python_type(data.get('max_supply')),
-                to_python_type(data.get('PP') or data.get('pp')),
-                to_python_type(data.get('R1') or data.get('r1')),
-                to_python_type(data.get('R2') or data.get('r2')),
-                to_python_type(data.get('S1') or data.get('s1')),
-                to_python_type(data.get('S2') or data.get('s2')),
-                to_python_type(data.get('rsi_values')),
-                to_python_type(data.get('macd_h')),
-                to_python_type(data.get('signal_line_h')),
-                to_python_type(data.get('histogram_h')),
-                to_python_type(data.get('macd_j')),
-                to_python_type(data.get('signal_line_j')),
-                to_python_type(data.get('histogram_j')),
-                to_python_type(data.get('sma_50')),
-                to_python_type(data.get('sma_200')),
-                to_python_type(data.get('ema_50')),
-                to_python_type(data.get('ema_200')),
-                to_python_type(data.get('POC') or data.get('poc')),
-                to_python_type(data.get('fib_levels_1')),
-                to_python_type(data.get('fib_levels_2')),
-                to_python_type(data.get('fib_levels_3')),
-                to_python_type(data.get('fib_levels_4')),
-                to_python_type(data.get('fib_levels_5')),
-                to_python_type(data.get('fib_levels_6')),
-                to_python_type(data.get('fib_levels_7'))
-            ))
-            self.conn.commit()
+            self._execute_prepared("ins_details", self.details_row(crypto_id, data))
+            self._commit()
         except Exception as e:
-            self.conn.rollback()
+            self._rollback()
             self.logger.error(f"Error inserting into cyptos_data_details (crypto_id={crypto_id}): {e}")
 
+    def _copy_details(self, rows: List[tuple], cur=None):
+        """Stream details rows into cyptos_data_details with a binary COPY FROM STDIN, without committing.
+        
+        FLOAT8 indicators are packed as raw big-endian doubles, so no value is formatted
+        to text. Rows are variable-length (NULLs and the NUMERIC supply columns), which
+        is why fields are packed one by one with precompiled structs. cur defaults to
+        this instance's cursor.
+        """
+        buf = io.BytesIO()
+        write = buf.write
+        write(_COPY_BINARY_HEADER)
+        pack_row_start = _COPY_ROW_START.pack
+        pack_float8 = _COPY_FLOAT8.pack
+        for row in rows:
+            write(pack_row_start(len(row), 4, row[0]))
+            for value, is_decimal in zip(row[1:], _DETAILS_IS_DECIMAL):
+                if value is None:
+                    write(_COPY_NULL)
+                elif is_decimal:
+                    write(_copy_numeric(value))
+                else:
+                    write(pack_float8(8, value))
+        write(_COPY_BINARY_TRAILER)
+        buf.seek(0)
+        (cur or self.cur).copy_expert(_DETAILS_COPY_SQL, buf)
+
+    def _copy_numeric_rows(self, cur, table: str, rows: List[tuple]):
+        """Stream (crypto_id, numeric...) rows into table with a binary COPY, without committing.
+        
+        Order book strings and floats are encoded straight to NUMERIC digits, so the
+        server neither parses text nor converts through FLOAT8.
+        """
+        buf = io.BytesIO()
+        write = buf.write
+        write(_COPY_BINARY_HEADER)
+        pack_row_start = _COPY_ROW_START.pack
+        for row in rows:
+            write(pack_row_start(len(row), 4, row[0]))
+            for value in row[1:]:
+                write(_COPY_NULL if value is None else _copy_numeric(value))
+        write(_COPY_BINARY_TRAILER)
+        buf.seek(0)
+        cur.copy_expert(_COPY_NUMERIC_TABLES[table], buf)
+
+    def _copy_text(self, cur, table: str, rows: List[tuple]):
+        """Stream rows into table with a text-format COPY FROM STDIN, without committing."""
+        cur.copy_expert(_COPY_TEXT_TABLES[table], _copy_text_buffer(rows))
+
+    def copy_rows(self, table: str, columns, rows, cur=None):
+        """Stream rows into the given columns of table with a text-format COPY, without committing.
+        
+        Used for batches larger than one execute_values page. COPY cannot resolve
+        conflicts, so tables with a unique constraint are loaded through a staging table.
+        
+        Args:
+            table (str): Target table
+            columns (tuple): Column names, in row order
+            rows (Iterable[tuple]): Row tuples
+            cur: Cursor to use, defaults to this instance's cursor
+        """
+        (cur or self.cur).copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN", _copy_text_buffer(rows))
+
+    def _values_list(self, rows: List[tuple], template: str, cur=None) -> bytes:
+        """Render row tuples as a client-side bound multi-row VALUES list using a precomputed row template."""
+        mogrify = (cur or self.cur).mogrify
+        return b",".join(mogrify(template, row) for row in rows)
 
+    def _row_statement(self, conn, cur, table: str, row: tuple) -> bytes:
+        """Render the single-row insert of a market data table as bound SQL.
+        
+        COPY tables use their prepared INSERT (prepared on conn first if needed) and
+        ranks their UPSERT, so several rows can be joined into one multi-statement query.
+        """
+        name = _ROW_PREPARED.get(table)
+        if name is None:
+            prefix, template, suffix = _BULK_INSERTS[table]
+            return prefix + cur.mogrify(template, row) + suffix
+        if name not in conn.prepared:
+            cur.execute(_PREPARED_STATEMENTS[name])
+            conn.prepared.add(name)
+        return cur.mogrify(_PREPARED_EXECUTES[name], row)
+
+    def _write_table(self, cur, table: str, rows: List[tuple]):
+        """Send rows of one market data table on cur without committing.
+        
+        Details and Binance rows go through a binary COPY, base rows through a text
+        COPY, and ranks through a multi-row UPSERT (COPY cannot resolve conflicts).
+        """
+        if table == "cyptos_data_details":
+            self._copy_details(rows, cur)
+        elif table in _COPY_NUMERIC_TABLES:
+            self._copy_numeric_rows(cur, table, rows)
+        elif table in _COPY_TEXT_TABLES:
+            self._copy_text(cur, table, rows)
+        else:
+            prefix, template, suffix = _BULK_INSERTS[table]
+            cur.execute(prefix + self._values_list(rows, template, cur) + suffix)
+
+    def bulk_insert_table(self, table: str, rows: List[tuple]) -> set:
+        """Insert rows into one market data table on a separate pooled connection.
+        
+        Meant to be called from worker threads so the four market tables are written
+        concurrently, each by its own PostgreSQL backend, independently of this
+        instance's connection. If the bulk insert fails, the rows are retried one by one
+        in a single transaction, each behind a savepoint so a bad row only rolls back
+        itself, and everything that succeeded is committed once. Like a cycle
+        transaction (see begin), it runs without waiting on the WAL flush and with
+        JIT disabled.
+        
+        Args:
+            table (str): crypto_ranks, cyptos_data_base, cyptos_data_details or cyptos_data_binance
+            rows (List[tuple]): Row tuples matching the table (rank tuples or *_row builders)
+            
+        Returns:
+            set: crypto_id of the rows that could not be inserted (empty on success)
+        """
+        if not rows:
+            return set()
+        failed = set()
+        try:
+            with self._pooled_cursor() as (conn, cur):
+                try:
+                    try:
+                        cur.execute("SET LOCAL synchronous_commit = off; SET LOCAL jit = off")
+                        self._write_table(cur, table, rows)
+                        conn.commit()
+                        return failed
+                    except Exception as e:
+                        conn.rollback()
+                        self.logger.warning("Bulk insert of %d rows into %s failed, retrying rows individually: %s", len(rows), table, e)
+                    cur.execute("SET LOCAL synchronous_commit = off; SET LOCAL jit = off")
+                    for row in rows:
+                        try:
+                            cur.execute(b"SAVEPOINT sp_row;" + self._row_statement(conn, cur, table, row) + b";RELEASE SAVEPOINT sp_row")
+                        except Exception as e:
+                            cur.execute("ROLLBACK TO SAVEPOINT sp_row")
+                            failed.add(row[0])
+                            self.logger.error("Error inserting crypto %s into %s: %s", row[0], table, e)
+                    conn.commit()
+                    return failed
+                except Exception:
+                    conn.rollback()
+                    raise
+        except Exception as e:
+            # Also covers checking out the connection (database down, pool exhausted)
+            self.logger.error("Error inserting %d rows into %s: %s", len(rows), table, e)
+            return {row[0] for row in rows}
 
     def insert_cyptos_data_binance(self, crypto_id, data):
         """Insert Binance trading data for a cryptocurrency.
@@ -571,22 +1321,12 @@ class CryptoDatabase:
             data (dict): Dictionary containing order book depth, funding rate, and open interest
         """
         try:
-            self.cur.execute("""
-                INSERT INTO cyptos_data_binance (
-                    crypto_id, bids_price_1, bids_quantity_1, bids_price_2, bids_quantity_2,
-                    bids_price_3, bids_quantity_3, asks_price_1, asks_quantity_1,
-                    asks_price_2, asks_quantity_2, asks_price_3, asks_quantity_3,
-                    funding_rate, open_interest
-                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """, (crypto_id, data.get('bids_price_1'), data.get('bids_quantity_1'), data.get('bids_price_2'), data.get('bids_quantity_2'),
-            data.get('bids_price_3'), data.get('bids_quantity_3'), data.get('asks_price_1'), data.get('asks_quantity_1'),
-            data.get('asks_price_2'), data.get('asks_quantity_2'), data.get('asks_price_3'), data.get('asks_quantity_3'),
-            data.get('funding_rate'), data.get('open_interest')))
-            self.conn.commit()
+            self._execute_prepared("ins_binance", self.binance_row(crypto_id, data))
+            self._commit()
         except Exception as e:
-            self.conn.rollback()
+            self._rollback()
             self.logger.error(f"Error inserting into cyptos_data_binance (crypto_id={crypto_id}): {e}")
-            
+
     def insert_sentiment_score(self, crypto_id: int, avg_score_12h: float, count_12h: int, avg_score_24h: float, count_24h: int):
         """Insert aggregated sentiment scores for a cryptocurrency.
         
@@ -609,12 +1349,34 @@ class CryptoDatabase:
                 avg_score_12h, count_12h,
                 avg_score_24h, count_24h
             ))
-            self.conn.commit()
+            self._commit()
             self.logger.info(f"Sentiment score saved for crypto_id {crypto_id}")
         except Exception as e:
-            self.conn.rollback()
+            self._rollback()
             self.logger.error(f"Error inserting sentiment: {e}")
 
+    def insert_sentiment_scores(self, rows: List[tuple]):
+        """Insert aggregated sentiment scores for several cryptocurrencies in one statement.
+        
+        Args:
+            rows (List[tuple]): Tuples of (crypto_id, avg_score_12h, count_12h, avg_score_24h, count_24h)
+        """
+        if not rows:
+            return
+        try:
+            execute_values(self.cur, """
+                INSERT INTO crypto_sentiment_scores (
+                    crypto_id,
+                    score_12h, count_12h,
+                    score_24h, count_24h
+                ) VALUES %s
+            """, rows, page_size=_BATCH_PAGE_SIZE)
+            self._commit()
+            self.logger.info("Sentiment scores saved for %d cryptos", len(rows))
+        except Exception as e:
+            self._rollback()
+            self.logger.error("Error inserting sentiment scores: %s", e)
+
     def insert_new_account(self, account_name: str):
         """Insert a Twitter account into tracking list.
         
@@ -627,10 +1389,10 @@ class CryptoDatabase:
                 VALUES (%s)
                 ON CONFLICT (account_name) DO NOTHING
             """, (account_name,))
-            self.conn.commit()
+            self._commit()
             self.logger.info(f"Account '{account_name}' inserted/exists already.")
         except Exception as e:
-            self.conn.rollback()
+            self._rollback()
             self.logger.error(f"Error inserting account '{account_name}': {e}")
 
     def insert_tweet_hash(self, tweet_hash: str):
@@ -646,25 +1408,16 @@ class CryptoDatabase:
             self.cur.execute("""
                 INSERT INTO tweet_hash (hash)
                 VALUES (%s)
-                ON CONFLICT (hash) DO NOTHING
+                ON CONFLICT (hash) DO UPDATE SET hash = EXCLUDED.hash
                 RETURNING tweet_id
             """, (tweet_hash,))
             
-            result = self.cur.fetchone()
-            if result:
-                tweet_id = result[0]
-                self.conn.commit()
-                self.logger.info(f"Tweet hash saved with ID {tweet_id}")
-                return tweet_id
-            else:
-                self.cur.execute("""
-                    SELECT tweet_id FROM tweet_hash WHERE hash = %s
-                """, (tweet_hash,))
-                tweet_id = self.cur.fetchone()[0]
-                self.logger.info(f"Tweet hash already exists with ID {tweet_id}")
-                return tweet_id
+            tweet_id = self.cur.fetchone()[0]
+            self._commit()
+            self.logger.info(f"Tweet hash saved with ID {tweet_id}")
+            return tweet_id
         except Exception as e:
-            self.conn.rollback()
+            self._rollback()
             self.logger.error(f"Error inserting tweet hash: {e}") 
             return None
     
@@ -682,11 +1435,11 @@ class CryptoDatabase:
                 INSERT INTO tweet_sentiments (tweet_id, account, tweet_content, timestamp)
                 VALUES (%s, %s, %s, %s)
             """, (tweet_id, account, tweet_content, timestamp))
-            self.conn.commit()
+            self._commit()
             self.logger.info(f"Tweet sentiment inserted with ID {tweet_id}")
             
         except Exception as e:
-            self.conn.rollback()
+            self._rollback()
             self.logger.error(f"Error inserting tweet sentiment: {e}")
     
     def link_tweet_to_crypto(self, tweet_id: int, crypto_id: int, sentiment_score: float):
@@ -704,12 +1457,95 @@ class CryptoDatabase:
                 ON CONFLICT (tweet_id, crypto_id) DO NOTHING
             """, (tweet_id, crypto_id, sentiment_score))
             
-            self.conn.commit()
+            self._commit()
             self.logger.info(f"Linked tweet {tweet_id} to crypto {crypto_id} with score {sentiment_score}")
         except Exception as e:
-            self.conn.rollback()
+            self._rollback()
             self.logger.error(f"Error linking tweet to crypto: {e}")
             
+    def insert_tweet_hashes(self, tweet_hashes: List[str]) -> Dict[str, int]:
+        """Insert several tweet hashes for deduplication in one statement.
+        
+        Args:
+            tweet_hashes (List[str]): Unique hashes of the tweet contents
+            
+        Returns:
+            Dict[str, int]: Mapping of hash to tweet ID (new or existing), empty if error
+        """
+        if not tweet_hashes:
+            return {}
+        try:
+            rows = execute_values(self.cur, """
+                INSERT INTO tweet_hash (hash)
+                VALUES %s
+                ON CONFLICT (hash) DO UPDATE SET hash = EXCLUDED.hash
+                RETURNING hash, tweet_id
+            """, [(h,) for h in dict.fromkeys(tweet_hashes)], page_size=_BATCH_PAGE_SIZE, fetch=True)
+            self._commit()
+            self.logger.info("%d tweet hashes saved", len(rows))
+            return dict(rows)
+        except Exception as e:
+            self._rollback()
+            self.logger.error("Error inserting tweet hashes: %s", e)
+            return {}
+
+    def insert_tweet_sentiments(self, rows: List[tuple]):
+        """Insert content and metadata for several tweets in one statement.
+        
+        Args:
+            rows (List[tuple]): Tuples of (tweet_id, account, tweet_content, timestamp)
+        """
+        if not rows:
+            return
+        try:
+            execute_values(self.cur, """
+                INSERT INTO tweet_sentiments (tweet_id, account, tweet_content, timestamp)
+                VALUES %s
+                ON CONFLICT (tweet_id) DO NOTHING
+            """, rows, page_size=_BATCH_PAGE_SIZE)
+            self._commit()
+            self.logger.info("%d tweet sentiments inserted", len(rows))
+        except Exception as e:
+            self._rollback()
+            self.logger.error("Error inserting tweet sentiments: %s", e)
+
+    def link_tweets_to_cryptos(self, rows: List[tuple]):
+        """Link several tweets to cryptocurrencies with their sentiment scores in one statement.
+        
+        Batches larger than one page are COPY-loaded into a session staging table and
+        merged with INSERT ... SELECT, which keeps the ON CONFLICT handling.
+        
+        Args:
+            rows (List[tuple]): Tuples of (tweet_id, crypto_id, sentiment_score)
+        """
+        if not rows:
+            return
+        try:
+            if len(rows) > _BATCH_PAGE_SIZE:
+                self.cur.execute("""
+                    CREATE TEMP TABLE IF NOT EXISTS staging_tweet_crypto (
+                        tweet_id INTEGER, crypto_id INTEGER, sentiment_score FLOAT
+                    )
+                """)
+                self.copy_rows("staging_tweet_crypto", _TWEET_CRYPTO_COLUMNS, rows)
+                self.cur.execute("""
+                    INSERT INTO tweet_crypto (tweet_id, crypto_id, sentiment_score)
+                    SELECT tweet_id, crypto_id, sentiment_score FROM staging_tweet_crypto
+                    ON CONFLICT (tweet_id, crypto_id) DO NOTHING;
+                    TRUNCATE staging_tweet_crypto
+                """)
+            else:
+                execute_values(self.cur, """
+                    INSERT INTO tweet_crypto (tweet_id, crypto_id, sentiment_score)
+                    VALUES %s
+                    ON CONFLICT (tweet_id, crypto_id) DO NOTHING
+                """, rows, page_size=_BATCH_PAGE_SIZE)
+            self._commit()
+            self.logger.info("%d tweet/crypto links inserted", len(rows))
+        except Exception as e:
+            self._rollback()
+            self.logger.error("Error linking tweets to cryptos: %s", e)
+
     def insert_score(self, crypto_id: int, score_metric: float, score_total: int, Trend: float, priceUnit: float):
         """Insert calculated trading signal scores.
         
@@ -725,10 +1561,33 @@ class CryptoDatabase:
                 INSERT INTO crypto_scores (crypto_id, score_metric, score_total, Trend, priceUnit)
                 VALUES (%s, %s, %s, %s, %s)
             """, (crypto_id, score_metric, score_total, Trend, priceUnit))
-            self.conn.commit()
+            self._commit()
         except Exception as e:
             self.logger.error(f"Error inserting score data: {e}")
-            self.conn.rollback()
+            self._rollback()
+    
+    def insert_scores_bulk(self, rows: List[tuple]):
+        """Insert the trading signal scores of several cryptocurrencies in one statement.
+        
+        Batches larger than one page are streamed with a text COPY.
+        
+        Args:
+            rows (List[tuple]): Tuples of (crypto_id, score_metric, score_total, Trend, priceUnit)
+        """
+        if not rows:
+            return
+        try:
+            if len(rows) > _BATCH_PAGE_SIZE:
+                self.copy_rows("crypto_scores", _SCORE_COLUMNS, rows)
+            else:
+                execute_values(self.cur, """
+                    INSERT INTO crypto_scores (crypto_id, score_metric, score_total, Trend, priceUnit)
+                    VALUES %s
+                """, rows, page_size=_BATCH_PAGE_SIZE)
+            self._commit()
+        except Exception as e:
+            self.logger.error("Error inserting %d scores: %s", len(rows), e)
+            self._rollback()
     
     def insert_trade(self, crypto_id: int, position_size: float, entry_price: float, direction: int,
                         risk_reward_ratio: float, take_profit_1: float, stop_loss_1: float,
@@ -755,10 +1614,10 @@ class CryptoDatabase:
                 VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
             """, (crypto_id, position_size, entry_price, direction, risk_reward_ratio,
                       take_profit_1, stop_loss_1, take_profit_2, stop_loss_2, runner))
-            self.conn.commit()
+            self._commit()
         except Exception as e:
             self.logger.error(f"Error inserting trade data: {e}")
-            self.conn.rollback()
+            self._rollback()
             
             
 #------------------------------------------------------------------------------------
@@ -766,27 +1625,19 @@ class CryptoDatabase:
 #------------------------------------------------------------------------------------
 
     def drop_tables(self):
-        """Drop all main cryptocurrency data tables in correct cascade order."""
-        tables = ['cyptos_data_binance', 'cyptos_data_details', 'cyptos_data_base', 'crypto_ranks', 'cryptos']
-        for table in tables:
-            self.cur.execute(f"DROP TABLE IF EXISTS {table} CASCADE;")
-            self.conn.commit()
+        """Drop all main cryptocurrency data tables in a single statement."""
+        self.cur.execute("DROP TABLE IF EXISTS cyptos_data_binance, cyptos_data_details, cyptos_data_base, crypto_ranks, cryptos CASCADE")
+        self._commit()
             
     def drop_sentiment_tables(self):
-        """Drop all sentiment analysis related tables in correct cascade order."""
-        self.cur.execute("DROP TABLE IF EXISTS tweet_crypto;")
-        self.cur.execute("DROP TABLE IF EXISTS tweet_sentiments;")
-        self.cur.execute("DROP TABLE IF EXISTS tweet_hash;")
-        self.cur.execute("DROP TABLE IF EXISTS crypto_sentiment_scores;")
-        self.cur.execute("DROP TABLE IF EXISTS account;")
-        self.conn.commit()
+        """Drop all sentiment analysis related tables in a single statement."""
+        self.cur.execute("DROP TABLE IF EXISTS tweet_crypto, tweet_sentiments, tweet_hash, crypto_sentiment_scores, account")
+        self._commit()
         
     def drop_tables_scores_and_trade(self):
         """Drop trading scores, trade data, and portfolio performance tables."""
-        self.cur.execute("DROP TABLE IF EXISTS crypto_scores CASCADE")
-        self.cur.execute("DROP TABLE IF EXISTS crypto_trade_data CASCADE")
-        self.cur.execute("DROP TABLE IF EXISTS portfolio_performance CASCADE")
-        self.conn.commit()
+        self.cur.execute("DROP TABLE IF EXISTS crypto_scores, crypto_trade_data, portfolio_performance CASCADE")
+        self._commit()
 
 
 #------------------------------------------------------------------------------------
@@ -803,29 +1654,52 @@ class CryptoDatabase:
             bool: True if tweet exists, False otherwise
         """
         try:
-            self.cur.execute("""
-                SELECT COUNT(*) FROM tweet_hash WHERE hash = %s
-            """, (tweet_hash,))
-            count = self.cur.fetchone()[0]
-            return count > 0
+            self._execute_prepared("sel_tweet_exists", (tweet_hash,))
+            return self.cur.fetchone()[0]
         except Exception as e:
+            self._rollback()
             self.logger.error(f"Error checking tweet existence: {e}")
             return False
     
+    def get_existing_tweet_hashes(self, tweet_hashes: List[str]) -> set:
+        """Get the subset of tweet hashes already stored in the database.
+        
+        Args:
+            tweet_hashes (List[str]): Hashes to check
+            
+        Returns:
+            set: Hashes that already exist, empty set if error
+        """
+        if not tweet_hashes:
+            return set()
+        try:
+            self.cur.execute("""
+                SELECT hash FROM tweet_hash WHERE hash = ANY(%s)
+            """, (list(tweet_hashes),))
+            return {row[0] for row in self.cur.fetchall()}
+        except Exception as e:
+            self._rollback()
+            self.logger.error(f"Error checking tweet existence: {e}")
+            return set()
+    
     def get_crypto_list(self) -> List[str]:
         """Get list of all cryptocurrency symbols and names.
         
+        The list is flattened by the server into a single array, so only one row
+        is decoded.
+        
         Returns:
             List[str]: Flattened list alternating between symbol and name
         """
         try:
-            self.cur.execute("SELECT symbol,name FROM cryptos")
-            cryptos = []
-            for row in self.cur.fetchall():
-                cryptos.append(row[0])
-                cryptos.append(row[1])
-            return cryptos
+            self.cur.execute("""
+                SELECT array_agg(v.value ORDER BY c.id, v.position)
+                FROM cryptos c
+                CROSS JOIN LATERAL (VALUES (c.symbol, 1), (c.name, 2)) AS v(value, position)
+            """)
+            return self.cur.fetchone()[0] or []
         except Exception as e:
+            self._rollback()
             self.logger.error(f"Error retrieving crypto list: {e}")
             raise
 
@@ -836,10 +1710,10 @@ class CryptoDatabase:
             List[int]: List of crypto IDs
         """
         try:
-            self.cur.execute("SELECT id FROM cryptos")
-            crypto_ids = [row[0] for row in self.cur.fetchall()]
-            return crypto_ids
+            self.cur.execute("SELECT array_agg(id) FROM cryptos")
+            return self.cur.fetchone()[0] or []
         except Exception as e:
+            self._rollback()
             self.logger.error(f"Error retrieving crypto IDs: {e}")
             raise
         
@@ -854,12 +1728,12 @@ class CryptoDatabase:
         """
         try:
             self.cur.execute("""
-                SELECT sentiment_score FROM tweet_crypto
+                SELECT array_agg(sentiment_score) FROM tweet_crypto
                 WHERE crypto_id = %s
             """, (crypto_id,))
-            sentiments = [row[0] for row in self.cur.fetchall()]
-            return sentiments
+            return self.cur.fetchone()[0] or []
         except Exception as e:
+            self._rollback()
             self.logger.error(f"Error retrieving sentiments for crypto {crypto_id}: {e}")
             raise
         
@@ -873,16 +1747,10 @@ class CryptoDatabase:
             List[float]: List of sentiment scores from last 24h
         """
         try:
-            self.cur.execute("""
-                SELECT tc.sentiment_score 
-                FROM tweet_crypto tc
-                JOIN tweet_sentiments ts ON tc.tweet_id = ts.tweet_id
-                WHERE tc.crypto_id = %s 
-                AND ts.timestamp >= EXTRACT(EPOCH FROM (NOW() - INTERVAL '24 hours'))
-            """, (crypto_id,))
-            sentiments = [row[0] for row in self.cur.fetchall()]
-            return sentiments
+            self._execute_prepared("sel_sentiments_24h", (crypto_id,))
+            return self.cur.fetchone()[0] or []
         except Exception as e:
+            self._rollback()
             self.logger.error(f"Error retrieving sentiments for crypto {crypto_id} in last 24h: {e}")
             raise
 
@@ -896,20 +1764,44 @@ class CryptoDatabase:
             List[float]: List of sentiment scores from last 12h
         """
         try:
-            self.cur.execute("""
-                SELECT tc.sentiment_score 
-                FROM tweet_crypto tc
-                JOIN tweet_sentiments ts ON tc.tweet_id = ts.tweet_id
-                WHERE tc.crypto_id = %s 
-                AND ts.timestamp >= EXTRACT(EPOCH FROM (NOW() - INTERVAL '12 hours'))
-            """, (crypto_id,))
-            sentiments = [row[0] for row in self.cur.fetchall()]
-            return sentiments
+            self._execute_prepared("sel_sentiments_12h", (crypto_id,))
+            return self.cur.fetchone()[0] or []
         except Exception as e:
+            self._rollback()
             self.logger.error(f"Error retrieving sentiments for crypto {crypto_id} in last 12h: {e}")
             raise
     
     
+    def get_sentiment_aggregates(self) -> List[tuple]:
+        """Get average sentiment score and tweet count over 12h and 24h for every cryptocurrency.
+        
+        Returns:
+            List[tuple]: Tuples of (crypto_id, avg_score_12h, count_12h, avg_score_24h, count_24h)
+                for each crypto with at least one tweet in the last 24h
+        """
+        try:
+            self.cur.execute("""
+                SELECT
+                    tc.crypto_id,
+                    COALESCE(AVG(tc.sentiment_score) FILTER (
+                        WHERE ts.timestamp >= EXTRACT(EPOCH FROM (NOW() - INTERVAL '12 hours'))
+                    ), 0.0) AS avg_score_12h,
+                    COUNT(*) FILTER (
+                        WHERE ts.timestamp >= EXTRACT(EPOCH FROM (NOW() - INTERVAL '12 hours'))
+                    ) AS count_12h,
+                    AVG(tc.sentiment_score) AS avg_score_24h,
+                    COUNT(*) AS count_24h
+                FROM tweet_crypto tc
+                JOIN tweet_sentiments ts ON tc.tweet_id = ts.tweet_id
+                WHERE ts.timestamp >= EXTRACT(EPOCH FROM (NOW() - INTERVAL '24 hours'))
+                GROUP BY tc.crypto_id
+            """)
+            return self.cur.fetchall()
+        except Exception as e:
+            self._rollback()
+            self.logger.error("Error retrieving sentiment aggregates: %s", e)
+            raise
+
     def get_crypto_id_by_symbol_or_name(self, symbol_or_name: str) -> int:
         """Find cryptocurrency ID by symbol or name.
         
@@ -920,16 +1812,14 @@ class CryptoDatabase:
             int: Crypto database ID, or None if not found
         """
         try:
-            self.cur.execute("""
-                SELECT id FROM cryptos
-                WHERE symbol = %s OR name = %s
-            """, (symbol_or_name, symbol_or_name))
+            self._execute_prepared("sel_crypto_id", (symbol_or_name,))
             result = self.cur.fetchone()
             if result:
                 return result[0]
             else:
                 return None
         except Exception as e:
+            self._rollback()
             self.logger.error(f"Error retrieving crypto ID by symbol or name {symbol_or_name}: {e}")
             raise
 
@@ -940,22 +1830,12 @@ class CryptoDatabase:
             List[Dict]: List of sentiment score dictionaries with crypto_id, scores, counts, and timestamp
         """
         try:
-            self.cur.execute("""
+            return self._stream_rows_to_dicts("all_sentiment_scores", """
                 SELECT crypto_id, score_12h, count_12h, score_24h, count_24h, timestamp
                 FROM crypto_sentiment_scores
             """)
-            records = []
-            for row in self.cur.fetchall():
-                records.append({
-                    'crypto_id': row[0],
-                    'score_12h': row[1],
-                    'count_12h': row[2],
-                    'score_24h': row[3],
-                    'count_24h': row[4],
-                    'timestamp': row[5]
-                })
-            return records
         except Exception as e:
+            self._rollback()
             self.logger.error(f"Error retrieving all sentiment scores: {e}")
             raise
 
@@ -966,10 +1846,10 @@ class CryptoDatabase:
             List[str]: List of account names
         """
         try:
-            self.cur.execute("SELECT account_name FROM account")
-            accounts = [row[0] for row in self.cur.fetchall()]
-            return accounts
+            self.cur.execute("SELECT array_agg(account_name) FROM account")
+            return self.cur.fetchone()[0] or []
         except Exception as e:
+            self._rollback()
             self.logger.error(f"Error retrieving accounts: {e}")
             raise
     
@@ -980,20 +1860,22 @@ class CryptoDatabase:
             List[Dict]: List of crypto dictionaries with id, name, symbol, CoinGecko ID, Binance symbol, and rank
         """
         try:
-            self.cur.execute("""
-                SELECT 
-                    c.id,
-                    c.name,
-                    c.symbol,
-                    c.id_coingecko,
-                    c.symbol_binance,
-                    cr.rank
-                FROM cryptos c
-                LEFT JOIN crypto_ranks cr ON c.id = cr.crypto_id
-                ORDER BY cr.rank NULLS LAST, c.id
-            """)
-            return self._rows_to_dicts(self.cur.fetchall())
+            with self._dict_cursor() as cur:
+                cur.execute("""
+                    SELECT 
+                        c.id,
+                        c.name,
+                        c.symbol,
+                        c.id_coingecko,
+                        c.symbol_binance,
+                        cr.rank
+                    FROM cryptos c
+                    LEFT JOIN crypto_ranks cr ON c.id = cr.crypto_id
+                    ORDER BY cr.rank NULLS LAST, c.id
+                """)
+                return cur.fetchall()
         except Exception as e:
+            self._rollback()
             self.logger.error(f"Error fetching cryptos: {e}")
             return []
         
@@ -1008,15 +1890,11 @@ class CryptoDatabase:
             Optional[float]: Latest price, or None if not found
         """
         try:
-            self.cur.execute("""
-                SELECT price FROM cyptos_data_base
-                WHERE crypto_id=%s
-                ORDER BY timestamp DESC
-                LIMIT 1
-            """, (crypto_id,))
+            self._execute_prepared("sel_last_price", (crypto_id,))
             result = self.cur.fetchone()
             return result[0] if result else None
         except Exception as e:
+            self._rollback()
             self.logger.error(f"Error fetching last crypto price: {e}")
             return None
         
@@ -1033,16 +1911,55 @@ class CryptoDatabase:
         """
         try:
             since_date = datetime.now() - timedelta(days=days)
-            self.cur.execute("""
+            return self._stream_rows_to_dicts("historical_prices", """
                 SELECT price FROM cyptos_data_base
                 WHERE crypto_id=%s AND timestamp >= %s
                 ORDER BY timestamp ASC
             """, (crypto_id, since_date))
-            return self._rows_to_dicts(self.cur.fetchall())
         except Exception as e:
+            self._rollback()
             self.logger.error(f"Error fetching historical prices: {e}")
             return []
     
+    def get_historical_price_values(self, crypto_id: int, days: int) -> List[float]:
+        """Get historical prices of a cryptocurrency as a plain list, oldest first.
+        
+        Prices are kept in an in-memory window per crypto: the first call streams the
+        whole period from a named cursor, later calls only fetch the rows added since
+        (plus a short overlap) and drop the ones that fell out of the period.
+        
+        Args:
+            crypto_id (int): Cryptocurrency database ID
+            days (int): Number of days of historical data
+            
+        Returns:
+            List[float]: Prices ordered chronologically
+        """
+        since_date = datetime.now() - timedelta(days=days)
+        prices = self._price_windows.get(crypto_id)
+        if prices is None or since_date < self._price_window_start[crypto_id]:
+            prices = self._price_windows[crypto_id] = deque()
+        resume = since_date
+        if prices:
+            resume = max(since_date, prices[-1][0] - _PRICE_WINDOW_OVERLAP)
+            while prices and prices[-1][0] >= resume:
+                prices.pop()
+        try:
+            prices.extend(self.iter_rows("historical_price_values", """
+                SELECT timestamp, price FROM cyptos_data_base
+                WHERE crypto_id=%s AND timestamp >= %s
+                ORDER BY timestamp ASC
+            """, (crypto_id, resume)))
+        except Exception as e:
+            self._price_windows.pop(crypto_id, None)
+            self._rollback()
+            self.logger.error(f"Error fetching historical prices: {e}")
+            return []
+        while prices and prices[0][0] < since_date:
+            prices.popleft()
+        self._price_window_start[crypto_id] = since_date
+        return [price for _, price in prices]
+    
     def get_crypto_data(self, crypto_id: int) -> Dict[str, Any]:
         """Get comprehensive cryptocurrency data (alias for get_all_crypto_informations).
         
@@ -1059,6 +1976,8 @@ class CryptoDatabase:
         
         Performs a complex join across base data, technical details, Binance data,
         and sentiment scores to retrieve comprehensive cryptocurrency information.
+        The details and Binance rows closest in time to the latest base row are found
+        with two (crypto_id, timestamp) primary key probes instead of sorting every row.
         
         Args:
             crypto_id (int): Cryptocurrency database ID
@@ -1067,101 +1986,96 @@ class CryptoDatabase:
             List[Dict]: List with single dictionary containing all crypto metrics
         """
         try:
-            self.cur.execute("""
-                WITH base_latest AS (
-                    SELECT * FROM cyptos_data_base 
-                    WHERE crypto_id=%s 
-                    ORDER BY timestamp DESC 
-                    LIMIT 1
-                )
-                SELECT 
-                    b.*,
-                    d.rsi_values as rsi,
-                    d.macd_j as macd_j,
-                    d.signal_line_j as signal_j,
-                    d.macd_h as macd_h,
-                    d.signal_line_h as signal_h,
-                    d.histogram_h as histogram,
-                    d.histogram_j as hist_norm,
-                    d.ema_50,
-                    d.ema_200,
-                    d.sma_50,
-                    d.sma_200,
-                    d.r1,
-                    d.s1,
-                    d.pp as pivot,
-                    d.fib_levels_3 as fibo_382,
-                    d.fib_levels_5 as fibo_618,
-                    d.d1_percentage,
-                    d.d7_percentage,
-                    d.d14_percentage,
-                    d.volume_actuel,
-                    d.volume_moyen_7j,
-                    bn.funding_rate,
-                    bn.open_interest,
-                    s.score_12h as sentiment_score_12h,
-                    s.count_12h as sentiment_count_12h,
-                    s.score_24h as sentiment_score_24h,
-                    s.count_24h as sentiment_count_24h
-                FROM base_latest b
-                LEFT JOIN LATERAL (
-                    SELECT * FROM cyptos_data_details 
-                    WHERE crypto_id=%s 
-                    ORDER BY ABS(EXTRACT(EPOCH FROM (timestamp - b.timestamp)))
-                    LIMIT 1
-                ) d ON TRUE
-                LEFT JOIN LATERAL (
-                    SELECT * FROM cyptos_data_binance 
-                    WHERE crypto_id=%s 
-                    ORDER BY ABS(EXTRACT(EPOCH FROM (timestamp - b.timestamp)))
-                    LIMIT 1
-                ) bn ON TRUE
-                LEFT JOIN LATERAL (
-                    SELECT * FROM crypto_sentiment_scores 
-                    WHERE crypto_id=%s 
-                    ORDER BY timestamp DESC
-                    LIMIT 1
-                ) s ON TRUE
-            """, (crypto_id, crypto_id, crypto_id, crypto_id))
-            
-            return self._rows_to_dicts(self.cur.fetchall())
+            with self._dict_cursor() as cur:
+                cur.execute("""
+                    WITH base_latest AS (
+                        SELECT * FROM cyptos_data_base 
+                        WHERE crypto_id=%s 
+                        ORDER BY timestamp DESC 
+                        LIMIT 1
+                    )
+                """ + _CRYPTO_INFORMATIONS_SELECT, (crypto_id,))
+                return cur.fetchall()
         except Exception as e:
+            self._rollback()
             self.logger.error(f"Error fetching crypto data for ID {crypto_id}: {e}")
             return []
         
     
-    def select_trades_current(self, crypto_id: int) -> List[Dict[str, Any]]:
+    def get_all_crypto_informations_bulk(self, crypto_ids: List[int]) -> Dict[int, List[Dict[str, Any]]]:
+        """Get the data of get_all_crypto_informations for several cryptocurrencies in one query.
+        
+        The latest base row of every crypto is selected with DISTINCT ON and joined
+        exactly like in get_all_crypto_informations, in a single round-trip.
+        
+        Args:
+            crypto_ids (List[int]): Cryptocurrency database IDs
+            
+        Returns:
+            Dict[int, List[Dict]]: Mapping of crypto ID to a list with its single data
+                dictionary; cryptos without base data are absent, empty if error
+        """
+        if not crypto_ids:
+            return {}
+        try:
+            with self._dict_cursor() as cur:
+                cur.execute("""
+                    WITH base_latest AS (
+                        SELECT DISTINCT ON (crypto_id) * FROM cyptos_data_base
+                        WHERE crypto_id = ANY(%s)
+                        ORDER BY crypto_id, timestamp DESC
+                    )
+                """ + _CRYPTO_INFORMATIONS_SELECT, (list(crypto_ids),))
+                return {row['crypto_id']: [row] for row in cur.fetchall()}
+        except Exception as e:
+            self._rollback()
+            self.logger.error("Error fetching crypto data for %d cryptos: %s", len(crypto_ids), e)
+            return {}
+
+    def _select_columns(self, columns, query):
+        """Compose a SELECT of the given columns, quoted as identifiers, with the rest of a query."""
+        return sql.SQL("SELECT {} ").format(sql.SQL(", ").join(map(sql.Identifier, columns))) + sql.SQL(query)
+    
+    def select_trades_current(self, crypto_id: int, columns=_OPEN_TRADE_COLUMNS) -> List[Dict[str, Any]]:
         """Get all active trades for a specific cryptocurrency.
         
         Args:
             crypto_id (int): Cryptocurrency database ID
+            columns (tuple): crypto_trade_data columns to return, the ones the trade manager reads by default
             
         Returns:
             List[Dict]: List of active trade dictionaries (status=0)
         """
         try:
-            self.cur.execute("""
-                SELECT * FROM crypto_trade_data 
-                WHERE crypto_id=%s AND status=0
-            """, (crypto_id,))
-            return self._rows_to_dicts(self.cur.fetchall())
+            with self._dict_cursor() as cur:
+                cur.execute(self._select_columns(columns, """
+                    FROM crypto_trade_data 
+                    WHERE crypto_id=%s AND status=0
+                """), (crypto_id,))
+                return cur.fetchall()
         except Exception as e:
+            self._rollback()
             self.logger.error(f"Error fetching current trades: {e}")
             return []
     
-    def select_all_trades_current(self) -> List[Dict[str, Any]]:
+    def select_all_trades_current(self, columns=_OPEN_TRADE_COLUMNS) -> List[Dict[str, Any]]:
         """Get all active trades across all cryptocurrencies.
         
+        Args:
+            columns (tuple): crypto_trade_data columns to return, the ones the trade manager reads by default
+        
         Returns:
             List[Dict]: List of all trades with any active positions (status=0 or status_1=0 or status_2=0)
         """
         try:
-            self.cur.execute("""
-                SELECT * FROM crypto_trade_data 
-                WHERE status=0 or status_1=0 or status_2=0
-            """)
-            return self._rows_to_dicts(self.cur.fetchall())
+            with self._dict_cursor() as cur:
+                cur.execute(self._select_columns(columns, """
+                    FROM crypto_trade_data 
+                    WHERE status=0 or status_1=0 or status_2=0
+                """))
+                return cur.fetchall()
         except Exception as e:
+            self._rollback()
             self.logger.error(f"Error fetching all current trades: {e}")
             return []
         
@@ -1175,33 +2089,26 @@ class CryptoDatabase:
         
         Deletes tweets older than TWEET_RETENTION_DAYS from all sentiment tables
         to maintain database performance and comply with data retention policies.
+        Only tweet_hash rows are deleted: tweet_sentiments and tweet_crypto follow
+        through their ON DELETE CASCADE foreign keys, all in one statement.
         """
         try:
             seven_days_ago = int((datetime.now().timestamp() - (conf.TWEET_RETENTION_DAYS * 24 * 60 * 60)))
             self.cur.execute("""
-                SELECT tweet_id FROM tweet_sentiments
-                WHERE timestamp < %s
+                DELETE FROM tweet_hash
+                WHERE tweet_id IN (
+                    SELECT tweet_id FROM tweet_sentiments
+                    WHERE timestamp < %s
+                )
             """, (seven_days_ago,))
-            old_tweet_ids = [row[0] for row in self.cur.fetchall()]
-            if not old_tweet_ids:
+            deleted = self.cur.rowcount
+            self._commit()
+            if not deleted:
                 self.logger.info("No tweets older than 7 days to delete")
                 return
-            self.cur.execute("""
-                DELETE FROM tweet_crypto
-                WHERE tweet_id = ANY(%s)
-            """, (old_tweet_ids,))
-            self.cur.execute("""
-                DELETE FROM tweet_sentiments
-                WHERE tweet_id = ANY(%s)
-            """, (old_tweet_ids,))
-            self.cur.execute("""
-                DELETE FROM tweet_hash
-                WHERE tweet_id = ANY(%s)
-            """, (old_tweet_ids,))
-            self.conn.commit()
-            self.logger.info(f"Deleted {len(old_tweet_ids)} tweets older than 7 days")
+            self.logger.info("Deleted %d tweets older than 7 days", deleted)
         except Exception as e:
-            self.conn.rollback()
+            self._rollback()
             self.logger.error(f"Error cleaning old tweets: {e}")
             raise
     
@@ -1214,25 +2121,34 @@ class CryptoDatabase:
             status (int): New status value (0=active, 1=hit, -1=stopped)
         """
         try:
-            if take_profit_number == 1:
-                self.cur.execute("""
-                    UPDATE crypto_trade_data
-                    SET status_1=%s
-                    WHERE id_trade=%s
-                """, (status, trade_id))
-            elif take_profit_number == 2:
-                self.cur.execute("""
-                    UPDATE crypto_trade_data
-                    SET status_2=%s
-                    WHERE id_trade=%s
-                """, (status, trade_id))
-            elif take_profit_number == 3:
-                self.cur.execute("""
-                    UPDATE crypto_trade_data
-                    SET status=%s
-                    WHERE id_trade=%s
-                """, (status, trade_id))
-            self.conn.commit()
+            query = _TRADE_STATUS_UPDATES.get(take_profit_number)
+            if query is not None:
+                self.cur.execute(query, (status, trade_id))
+            self._commit()
         except Exception as e:
             self.logger.error(f"Error updating trade status for trade_id {trade_id}: {e}")
-            self.conn.rollback()
+            self._rollback()
+    
+    def update_trade_statuses_bulk(self, rows: List[tuple]):
+        """Update the take-profit statuses of several trades with one UPDATE per level.
+        
+        Rows are grouped by take-profit level so that each trade appears once per
+        statement, then joined against a VALUES list.
+        
+        Args:
+            rows (List[tuple]): Tuples of (trade_id, take_profit_number, status)
+        """
+        if not rows:
+            return
+        by_level = {}
+        for trade_id, take_profit_number, status in rows:
+            if take_profit_number in _TRADE_STATUS_BULK_UPDATES:
+                by_level.setdefault(take_profit_number, {})[trade_id] = status
+        try:
+            for take_profit_number, statuses in by_level.items():
+                execute_values(self.cur, _TRADE_STATUS_BULK_UPDATES[take_profit_number],
+                               list(statuses.items()), page_size=_BATCH_PAGE_SIZE)
+            self._commit()
+        except Exception as e:
+            self.logger.error("Error updating %d trade statuses: %s", len(rows), e)
+            self._rollback()
@@ -1,8 +1,17 @@
-import requests
+import threading
 import time
+from scrapy.market.collectors.http_session import RateLimiter, get_json, get_session
 import scrapy.utils.logger as Logger
 import scrapy.config.settings as conf
 
+# Shared by all collectors; keeps the former ceiling of BINANCE_MAX_WORKERS workers
+# each pausing API_BASE_DELAY seconds between requests
+_RATE_LIMITER = RateLimiter(conf.BINANCE_MAX_WORKERS / conf.API_BASE_DELAY)
+# Binance listings change rarely, so the exchangeInfo symbol set is shared across
+# cycles as (expiry, symbols) and refreshed every BINANCE_SYMBOLS_TTL_MINUTES
+_SYMBOLS_CACHE = (0.0, None)
+_SYMBOLS_LOCK = threading.Lock()
+
 class BinanceCollector:
     """Collector for fetching cryptocurrency trading data from Binance API.
     
@@ -18,50 +27,53 @@ class BinanceCollector:
                 Defaults to None, which uses conf.API_BASE_DELAY.
         """
         self.base_delay = conf.API_BASE_DELAY
+        self.session = get_session()
         self.logger = Logger.get_logger("BinanceCollector")
     
     def _api_generic(self, url, params=None):
         """Generic API request handler with rate limit handling and retry logic.
         
-        Automatically retries requests when encountering 429 (rate limit) errors
-        with exponential backoff. Logs warnings and errors appropriately.
+        Requests are paced by a limiter shared across threads. 429 responses, which
+        pause that limiter for every thread, and network errors are retried up to
+        API_MAX_RETRIES times with jittered exponential backoff or the server's
+        Retry-After delay (see http_session.get_json).
         
         Args:
             url (str): API endpoint URL
             params (dict, optional): Query parameters for the request. Defaults to None.
             
         Returns:
-            dict: JSON response data, or None if request fails with non-429 error
+            dict: JSON response data, or None if the request failed or retries ran out
         """
-        response = requests.get(url, params=params)
-        time.sleep(self.base_delay)
-        while response.status_code != 200:
-            if response.status_code == 429:
-                self.logger.warning(f"Binance Rate limit exceeded. Waiting before retrying : {response.status_code} ...")
-                time.sleep(conf.API_BACKOFF_DELAY)
-                response = requests.get(url, params=params)
-            else: 
-                self.logger.error(f"Error with Binance API: {response.status_code}")
-                return None
-        return response.json()
+        return get_json(self.session, _RATE_LIMITER, url, params, self.logger, "Binance")
     
-    def get_binance_symbols(self) -> str:
+    def get_binance_symbols(self) -> frozenset:
         """Fetch all available trading symbols from Binance exchange.
         
         Retrieves the complete list of trading pairs available on Binance spot market.
+        The exchangeInfo payload is large, so it is requested without the per-symbol
+        permission sets and the set is cached for BINANCE_SYMBOLS_TTL_MINUTES;
+        failed requests are not cached.
         
         Returns:
-            set: Set of symbol strings (e.g., 'BTCUSDT', 'ETHUSDT'), or empty set if request fails
+            frozenset: Shared set of symbol strings (e.g., 'BTCUSDT', 'ETHUSDT'), or empty set if request fails
         """
-        binance_url = "https://api.binance.com/api/v3/exchangeInfo"
-        binance_response = self._api_generic(binance_url)
-        if binance_response is None:
-            return set()
-        binance_symbols = set(
-            symbol_data["symbol"] 
-            for symbol_data in binance_response.get("symbols", [])
-        )
-        return binance_symbols
+        global _SYMBOLS_CACHE
+        with _SYMBOLS_LOCK:
+            expiry, symbols = _SYMBOLS_CACHE
+            if symbols is not None and time.monotonic() < expiry:
+                return symbols
+            binance_url = "https://api.binance.com/api/v3/exchangeInfo"
+            # permissionSets is most of the payload and is not used here
+            binance_response = self._api_generic(binance_url, {"showPermissionSets": "false"})
+            if binance_response is None:
+                return frozenset()
+            symbols = frozenset(
+                symbol_data["symbol"] 
+                for symbol_data in binance_response.get("symbols", [])
+            )
+            _SYMBOLS_CACHE = (time.monotonic() + conf.BINANCE_SYMBOLS_TTL_MINUTES * 60, symbols)
+        return symbols
     
     def get_depth(self,symbol):
         """Fetch order book depth data for a specific trading symbol.
@@ -107,6 +119,27 @@ class BinanceCollector:
             return None
         return None
 
+    def get_all_funding_rates(self):
+        """Fetch the current funding rate of every futures contract in one request.
+        
+        Uses the premium index endpoint, which returns all symbols when none is
+        given, and converts each rate to percentage format like get_funding_rate.
+        
+        Returns:
+            dict: Mapping of futures symbol to funding rate percentage, empty if request fails
+        """
+        url = "https://fapi.binance.com/fapi/v1/premiumIndex"
+        response = self._api_generic(url)
+        if response is None:
+            return {}
+        funding_rates = {}
+        for entry in response:
+            try:
+                funding_rates[entry["symbol"]] = float(entry["lastFundingRate"]) * 100
+            except (KeyError, TypeError, ValueError):
+                continue
+        return funding_rates
+
     def get_open_interest(self,symbol):
         """Fetch current open interest for a futures contract.
         
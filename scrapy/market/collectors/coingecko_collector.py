@@ -1,8 +1,11 @@
-import requests
-import time
+from concurrent.futures import ThreadPoolExecutor
+from scrapy.market.collectors.http_session import RateLimiter, get_json, get_session
 import scrapy.utils.logger as Logger
 import scrapy.config.settings as conf
 
+# Shared by all collectors and sized to CoinGecko's documented quota
+_RATE_LIMITER = RateLimiter(conf.COINGECKO_RATE_PER_SEC)
+
 class CoinGeckoCollector:
     """Collector for fetching cryptocurrency market data from CoinGecko API.
     
@@ -18,38 +21,33 @@ class CoinGeckoCollector:
                 Defaults to None, which uses conf.API_BASE_DELAY.
         """
         self.base_delay = conf.API_BASE_DELAY
+        self.session = get_session()
         self.logger = Logger.get_logger("CoinGeckoCollector")
     
     def _api_generic(self, url, params=None):
         """Generic API request handler with rate limit handling and retry logic.
         
-        Automatically retries requests when encountering 429 (rate limit) errors
-        with exponential backoff. Logs warnings and errors appropriately.
+        Requests are paced by a limiter shared across threads. 429 responses, which
+        pause that limiter for every thread, and network errors are retried up to
+        API_MAX_RETRIES times with jittered exponential backoff or the server's
+        Retry-After delay (see http_session.get_json).
         
         Args:
             url (str): API endpoint URL
             params (dict, optional): Query parameters for the request. Defaults to None.
             
         Returns:
-            dict: JSON response data, or None if request fails with non-429 error
+            dict: JSON response data, or None if the request failed or retries ran out
         """
-        response = requests.get(url, params=params)
-        time.sleep(self.base_delay) 
-        while response.status_code != 200:
-            if response.status_code == 429:
-                self.logger.warning(f"CoinGecko Rate limit exceeded. Waiting before retrying : {response.status_code} ...")
-                time.sleep(conf.API_BACKOFF_DELAY)
-                response = requests.get(url, params=params)
-            else: 
-                self.logger.error(f"Error with CoinGecko API: {response.status_code}")
-                return None
-        return response.json()
+        return get_json(self.session, _RATE_LIMITER, url, params, self.logger, "CoinGecko")
     
     def top_coin_market(self):
         """Fetch top cryptocurrencies by market cap from CoinGecko.
         
         Retrieves multiple pages of cryptocurrency data ordered by market capitalization.
         Number of items per page and total pages fetched are controlled by configuration.
+        Pages are requested concurrently under the shared rate limiter and kept in
+        page order; a page that fails is skipped.
         
         Returns:
             list: List of cryptocurrency market data dictionaries from all fetched pages
@@ -60,13 +58,13 @@ class CoinGeckoCollector:
             "order": "market_cap_desc",
             "per_page": conf.NUMBER_OF_CRTYPTO_PER_REQUEST,
         }
+        pages = range(1, conf.NUMBER_OF_PAGES_TO_FETCH + 1)
+        with ThreadPoolExecutor(max_workers=min(conf.COINGECKO_MAX_WORKERS, len(pages))) as executor:
+            responses = list(executor.map(lambda page: self._api_generic(url, {**params, "page": page}), pages))
         all_cryptos = []
-        for page in range(1,conf.NUMBER_OF_PAGES_TO_FETCH + 1):
-            params["page"] = page
-            response = requests.get(url, params=params)
-            time.sleep(2)
-            response = self._api_generic(url, params)
-            all_cryptos.extend(response)
+        for response in responses:
+            if response:
+                all_cryptos.extend(response)
         return all_cryptos
     
     def get_global_crypto_data(self):
@@ -128,15 +126,24 @@ class CoinGeckoCollector:
     def coins_markets_details(self,crypto_id):
         """Fetch detailed information for a specific cryptocurrency.
         
-        Retrieves comprehensive data including market metrics, supply information,
-        ATH/ATL data, community stats, and developer activity.
+        Retrieves market metrics, supply information and ATH/ATL data. Localized
+        names, tickers, community stats and developer activity are not requested.
         
         Args:
             crypto_id (str): CoinGecko cryptocurrency identifier (e.g., 'bitcoin')
             
         Returns:
-            dict: Detailed cryptocurrency data including market_data, community_data, and more
+            dict: Cryptocurrency data with its market_data section
         """
         url = f"https://api.coingecko.com/api/v3/coins/{crypto_id}"
-        response = self._api_generic(url)
+        # Only market_data is consumed; skipping the other sections shrinks the payload several times
+        params = {
+            "localization": "false",
+            "tickers": "false",
+            "market_data": "true",
+            "community_data": "false",
+            "developer_data": "false",
+            "sparkline": "false"
+        }
+        response = self._api_generic(url, params)
         return response 
@@ -0,0 +1,171 @@
+import random
+import threading
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import scrapy.config.settings as conf
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+    _json_loads = json.loads
+
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+def get_session() -> requests.Session:
+    """Return the process-wide HTTP session shared by the market data collectors.
+
+    The session keeps TCP/TLS connections alive between API calls. Its adapter pool
+    is sized for the concurrent Binance and CoinGecko workers, and connection-level
+    failures and transient 5xx responses are retried with a short backoff (429
+    responses are still handled by the collectors themselves, behind their limiter).
+    JSON Accept and User-Agent headers are set once for every request.
+
+    Returns:
+        requests.Session: Shared session, created on first use
+    """
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=20,
+                pool_maxsize=50,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.5,
+                    status_forcelist=(500, 502, 503, 504),
+                    raise_on_status=False
+                )
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers.update({"Accept": "application/json", "User-Agent": "scrapy-market/1.0"})
+            _SESSION = session
+    return _SESSION
+
+def close_session():
+    """Close the shared HTTP session and its pooled connections."""
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is not None:
+            _SESSION.close()
+            _SESSION = None
+
+class RateLimiter:
+    """Thread-safe pacing of API requests to at most rate request starts per second.
+    
+    Each call reserves the next free slot under a lock and sleeps outside it, so
+    concurrent workers share one budget and only wait when it is actually exhausted.
+    """
+    
+    def __init__(self, rate: float):
+        """Initialize the limiter.
+        
+        Args:
+            rate (float): Maximum number of requests started per second
+        """
+        self.interval = 1.0 / rate
+        self._next_slot = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def wait(self):
+        """Block until the caller may send its next request."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(self._next_slot, now)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+    
+    def pause(self, seconds: float):
+        """Hold back every caller for the given time, e.g. after a rate limit response.
+        
+        Args:
+            seconds (float): Delay before the next request may start
+        """
+        with self._lock:
+            self._next_slot = max(self._next_slot, time.monotonic() + seconds)
+
+def parse_json(response: requests.Response):
+    """Decode a JSON response body, with orjson when it is installed.
+    
+    orjson parses the large CoinGecko and Binance payloads several times faster than
+    the standard library; json.loads is used as a fallback and accepts the raw bytes too.
+    
+    Args:
+        response (requests.Response): Successful HTTP response
+        
+    Returns:
+        Decoded JSON document
+    """
+    return _json_loads(response.content)
+
+def _retry_delay(response, attempt):
+    """Return how long to wait before retrying a failed request.
+    
+    The server's Retry-After header is honoured when present. A rate limit without
+    it waits at least API_BACKOFF_DELAY, the length of the API ban window, doubled
+    on each further attempt up to four times that; network errors start from one
+    second and are capped at API_BACKOFF_DELAY. A random jitter of up to half the
+    base delay keeps workers that failed together from retrying in lockstep.
+    
+    Args:
+        response (requests.Response): Rate limited response, None after a network error
+        attempt (int): Number of the failed attempt, starting at 0
+        
+    Returns:
+        float: Delay in seconds
+    """
+    if response is None:
+        base = min(conf.API_BACKOFF_DELAY, 2 ** attempt)
+    else:
+        try:
+            return float(response.headers["Retry-After"])
+        except (KeyError, ValueError):
+            base = conf.API_BACKOFF_DELAY * min(2 ** attempt, 4)
+    return base + random.uniform(0, base / 2)
+
+def get_json(session, limiter, url, params, logger, api_name):
+    """GET a JSON document, retrying rate limits and network errors with jittered backoff.
+    
+    Every attempt waits for the shared limiter. A 429 pauses that limiter for all
+    threads; connection errors and timeouts only delay the failing caller (5xx
+    responses are already retried by the session adapter). At most API_MAX_RETRIES
+    retries are made.
+    
+    Args:
+        session (requests.Session): Session sending the request
+        limiter (RateLimiter): Rate limiter of the API
+        url (str): API endpoint URL
+        params (dict): Query parameters, None for none
+        logger: Logger of the calling collector
+        api_name (str): API name used in log messages
+        
+    Returns:
+        Decoded JSON document, or None if the request failed
+    """
+    for attempt in range(conf.API_MAX_RETRIES + 1):
+        limiter.wait()
+        try:
+            response = session.get(url, params=params, timeout=conf.API_REQUEST_TIMEOUT)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            delay = _retry_delay(None, attempt)
+            logger.warning("%s request failed (%s). Retrying in %.1fs ...", api_name, e, delay)
+            time.sleep(delay)
+            continue
+        if response.status_code == 200:
+            return parse_json(response)
+        if response.status_code != 429:
+            logger.error("Error with %s API: %s", api_name, response.status_code)
+            return None
+        delay = _retry_delay(response, attempt)
+        logger.warning("%s Rate limit exceeded. Waiting %.1fs before retrying : %s ...", api_name, delay, response.status_code)
+        # Back off all workers together, not only the one that hit the limit
+        limiter.pause(delay)
+    logger.error("%s API still failing after %d retries: %s", api_name, conf.API_MAX_RETRIES, url)
+    return None
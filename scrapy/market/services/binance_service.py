@@ -1,12 +1,14 @@
 import pandas as pd
 from datetime import datetime, timedelta
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List, Dict
 
 from scrapy.market.collectors.binance_collector import BinanceCollector
 from scrapy.market.services.crypto_listing_service import CryptoListingService
 from scrapy.core.models.crypto import Crypto
 import scrapy.utils.logger as Logger
+import scrapy.config.settings as conf
 
 class BinanceService:
     """Service for fetching and managing cryptocurrency data from Binance exchange.
@@ -15,6 +17,12 @@ class BinanceService:
     data from Binance. Updates the crypto listing service with real-time trading data.
     """
     
+    # Crypto.data keys of the top 3 order book levels: (bid price, bid qty, ask price, ask qty)
+    DEPTH_KEYS = tuple(
+        (f'bids_price_{level}', f'bids_quantity_{level}', f'asks_price_{level}', f'asks_quantity_{level}')
+        for level in range(1, 4)
+    )
+    
     def __init__(self, ListingService, refresh_interval_minutes: int = 60 ):
         """Initialize Binance service with data collector and listing service.
         
@@ -48,31 +56,49 @@ class BinanceService:
         
         Skips cryptocurrencies without Binance symbols and logs warnings/errors
         for failed data retrieval.
+        
+        Funding rates of all contracts come from a single premium index request; depth
+        and open interest have no multi-symbol endpoint and are requested per symbol,
+        concurrently on a pool of BINANCE_MAX_WORKERS threads. The premium index also
+        lists every futures contract, so open interest is only requested for symbols
+        that have one (all of them if the premium index request failed). Results are
+        applied serially once all requests are done.
         """
-        for crypto_id, crypto in self.CryptoListingService.dico_crypto.items():
-            symbol_binance = crypto.symbol_binance
-            if symbol_binance is None:
-                self.logger.warning(f"No Binance symbol for {crypto.name} ({crypto_id})")
-                continue
-            self.logger.info(f"Treatment of {crypto.name} - Symbol Binance: {symbol_binance}")
+        pending = []
+        with ThreadPoolExecutor(max_workers=conf.BINANCE_MAX_WORKERS) as executor:
+            funding = executor.submit(self.binance.get_all_funding_rates)
+            for crypto_id, crypto in self.CryptoListingService.dico_crypto.items():
+                symbol_binance = crypto.symbol_binance
+                if symbol_binance is None:
+                    self.logger.warning(f"No Binance symbol for {crypto.name} ({crypto_id})")
+                    continue
+                pending.append((crypto_id, crypto, executor.submit(self.binance.get_depth, symbol_binance)))
+            funding_rates = funding.result()
+            interests = {
+                crypto_id: executor.submit(self.binance.get_open_interest, crypto.symbol_binance)
+                for crypto_id, crypto, _ in pending
+                if not funding_rates or crypto.symbol_binance in funding_rates
+            }
+        
+        for crypto_id, crypto, depth in pending:
+            self.logger.info("Treatment of %s - Symbol Binance: %s", crypto.name, crypto.symbol_binance)
             try:
-                bids, asks = self.binance.get_depth(symbol_binance)
-                funding_rate = self.binance.get_funding_rate(symbol_binance)
-                open_interest = self.binance.get_open_interest(symbol_binance)
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('bids_price_1', bids[0][0])
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('bids_quantity_1', bids[0][1])
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('bids_price_2', bids[1][0])
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('bids_quantity_2', bids[1][1])
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('bids_price_3', bids[2][0])
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('bids_quantity_3', bids[2][1])
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('asks_price_1', asks[0][0])
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('asks_quantity_1', asks[0][1])
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('asks_price_2', asks[1][0])
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('asks_quantity_2', asks[1][1])
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('asks_price_3', asks[2][0])
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('asks_quantity_3', asks[2][1])
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('funding_rate', funding_rate)
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('open_interest', open_interest)
+                bids, asks = depth.result()
+                funding_rate = funding_rates.get(crypto.symbol_binance)
+                interest = interests.get(crypto_id)
+                open_interest = interest.result() if interest is not None else None
+                if not bids or not asks or len(bids) < 3 or len(asks) < 3:
+                    self.logger.warning("Incomplete order book for %s, skipping", crypto.name)
+                    continue
+                # Every key already exists in Crypto.data, so it is written directly
+                data = crypto.data
+                for (bid_price, bid_quantity, ask_price, ask_quantity), bid, ask in zip(self.DEPTH_KEYS, bids, asks):
+                    data[bid_price] = bid[0]
+                    data[bid_quantity] = bid[1]
+                    data[ask_price] = ask[0]
+                    data[ask_quantity] = ask[1]
+                data['funding_rate'] = funding_rate
+                data['open_interest'] = open_interest
             except IndexError as e:
                 self.logger.warning(f"IndexError for {crypto.name}: {e}")
                 continue
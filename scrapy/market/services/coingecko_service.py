@@ -1,12 +1,15 @@
 import pandas as pd
 from datetime import datetime, timedelta
 import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, islice
 from typing import Optional, List, Dict
 
 from scrapy.market.collectors.coingecko_collector import CoinGeckoCollector
 from scrapy.market.services.crypto_listing_service import CryptoListingService
 from scrapy.core.models.crypto import Crypto
 import scrapy.utils.logger as Logger
+import scrapy.config.settings as conf
 
 
 class CoingeckoService:
@@ -17,6 +20,27 @@ class CoingeckoService:
     service with fresh market data including prices, volumes, and market caps.
     """
     
+    # (Crypto.data key, CoinGecko /coins/markets field)
+    FIELD_MAP = (
+        ('current_price', 'current_price'),
+        ('high_24h', 'high_24h'),
+        ('low_24h', 'low_24h'),
+        ('price_change_24h', 'price_change_24h'),
+        ('price_change_24h_pct', 'price_change_percentage_24h'),
+        ('market_change_24h_pct', 'market_cap_change_percentage_24h'),
+        ('market_change_24h', 'market_cap_change_24h'),
+        ('market_cap', 'market_cap'),
+        ('total_volume', 'total_volume'),
+        ('fully_diluted_valuation', 'fully_diluted_valuation'),
+        ('ath', 'ath'),
+        ('ath_date', 'ath_date'),
+        ('ath_change_percentage', 'ath_change_percentage'),
+        ('atl', 'atl'),
+        ('atl_date', 'atl_date'),
+        ('atl_change_percentage', 'atl_change_percentage'),
+        ('last_updated', 'last_updated'),
+    )
+    
     def __init__(self, ListingService, refresh_interval_minutes: int = 60 ):
         """Initialize CoinGecko service with data collector and listing service.
         
@@ -61,7 +85,7 @@ class CoingeckoService:
         """Fetch and update market data for all tracked cryptocurrencies.
         
         Retrieves current market data from CoinGecko API in batches (max 249 per request)
-        to respect API limits. Updates the listing service cache with:
+        to respect API limits, with up to COINGECKO_MAX_WORKERS batches in flight. Updates the listing service cache with:
         - Current price and 24h high/low
         - Price and market cap changes (24h)
         - Trading volume and market cap
@@ -72,32 +96,18 @@ class CoingeckoService:
         Logs warnings for cryptocurrencies without available data.
         """
         batch_size = 249 
-        crypto_data = []
-        cryptos_id = list(self.CryptoListingService.dico_crypto.keys()) 
-        for i in range(0, len(cryptos_id), batch_size):
-            batch = cryptos_id[i:i + batch_size] 
-            crypto_data_nonExtend = self.CoinGecko.coins_markets(batch)
-            crypto_data.extend(crypto_data_nonExtend)
-        for crypto_id in cryptos_id:
-            self.logger.info(f"Updating Coingecko data for cryptocurrency ID: {crypto_id}")
-            data_crypto_gene = next((crypto for crypto in crypto_data if crypto["id"] == crypto_id), None)
+        ids = iter(self.CryptoListingService.dico_crypto)
+        batches = iter(lambda: tuple(islice(ids, batch_size)), ())
+        # Batches are independent requests, fetched concurrently and flattened in order
+        with ThreadPoolExecutor(max_workers=conf.COINGECKO_MAX_WORKERS) as executor:
+            results = executor.map(self.CoinGecko.coins_markets, batches)
+            crypto_data = list(chain.from_iterable(result or [] for result in results))
+        by_id = {crypto["id"]: crypto for crypto in crypto_data}
+        for crypto_id, crypto in self.CryptoListingService.dico_crypto.items():
+            self.logger.info("Updating Coingecko data for cryptocurrency ID: %s", crypto_id)
+            data_crypto_gene = by_id.get(crypto_id)
             if data_crypto_gene:
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('current_price',data_crypto_gene.get('current_price'))
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('high_24h',data_crypto_gene.get('high_24h'))
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('low_24h',data_crypto_gene.get('low_24h'))
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('price_change_24h',data_crypto_gene.get('price_change_24h'))
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('price_change_24h_pct',data_crypto_gene.get('price_change_percentage_24h'))
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('market_change_24h_pct',data_crypto_gene.get('market_cap_change_percentage_24h'))
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('market_change_24h',data_crypto_gene.get('market_cap_change_24h'))
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('market_cap',data_crypto_gene.get('market_cap'))
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('total_volume',data_crypto_gene.get('total_volume'))
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('fully_diluted_valuation',data_crypto_gene.get('fully_diluted_valuation'))
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('ath',data_crypto_gene.get('ath'))
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('ath_date',data_crypto_gene.get('ath_date'))
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('ath_change_percentage',data_crypto_gene.get('ath_change_percentage'))
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('atl',data_crypto_gene.get('atl'))
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('atl_date',data_crypto_gene.get('atl_date'))
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('atl_change_percentage',data_crypto_gene.get('atl_change_percentage'))
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('last_updated',data_crypto_gene.get('last_updated'))
+                get = data_crypto_gene.get
+                crypto.update_many((key, get(field)) for key, field in self.FIELD_MAP)
             else:
                 self.logger.warning(f"No data found for cryptocurrency ID: {crypto_id}")
\ No newline at end of file
@@ -15,6 +15,9 @@ class CryptoListingService:
     data updates across multiple exchanges.
     """
     
+    # Quote assets tried in order of preference when pairing a coin with a Binance symbol
+    BINANCE_QUOTES = ("USDT", "BUSD", "BTC")
+    
     def __init__(self, refresh_interval_minutes: int = 60):
         """Initialize crypto listing service with data collectors.
         
@@ -124,17 +127,11 @@ class CryptoListingService:
             self.logger.critical("Failed to retrieve cryptocurrency data from CoinGecko.")
             return
 
+        quotes = self.BINANCE_QUOTES
         for coin in all_coin:
-            name = coin["name"]
             symbol = coin["symbol"].upper()
-            id_coingecko = coin["id"]
-            rank = coin["market_cap_rank"]
-            symbol_upper = coin["symbol"].upper()
-            symbol_binance = None
-            for quote in ["USDT", "BUSD", "BTC"]:
-                pair = f"{symbol_upper}{quote}"
-                if pair in all_binance_symbols:
-                    symbol_binance = pair
-                    break
-            self._add_crypto_to_cache(name, symbol, id_coingecko, rank, symbol_binance)
-    
\ No newline at end of file
+            symbol_binance = next(
+                (pair for pair in (symbol + quote for quote in quotes) if pair in all_binance_symbols),
+                None
+            )
+            self._add_crypto_to_cache(coin["name"], symbol, coin["id"], coin["market_cap_rank"], symbol_binance)
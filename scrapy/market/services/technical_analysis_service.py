@@ -2,7 +2,17 @@ import pandas as pd
 from datetime import datetime, timedelta
 import time
 from typing import Optional, List, Dict
-from scrapy.market.metrics.metrics import *
+from scrapy.market.metrics.metrics import (
+    volume_data,
+    calcul_variation_price,
+    get_supply,
+    calculer_pivot_support_resistance,
+    calcul_rsi,
+    calcul_macd,
+    moving_averages,
+    calculate_poc,
+    fibonacci_levels,
+)
 from scrapy.market.services.crypto_listing_service import CryptoListingService
 from scrapy.market.services.coingecko_service import CoingeckoService
 from scrapy.core.models.crypto import Crypto
@@ -22,6 +32,20 @@ class TechnicalAnalysisService:
     Updates are performed periodically for all tracked cryptocurrencies.
     """
     
+    # Keys copied as-is from the volume_data result
+    VOLUME_KEYS = (
+        'volume_actuel', 'volume_1j', 'volume_7j', 'volume_30j',
+        'variation_1j', 'variation_7j', 'variation_30j',
+        'volume_moyen_30j', 'variation_moyenne_30j', 'volume_moyen_7j',
+        'variation_moyenne_7j', 'volume_moyen_1j', 'variation_moyenne_1j'
+    )
+    # (Crypto.data key, calcul_variation_price period, field)
+    PRICE_VARIATION_KEYS = tuple(
+        (f'd{period[:-1]}_{field}', period, field)
+        for period in ('1d', '7d', '14d', '30d')
+        for field in ('percentage', 'value', 'vs_avg', 'mean')
+    )
+    
     def __init__(self, ListingService, CoingeckoService, refresh_interval_minutes: int = 60 ):
         """Initialize technical analysis service with data providers.
         
@@ -40,7 +64,7 @@ class TechnicalAnalysisService:
         """Refresh internal cache (placeholder for future implementation)."""
         dico_crypto = {}
     
-    def perform_analysis(self):
+    def perform_analysis(self, on_batch=None, batch_size: int = None):
         """Perform complete technical analysis for all tracked cryptocurrencies.
         
         For each cryptocurrency:
@@ -58,87 +82,72 @@ class TechnicalAnalysisService:
         3. Updates cryptocurrency data dictionary with calculated values
         
         Logs errors for individual cryptocurrencies but continues processing others.
+        
+        Args:
+            on_batch (callable, optional): Called with the list of crypto ids of each
+                analyzed batch, so their rows can be stored while the next batch is fetched
+            batch_size (int, optional): Cryptos per batch. Defaults to all cryptos in one batch.
         """
         cryptos_id = list(self.CryptoListingService.dico_crypto.keys()) 
-        for crypto_id in cryptos_id:
-            data_market = self.CoingeckoService.coin_market_chart_range(crypto_id, 30)
-            data_coin = self.CoingeckoService.coins_markets_details(crypto_id)
-
-            volume_variation = volume_data(data_market)
-            price_variation = calcul_variation_price(data_market,crypto_id)
-            circulating_supply, total_supply, max_supply = get_supply(crypto_id,data_coin)
-            PP, R1, R2, S1, S2 = calculer_pivot_support_resistance(crypto_id,data_coin)
-            rsi = calcul_rsi(data_market)
-            macd_h, signal_line_h, histogram_h = calcul_macd(data_market)
-            macd_j, signal_line_j, histogram_j = calcul_macd(data_market, 12*24, 26*24, 9*24)
-            df = moving_averages(data_market)
-            POC = calculate_poc(data_market)
-            fib_levels_1, fib_levels_2, fib_levels_3, fib_levels_4, fib_levels_5, fib_levels_6, fib_levels_7 = fibonacci_levels(data_market)
-            try:
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('volume_actuel', volume_variation['volume_actuel'])
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('volume_1j', volume_variation['volume_1j'])
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('volume_7j', volume_variation['volume_7j'])
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('volume_30j', volume_variation['volume_30j'])
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('variation_1j', volume_variation['variation_1j'])
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('variation_7j', volume_variation['variation_7j'])
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('variation_30j', volume_variation['variation_30j'])
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('volume_moyen_30j', volume_variation['volume_moyen_30j'])
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('variation_moyenne_30j', volume_variation['variation_moyenne_30j'])
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('volume_moyen_7j', volume_variation['volume_moyen_7j'])
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('variation_moyenne_7j', volume_variation['variation_moyenne_7j'])
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('volume_moyen_1j', volume_variation['volume_moyen_1j'])
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('variation_moyenne_1j', volume_variation['variation_moyenne_1j'])
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('current_price', price_variation['current_price'])
+        batch_size = batch_size or len(cryptos_id) or 1
+        for start in range(0, len(cryptos_id), batch_size):
+            batch = cryptos_id[start:start + batch_size]
+            for crypto_id in batch:
+                data_market = self.CoingeckoService.coin_market_chart_range(crypto_id, 30)
+                data_coin = self.CoingeckoService.coins_markets_details(crypto_id)
+                if data_market is None or data_coin is None:
+                    self.logger.error("No CoinGecko data for %s, skipping technical analysis", crypto_id)
+                    continue
 
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('d1_percentage', round(float(price_variation["1d"]["percentage"]), 8))
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('d1_value', round(float(price_variation["1d"]["value"]), 8))
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('d1_vs_avg', round(float(price_variation["1d"]["vs_avg"]), 8))
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('d1_mean', round(float(price_variation["1d"]["mean"]), 8))
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('d7_percentage', round(float(price_variation["7d"]["percentage"]), 8))
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('d7_value', round(float(price_variation["7d"]["value"]), 8))
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('d7_vs_avg', round(float(price_variation["7d"]["vs_avg"]), 8))
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('d7_mean', round(float(price_variation["7d"]["mean"]), 8))
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('d14_percentage', round(float(price_variation["14d"]["percentage"]), 8))
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('d14_value', round(float(price_variation["14d"]["value"]), 8))
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('d14_vs_avg', round(float(price_variation["14d"]["vs_avg"]), 8))
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('d14_mean', round(float(price_variation["14d"]["mean"]), 8))
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('d30_percentage', round(float(price_variation["30d"]["percentage"]), 8))
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('d30_value', round(float(price_variation["30d"]["value"]), 8))
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('d30_vs_avg', round(float(price_variation["30d"]["vs_avg"]), 8))
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('d30_mean', round(float(price_variation["30d"]["mean"]), 8))
-
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('circulating_supply', circulating_supply)
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('total_supply', total_supply)
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('max_supply', max_supply)
-
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('PP', PP)
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('R1', R1)
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('R2', R2)
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('S1', S1)
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('S2', S2)
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('rsi_values', rsi.iloc[-1])
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('macd_h', macd_h.iloc[-1])
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('signal_line_h', signal_line_h.iloc[-1])
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('histogram_h', histogram_h.iloc[-1])
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('macd_j', macd_j.iloc[-1])
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('signal_line_j', signal_line_j.iloc[-1])
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('histogram_j', histogram_j.iloc[-1])
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('sma_50', df['SMA_50'].iloc[-1])
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('sma_200', df['SMA_200'].iloc[-1])
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('ema_50', df['EMA_50'].iloc[-1])
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('ema_200', df['EMA_200'].iloc[-1])
-                self.CryptoListingService.dico_crypto[crypto_id].update_data('POC', POC)
+                volume_variation = volume_data(data_market)
+                price_variation = calcul_variation_price(data_market,crypto_id)
+                circulating_supply, total_supply, max_supply = get_supply(crypto_id,data_coin)
+                PP, R1, R2, S1, S2 = calculer_pivot_support_resistance(crypto_id,data_coin)
+                rsi = calcul_rsi(data_market)
+                macd_h, signal_line_h, histogram_h = calcul_macd(data_market)
+                macd_j, signal_line_j, histogram_j = calcul_macd(data_market, 12*24, 26*24, 9*24)
+                df = moving_averages(data_market)
+                POC = calculate_poc(data_market)
+                fib_levels_1, fib_levels_2, fib_levels_3, fib_levels_4, fib_levels_5, fib_levels_6, fib_levels_7 = fibonacci_levels(data_market)
                 try:
-                    self.CryptoListingService.dico_crypto[crypto_id].update_data('fib_levels_1', fib_levels_1)
-                    self.CryptoListingService.dico_crypto[crypto_id].update_data('fib_levels_2', fib_levels_2)
-                    self.CryptoListingService.dico_crypto[crypto_id].update_data('fib_levels_3', fib_levels_3)
-                    self.CryptoListingService.dico_crypto[crypto_id].update_data('fib_levels_4', fib_levels_4)
-                    self.CryptoListingService.dico_crypto[crypto_id].update_data('fib_levels_5', fib_levels_5)
-                    self.CryptoListingService.dico_crypto[crypto_id].update_data('fib_levels_6', fib_levels_6)
-                    self.CryptoListingService.dico_crypto[crypto_id].update_data('fib_levels_7', fib_levels_7)
-                except Exception as e:
-                    self.logger.error(f"Error updating Fibonacci levels for {crypto_id}: {e}")
+                    values = {key: volume_variation[key] for key in self.VOLUME_KEYS}
+                    values['current_price'] = price_variation['current_price']
+                    for key, period, field in self.PRICE_VARIATION_KEYS:
+                        values[key] = round(float(price_variation[period][field]), 8)
+                    values.update(
+                        circulating_supply=circulating_supply,
+                        total_supply=total_supply,
+                        max_supply=max_supply,
+                        pp=PP,
+                        r1=R1,
+                        r2=R2,
+                        s1=S1,
+                        s2=S2,
+                        rsi_values=rsi.iloc[-1],
+                        macd_h=macd_h.iloc[-1],
+                        signal_line_h=signal_line_h.iloc[-1],
+                        histogram_h=histogram_h.iloc[-1],
+                        macd_j=macd_j.iloc[-1],
+                        signal_line_j=signal_line_j.iloc[-1],
+                        histogram_j=histogram_j.iloc[-1],
+                        sma_50=df['SMA_50'].iloc[-1],
+                        sma_200=df['SMA_200'].iloc[-1],
+                        ema_50=df['EMA_50'].iloc[-1],
+                        ema_200=df['EMA_200'].iloc[-1],
+                        poc=POC,
+                        fib_levels_1=fib_levels_1,
+                        fib_levels_2=fib_levels_2,
+                        fib_levels_3=fib_levels_3,
+                        fib_levels_4=fib_levels_4,
+                        fib_levels_5=fib_levels_5,
+                        fib_levels_6=fib_levels_6,
+                        fib_levels_7=fib_levels_7,
+                    )
+                    # Every key already exists in Crypto.data, so it is written directly
+                    self.CryptoListingService.dico_crypto[crypto_id].data.update(values)
 
-            except Exception as e:
-                self.logger.error(f"Error updating technical analysis data for {crypto_id}: {e}")
-                continue
+                except Exception as e:
+                    self.logger.error(f"Error updating technical analysis data for {crypto_id}: {e}")
+                    continue
+            if on_batch is not None:
+                on_batch(batch)
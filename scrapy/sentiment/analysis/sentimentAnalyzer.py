@@ -1,7 +1,7 @@
 import re
+from concurrent.futures import ThreadPoolExecutor
 import torch
 from transformers import AutoTokenizer, AutoModelForSequenceClassification
-from unidecode import unidecode
 
 import scrapy.config.settings as conf
 import scrapy.utils.logger as Logger
@@ -14,13 +14,21 @@ class SentimentAnalyzer:
     Supports multi-entity detection and clause-level sentiment attribution.
     """
     
+    TOKEN_RE = re.compile(r"[^\W_]+")
+    URL_RE = re.compile(r"(https?://\S+|www\.\S+)")
+    
     def __init__(self):
         """Initialize sentiment analyzer with pre-trained model and financial keyword dictionaries."""
         self.MODEL_NAME = conf.SENTIMENT_MODEL_NAME
-        self.tokenizer = AutoTokenizer.from_pretrained(self.MODEL_NAME)
+        self.logger = Logger.get_logger("SentimentAnalyzer")
+        self.tokenizer = AutoTokenizer.from_pretrained(self.MODEL_NAME, use_fast=True)
+        if not self.tokenizer.is_fast:
+            self.logger.warning("No fast tokenizer available for %s, falling back to the Python one", self.MODEL_NAME)
         self.model = AutoModelForSequenceClassification.from_pretrained(self.MODEL_NAME)
         self.model.eval()
-        self.logger = Logger.get_logger("SentimentAnalyzer")
+        # Models without segment embeddings (DeBERTa-v3, RoBERTa) ignore token_type_ids
+        self.use_token_type_ids = getattr(self.model.config, "type_vocab_size", 0) > 1
+        self._norm_cache = {}
 
         self.COMPARATORS = ["while", "but", "whereas", "however", "although", "though"]
         
@@ -157,15 +165,24 @@ class SentimentAnalyzer:
         Returns:
             float: Sentiment score from -1.0 (very negative) to 1.0 (very positive)
         """
-        left, right = self.split_clauses(text)
-        clause = left if entity.lower() in left else (right if entity.lower() in right else text)
+        clause = self._entity_clause(text, entity)
         
-        inputs = self.tokenizer(clause, entity, return_tensors="pt", truncation=True, max_length=128)
+        inputs = self.tokenizer(clause, entity, return_tensors="pt", truncation=True, max_length=128,
+                                return_token_type_ids=self.use_token_type_ids)
         
         with torch.no_grad():
             outputs = self.model(**inputs)
             probs = torch.softmax(outputs.logits, dim=-1)[0]
         
+        return self._score_from_probs(clause, probs)
+    
+    def _entity_clause(self, text: str, entity: str) -> str:
+        """Select the clause of the text that mentions the entity, or the full text."""
+        left, right = self.split_clauses(text)
+        return left if entity.lower() in left else (right if entity.lower() in right else text)
+    
+    def _score_from_probs(self, clause: str, probs) -> float:
+        """Turn model class probabilities (neg, neu, pos) into an adjusted sentiment score."""
         p_neg = probs[0].item()
         p_pos = probs[2].item()
         p_neu = probs[1].item()
@@ -186,15 +203,46 @@ class SentimentAnalyzer:
             str: Normalized text
         """
         text = text.lower()
-        text = re.sub(r"(https?://\S+|www\.\S+)", "", text)
-        text = re.sub(r"\s+", " ", text).strip()
-        return text
+        if "http" in text or "www." in text:
+            text = self.URL_RE.sub("", text)
+        return " ".join(text.split())
+
+    def _normalized_cryptos(self, crypto_list: list[str]) -> tuple:
+        """Return the normalized-name index for a crypto list, computed once per list.
+        
+        The index is cached by list identity since the coordinator passes the
+        same list for every tweet of a cycle. Every alphanumeric run of a name must
+        appear as a whole token in the text for a word-boundary match, so names are
+        bucketed by their first run and only the buckets present in a tweet are scanned.
+        
+        Args:
+            crypto_list (list[str]): List of cryptocurrency names/symbols
+            
+        Returns:
+            tuple: (index, unindexed) where index maps a first token to a list of
+                (normalized, original) pairs and unindexed holds names without tokens
+        """
+        key = id(crypto_list)
+        cached = self._norm_cache.get(key)
+        if cached is None or cached[0] is not crypto_list:
+            index = {}
+            unindexed = []
+            for crypto_norm, crypto_original in {self.normalize(c): c for c in crypto_list}.items():
+                tokens = self.TOKEN_RE.findall(crypto_norm)
+                if tokens:
+                    index.setdefault(tokens[0], []).append((crypto_norm, crypto_original))
+                else:
+                    unindexed.append((crypto_norm, crypto_original))
+            cached = (crypto_list, (index, unindexed))
+            self._norm_cache[key] = cached
+        return cached[1]
 
     def detect_crypto_entities(self, text: str, crypto_list: list[str]) -> dict:
         """Detect cryptocurrency mentions and their positions in text.
         
         Performs case-insensitive exact matching with word boundary detection
-        to avoid false positives from partial matches.
+        to avoid false positives from partial matches. Only names whose first
+        token occurs in the text are searched.
         
         Args:
             text (str): Text to search
@@ -206,9 +254,14 @@ class SentimentAnalyzer:
         """
         found = {}
         text_lower = text.lower()
-        normalized_cryptos = {self.normalize(c): c for c in crypto_list}
+        index, unindexed = self._normalized_cryptos(crypto_list)
+        candidates = list(unindexed)
+        for token in set(self.TOKEN_RE.findall(text_lower)):
+            bucket = index.get(token)
+            if bucket:
+                candidates.extend(bucket)
         
-        for crypto_norm, crypto_original in normalized_cryptos.items():
+        for crypto_norm, crypto_original in candidates:
             start = 0
             while True:
                 pos = text_lower.find(crypto_norm, start)
@@ -245,3 +298,52 @@ class SentimentAnalyzer:
         for entity in crypto_positions.keys():
             results[entity] = self.sentiment_score_for_entity(text, entity)
         return results
+    
+    def analyze_tweets_batch(self, texts: list[str], cryptos: list[str]) -> list[dict]:
+        """Analyze sentiment for all cryptocurrency mentions across several tweets.
+        
+        Collects every (clause, entity) pair from the batch and scores them with
+        padded model calls of conf.SENTIMENT_BATCH_SIZE pairs instead of one call
+        per entity.
+        
+        Args:
+            texts (list[str]): Tweet contents to analyze
+            cryptos (list[str]): List of cryptocurrency names/symbols to search for
+            
+        Returns:
+            list[dict]: One dictionary per tweet mapping crypto names to sentiment
+                scores [-1.0 to 1.0], empty for tweets with no crypto detected
+        """
+        results = [{} for _ in texts]
+        pairs = []
+        for i, text in enumerate(texts):
+            for entity in self.detect_crypto_entities(text, cryptos):
+                pairs.append((i, entity, self._entity_clause(text, entity)))
+        
+        batch_size = conf.SENTIMENT_BATCH_SIZE
+        batches = [pairs[start:start + batch_size] for start in range(0, len(pairs), batch_size)]
+        if not batches:
+            return results
+        
+        # The Rust tokenizer releases the GIL, so the next batch is tokenized during the forward pass
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pending = executor.submit(self._tokenize_pairs, batches[0])
+            for n, batch in enumerate(batches):
+                inputs = pending.result()
+                if n + 1 < len(batches):
+                    pending = executor.submit(self._tokenize_pairs, batches[n + 1])
+                with torch.no_grad():
+                    outputs = self.model(**inputs)
+                    probs = torch.softmax(outputs.logits, dim=-1)
+                for (i, entity, clause), row in zip(batch, probs):
+                    results[i][entity] = self._score_from_probs(clause, row)
+        return results
+    
+    def _tokenize_pairs(self, batch: list[tuple]):
+        """Tokenize a batch of (tweet_index, entity, clause) pairs into padded model inputs."""
+        return self.tokenizer(
+            [clause for _, _, clause in batch],
+            [entity for _, entity, _ in batch],
+            return_tensors="pt", padding=True, truncation=True, max_length=128,
+            return_token_type_ids=self.use_token_type_ids
+        )
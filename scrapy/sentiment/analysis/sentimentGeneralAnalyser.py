@@ -17,32 +17,20 @@ class SentimentGeneralAnalyser:
     def analyze_sentiments(self):
         """Analyze and aggregate sentiment scores for all cryptocurrencies.
         
-        For each tracked cryptocurrency, retrieves sentiment data from the last
-        12 and 24 hours, calculates average scores and tweet counts, then stores
-        the aggregated results. Skips cryptocurrencies with no recent sentiment data.
+        Retrieves the average score and tweet count over the last 12 and 24 hours
+        for each cryptocurrency in a single aggregate query, then stores all results
+        in one batch. Cryptocurrencies with no recent sentiment data are skipped.
         """
-        crypto_list = self.db.get_all_crypto_id()
-        for crypto_id in crypto_list:
-            sentiments_12h = self.db.get_sentiments_for_crypto_12h(crypto_id)
-            sentiments_24h = self.db.get_sentiments_for_crypto_24h(crypto_id)
-            
-            if not sentiments_12h and not sentiments_24h:
-                self.logger.warning(f"No sentiment data for crypto_id {crypto_id}")
-                continue
-            
-            if sentiments_12h:
-                avg_score_12h = sum(sentiments_12h) / len(sentiments_12h)
-                count_12h = len(sentiments_12h)
-            else:
-                avg_score_12h = 0.0
-                count_12h = 0
-            
-            if sentiments_24h:
-                avg_score_24h = sum(sentiments_24h) / len(sentiments_24h)
-                count_24h = len(sentiments_24h)
-            else:
-                avg_score_24h = 0.0
-                count_24h = 0
-            
-            self.db.insert_sentiment_score(crypto_id, avg_score_12h, count_12h, avg_score_24h, count_24h)
-            self.logger.info(f"Analyzed crypto_id {crypto_id}: 12h={avg_score_12h:.3f} ({count_12h} tweets), 24h={avg_score_24h:.3f} ({count_24h} tweets)")
\ No newline at end of file
+        aggregates = self.db.get_sentiment_aggregates()
+        if not aggregates:
+            self.logger.warning("No sentiment data in the last 24h")
+            return
+        
+        for crypto_id, avg_score_12h, count_12h, avg_score_24h, count_24h in aggregates:
+            self.logger.info(f"Analyzed crypto_id {crypto_id}: 12h={avg_score_12h:.3f} ({count_12h} tweets), 24h={avg_score_24h:.3f} ({count_24h} tweets)")
+        
+        self.db.insert_sentiment_scores(aggregates)
+    
+    def close(self):
+        """Return the database connection to the pool."""
+        self.db.close()
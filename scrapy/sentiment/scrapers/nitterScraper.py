@@ -18,6 +18,15 @@ import os
 import scrapy.utils.logger as Logger
 import scrapy.config.settings as conf
 
+_DRIVER_PATH = None
+
+def _driver_path():
+    """Return the ChromeDriver binary path, resolving it only once per process."""
+    global _DRIVER_PATH
+    if _DRIVER_PATH is None:
+        _DRIVER_PATH = ChromeDriverManager().install()
+    return _DRIVER_PATH
+
 class NitterScraper:
     """Scraper for Nitter (Twitter mirror) to extract tweets from specific accounts."""
     
@@ -54,6 +63,8 @@ class NitterScraper:
         chrome_options.add_argument("--disable-software-rasterizer")
         chrome_options.add_argument("--disable-extensions")
         chrome_options.add_argument("--window-size=1920,1080")
+        chrome_options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+        chrome_options.page_load_strategy = 'eager'
         profile_dir = tempfile.mkdtemp(prefix="chrome_profile_")
         chrome_options.add_argument(f"--user-data-dir={profile_dir}")
         if headless:
@@ -62,7 +73,7 @@ class NitterScraper:
             chrome_options.add_argument("start-maximized")
         try:
             #chrome_options.binary_location = "/usr/bin/google-chrome" # Uncomment and set path if needed
-            service = Service(ChromeDriverManager().install())
+            service = Service(_driver_path())
             driver = webdriver.Chrome(service=service, options=chrome_options)
             self.logger.info("Chrome WebDriver initialized successfully")
             return driver
@@ -102,7 +113,12 @@ class NitterScraper:
                     self.wait.until(
                         EC.presence_of_element_located((By.CSS_SELECTOR, "div.tweet-content"))
                     )
-                    time.sleep(1)
+                    try:
+                        WebDriverWait(self.driver, 1).until(
+                            lambda d: len(d.find_elements(By.CSS_SELECTOR, "div.tweet-content")) >= 5
+                        )
+                    except TimeoutException:
+                        pass
                     if save_html:
                         html_path = os.path.join(self.html_dir, f"twitter_search_{account}.html")
                         with open(html_path, "w", encoding="utf-8") as f:
@@ -136,25 +152,26 @@ class NitterScraper:
             account (str): Twitter account handle that was scraped
             
         Returns:
-            list: List of dictionaries containing tweet data:
+            dict: Column-oriented tweet data, one list per field with one entry per tweet:
                 - pseudo: Username
-                - account: Account handle
                 - content: Cleaned tweet content
                 - hash_content: SHA256 hash of content
-                - content_raw: Original tweet content
                 - timestamp: Unix timestamp
-                - date_str: Formatted date string
-                - date_full: Full date string from HTML
         """
+        data = {
+            "pseudo": [],
+            "content": [],
+            "hash_content": [],
+            "timestamp": [],
+        }
         html_path = os.path.join(self.html_dir, f"twitter_search_{account}.html")
         if not os.path.exists(html_path):
             self.logger.error(f"HTML file not found: {html_path}")
-            return []
+            return data
         try:
             with open(html_path, "r", encoding="utf-8") as file:
                 html_content = file.read()
             soup = BeautifulSoup(html_content, "lxml")
-            data = []
             tweets = soup.find_all("div", class_="tweet-body")
             for tweet in tweets:
                 try:
@@ -180,31 +197,24 @@ class NitterScraper:
                             self.logger.warning(f"Could not parse date: {full_date_str}")
                             continue
                     timestamp = int(dt.timestamp())
-                    date_formatted = dt.strftime("%Y-%m-%d %H:%M:%S")
                     content_elem = tweet.find("div", class_="tweet-content")
                     if not content_elem:
                         continue
                     content = content_elem.text.strip()
                     content_cleaned = self._clean_tweet(content)
                     
-                    data.append({
-                        "pseudo": pseudo,
-                        "account": account,
-                        "content": content_cleaned,
-                        "hash_content": hashlib.sha256(content_cleaned.encode()).hexdigest(),
-                        "content_raw": content,
-                        "timestamp": timestamp,
-                        "date_str": date_formatted,  
-                        "date_full": full_date_str  
-                    })
+                    data["pseudo"].append(pseudo)
+                    data["content"].append(content_cleaned)
+                    data["hash_content"].append(hashlib.sha256(content_cleaned.encode()).hexdigest())
+                    data["timestamp"].append(timestamp)
                 except Exception as e:
                     self.logger.warning(f"Error parsing tweet: {e}")
                     continue
-            self.logger.info(f"{account}: {len(data)} tweets parsed")
+            self.logger.info("%s: %d tweets parsed", account, len(data['content']))
             return data
         except Exception as e:
             self.logger.error(f"Error parsing {account}: {e}")
-            return []
+            return {key: [] for key in data}
 
 
     def _clean_tweet(self, tweet):
@@ -1,3 +1,8 @@
+import queue
+import threading
+import time
+from itertools import compress
+
 from scrapy.sentiment.scrapers.nitterScraper import NitterScraper
 from scrapy.data.database import CryptoDatabase as SentimentDatabase
 from scrapy.sentiment.analysis.sentimentAnalyzer import SentimentAnalyzer
@@ -26,52 +31,163 @@ class SentimentCoordinator:
         self.all_crypto_list = self.db.get_crypto_list()
         self.logger = Logger.get_logger("SentimentCoordinator")
     
+    def _scrape_worker(self, accounts, tweet_queue):
+        """Scrape and parse each account, pushing (account, tweets) onto the queue.
+        
+        Runs in a background thread so page loads overlap with sentiment analysis.
+        Failed accounts are pushed with tweets set to None. A final None marks the end.
+        
+        Args:
+            accounts (list): List of social media account handles to scrape
+            tweet_queue (queue.Queue): Bounded queue consumed by process_account
+        """
+        try:
+            for account in accounts:
+                try:
+                    if self.scraper.scrape_account(account):
+                        tweet_queue.put((account, self.scraper.parse_account(account)))
+                    else:
+                        tweet_queue.put((account, None))
+                except Exception as e:
+                    self.logger.error("Error scraping account %s: %s", account, e)
+                    tweet_queue.put((account, None))
+        finally:
+            tweet_queue.put(None)
+    
+    def _store_account(self, account, contents, hashes, timestamps, sentiment_results, crypto_ids):
+        """Store the tweets of one account that mention at least one crypto.
+        
+        Aggregates scores when multiple crypto identifiers (symbol/name) point to the
+        same cryptocurrency. Hashes, sentiments and links are committed in a single
+        transaction; if one of them fails the whole account is rolled back.
+        
+        Args:
+            account (str): Account handle the tweets belong to
+            contents (list): Tweet texts
+            hashes (list): Tweet content hashes, aligned with contents
+            timestamps (list): Tweet timestamps, aligned with contents
+            sentiment_results (list): Per-tweet {crypto: score} dicts, aligned with contents
+            crypto_ids (dict): Cache of crypto name/symbol to crypto_id, shared across accounts
+        """
+        first_seen = {}
+        for i, results in enumerate(sentiment_results):
+            if results:
+                first_seen.setdefault(hashes[i], i)
+        mentioned = list(first_seen.values())
+        if not mentioned:
+            return
+        
+        with self.db.transaction():
+            tweet_ids = self.db.insert_tweet_hashes([hashes[i] for i in mentioned])
+            if not tweet_ids:
+                self.logger.error("Failed to insert tweet hashes for %s, skipping", account)
+                return
+            
+            sentiment_rows = []
+            link_rows = []
+            for i in mentioned:
+                tweet_id = tweet_ids.get(hashes[i])
+                if tweet_id is None:
+                    continue
+                sentiment_rows.append((tweet_id, account, contents[i], timestamps[i]))
+                
+                # Deduplicate by crypto_id (symbol and name can point to same crypto)
+                crypto_scores = {}
+                for crypto_name, sentiment_score in sentiment_results[i].items():
+                    if crypto_name not in crypto_ids:
+                        crypto_ids[crypto_name] = self.db.get_crypto_id_by_symbol_or_name(crypto_name)
+                    crypto_id = crypto_ids[crypto_name]
+                    if crypto_id is not None:
+                        crypto_scores.setdefault(crypto_id, []).append(sentiment_score)
+                
+                # Insert once per crypto with averaged scores
+                for crypto_id, scores in crypto_scores.items():
+                    link_rows.append((tweet_id, crypto_id, round(sum(scores) / len(scores), 3)))
+            
+            self.db.insert_tweet_sentiments(sentiment_rows)
+            self.db.link_tweets_to_cryptos(link_rows)
+    
+    def _flush(self, pending, crypto_ids):
+        """Analyze the pending tweets of several accounts in one batch, then store each account.
+        
+        Args:
+            pending (list): (account, contents, hashes, timestamps) tuples
+            crypto_ids (dict): Cache of crypto name/symbol to crypto_id
+        """
+        contents = [text for _, account_contents, _, _ in pending for text in account_contents]
+        try:
+            sentiment_results = self.analyzer.analyze_tweets_batch(contents, self.all_crypto_list)
+        except Exception as e:
+            self.logger.error("Error analyzing tweets of %d accounts: %s", len(pending), e)
+            return
+        
+        offset = 0
+        for account, account_contents, hashes, timestamps in pending:
+            results = sentiment_results[offset:offset + len(account_contents)]
+            offset += len(account_contents)
+            try:
+                self._store_account(account, account_contents, hashes, timestamps, results, crypto_ids)
+            except Exception as e:
+                self.logger.error(f"Error processing account {account}: {e}")
+    
     def process_account(self, accounts):
         """Process tweets from multiple social media accounts.
         
-        For each account, scrapes recent tweets, analyzes sentiment for crypto mentions,
-        and stores results. Handles deduplication by tweet hash and aggregates scores
-        when multiple crypto identifiers (symbol/name) point to the same cryptocurrency.
+        Scraping runs in a producer thread feeding a bounded queue while this thread
+        consumes it. For each scraped account, filters out already processed tweets
+        with a single hash lookup. The remaining tweets are pooled across accounts and
+        analyzed in one batch once SENTIMENT_FLUSH_TWEETS are waiting or the oldest has
+        waited SENTIMENT_FLUSH_SECONDS, so accounts with few new tweets still fill the
+        model's batches. Results are then written per account (see _store_account).
         
         Args:
             accounts (list): List of social media account handles to process
         """
-        for account in accounts:
+        crypto_ids = {}
+        pending = []
+        pending_count = 0
+        deadline = None
+        tweet_queue = queue.Queue(maxsize=conf.SENTIMENT_QUEUE_SIZE)
+        producer = threading.Thread(target=self._scrape_worker, args=(accounts, tweet_queue), daemon=True)
+        producer.start()
+        while True:
             try:
-                success = self.scraper.scrape_account(account)
-                if success:
-                    tweets = self.scraper.parse_account(account)
-                    for tweet in tweets:
-                        if self.db.check_tweet_exists(tweet['hash_content']):
-                            self.logger.info(f"Tweet already processed, skipping: {tweet['content'][:30]}...")
-                            continue  
-                        sentiment_results = self.analyzer.analyze_tweet(tweet['content'], self.all_crypto_list)
-                        if sentiment_results:
-                            tweet_id = self.db.insert_tweet_hash(tweet['hash_content'])
-                            if tweet_id is None:
-                                self.logger.error(f"Failed to insert tweet hash, skipping tweet")
-                                continue
-                                
-                            self.db.insert_tweet_sentiment(tweet_id, account, tweet['content'], tweet['timestamp'])
-                            
-                            # Deduplicate by crypto_id (symbol and name can point to same crypto)
-                            crypto_scores = {}
-                            for crypto_name, sentiment_score in sentiment_results.items():
-                                crypto_id = self.db.get_crypto_id_by_symbol_or_name(crypto_name)
-                                if crypto_id is not None:
-                                    # Keep most recent score or average them
-                                    if crypto_id not in crypto_scores:
-                                        crypto_scores[crypto_id] = []
-                                    crypto_scores[crypto_id].append(sentiment_score)
-                            
-                            # Insert once per crypto with averaged scores
-                            for crypto_id, scores in crypto_scores.items():
-                                avg_score = sum(scores) / len(scores)
-                                self.db.link_tweet_to_crypto(tweet_id, crypto_id, round(avg_score, 3))
-                else:
-                    self.logger.warning(f"Failed to scrape {account}")
-            except Exception as e:
-                self.logger.error(f"Error processing account {account}: {e}")
+                timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+                item = tweet_queue.get(timeout=timeout)
+            except queue.Empty:
+                item = False
+            if item:
+                account, tweets = item
+                try:
+                    if tweets is not None:
+                        existing = self.db.get_existing_tweet_hashes(tweets['hash_content'])
+                        keep = [h not in existing for h in tweets['hash_content']]
+                        skipped = len(keep) - sum(keep)
+                        if skipped:
+                            self.logger.info("%s: %d tweets already processed, skipping", account, skipped)
+                        if skipped < len(keep):
+                            pending.append((account,
+                                            list(compress(tweets['content'], keep)),
+                                            list(compress(tweets['hash_content'], keep)),
+                                            list(compress(tweets['timestamp'], keep))))
+                            pending_count += len(keep) - skipped
+                            if deadline is None:
+                                deadline = time.monotonic() + conf.SENTIMENT_FLUSH_SECONDS
+                    else:
+                        self.logger.warning(f"Failed to scrape {account}")
+                except Exception as e:
+                    self.logger.error(f"Error processing account {account}: {e}")
+            
+            # item is None once the producer is done, False when the flush deadline passed
+            if pending and (not item or pending_count >= conf.SENTIMENT_FLUSH_TWEETS
+                            or time.monotonic() >= deadline):
+                self._flush(pending, crypto_ids)
+                pending = []
+                pending_count = 0
+                deadline = None
+            if item is None:
+                break
+        producer.join()
     
     def get_account_list(self):
         """Retrieve list of all social media accounts to monitor.
@@ -96,7 +212,8 @@ class SentimentCoordinator:
             self.scraper = None
     
     def close(self):
-        """Clean up resources by closing the scraper if active."""
+        """Clean up resources by closing the scraper if active and returning the database connection."""
         if self.scraper:
             self.scraper.close()
+        self.db.close()
 
@@ -30,13 +30,15 @@ class EntryLogic:
         self.risk_high_confidence = conf.RISK_HIGH_CONFIDENCE
         self.risk_medium_confidence = conf.RISK_MEDIUM_CONFIDENCE
         self.risk_low_confidence = conf.RISK_LOW_CONFIDENCE
+        self.pending_scores = []
 
     def decide_entry(self, crypto_data):
         """Evaluate market conditions and decide whether to enter a trade.
         
         Combines technical analysis scores with sentiment confirmation to generate
         a weighted final score. Compares against threshold levels to determine
-        long, short, or no-trade decisions.
+        long, short, or no-trade decisions. The score row is queued in pending_scores
+        and stored by flush_scores.
         
         Args:
             crypto_data: Dictionary or list containing crypto market data and indicators
@@ -82,19 +84,25 @@ class EntryLogic:
         self.logger.info(f"Crypto {data['crypto_id']}: Technical={technical_score:.3f}, Sentiment={sentiment_score:.3f}, Combined={combined_score:.3f}")
         
         if combined_score > self.threshold_long:
-            self.db_instance.insert_score(data['crypto_id'], technical_score, combined_score, LongShort.EnterLong.value, data['price'])
+            self.pending_scores.append((data['crypto_id'], technical_score, combined_score, LongShort.EnterLong.value, data['price']))
             self.logger.info(f"Decision: ENTER LONG for crypto {data['crypto_id']} with score {combined_score:.3f}")
             return LongShort.EnterLong, combined_score
         elif combined_score < self.threshold_short:
-            self.db_instance.insert_score(data['crypto_id'], technical_score, combined_score, LongShort.EnterShort.value, data['price'])
+            self.pending_scores.append((data['crypto_id'], technical_score, combined_score, LongShort.EnterShort.value, data['price']))
             self.logger.info(f"Decision: ENTER SHORT for crypto {data['crypto_id']} with score {combined_score:.3f}")
             return LongShort.EnterShort, combined_score
         else:
-            self.db_instance.insert_score(data['crypto_id'], technical_score, combined_score, LongShort.NoTrade.value, data['price'])
-            self.logger.debug(f"Decision: NO TRADE for crypto {data['crypto_id']} (score {combined_score:.3f} not strong enough)")
+            self.pending_scores.append((data['crypto_id'], technical_score, combined_score, LongShort.NoTrade.value, data['price']))
+            self.logger.debug("Decision: NO TRADE for crypto %s (score %.3f not strong enough)", data['crypto_id'], combined_score)
             return LongShort.NoTrade, combined_score
         
 
+    def flush_scores(self):
+        """Store the scores recorded by decide_entry since the last flush in one batch insert."""
+        if self.pending_scores:
+            self.db_instance.insert_scores_bulk(self.pending_scores)
+            self.pending_scores = []
+
     def position_sizing(self, capital, final_score, MR, stop_distance_pct):
         """Calculate position size based on signal strength and risk management.
         
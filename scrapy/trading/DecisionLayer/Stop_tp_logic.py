@@ -79,7 +79,7 @@ class StopTpLogic:
                 - last_price: Current market price at trigger
         """
         current_trades = self.db_instance.select_all_trades_current()
-        self.logger.debug(f"Checking {len(current_trades)} active trades for TP/SL")
+        self.logger.debug("Checking %s active trades for TP/SL", len(current_trades))
         results = []
         for trade in current_trades:
             if trade['status_1'] == 0:
@@ -121,4 +121,14 @@ class StopTpLogic:
             trade_id (int): Trade identifier to update
             take_profit_number (int): Which TP level to close (1, 2, or 3)
         """
-        self.db_instance.update_trade_status(trade_id, take_profit_number,1)
\ No newline at end of file
+        self.db_instance.update_trade_status(trade_id, take_profit_number,1)
+    
+    def update_trades_status(self, actions):
+        """Mark the take-profit levels of several triggered actions as closed in one batch.
+        
+        Args:
+            actions (list): Action dictionaries returned by check_all_current_trades
+        """
+        self.db_instance.update_trade_statuses_bulk(
+            [(action['trade_id'], action['take_profit_number'], 1) for action in actions]
+        )
@@ -46,7 +46,7 @@ class Trade_frequency_control:
         """
         last_time = self.last_trade_time.get(crypto_id)
         if last_time is None:
-            self.logger.debug(f"Crypto {crypto_id}: First trade allowed")
+            self.logger.debug("Crypto %s: First trade allowed", crypto_id)
             return True
         time_since_last = current_time - last_time
         can_proceed = time_since_last >= self.min_trade_interval
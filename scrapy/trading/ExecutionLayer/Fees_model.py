@@ -34,5 +34,5 @@ class FeesModel:
             float: Total fee amount to be charged
         """
         fee = (transaction_amount * self.fee_percentage) + self.fee_flat
-        self.logger.debug(f"Transaction fee calculated: {fee:.4f} (amount: {transaction_amount:.2f}, rate: {self.fee_percentage*100:.2f}%)")
+        self.logger.debug("Transaction fee calculated: %.4f (amount: %.2f, rate: %.2f%%)", fee, transaction_amount, self.fee_percentage*100)
         return fee
\ No newline at end of file
@@ -30,8 +30,7 @@ class CorrelationExposure:
         Returns:
             List of prices
         """
-        prices =self.db_instance.get_historical_prices(crypto_id, days)
-        return [entry['price'] for entry in prices]
+        return self.db_instance.get_historical_price_values(crypto_id, days)
 
 
     def calculate_correlation(self, prices1: List[float], prices2: List[float]) -> float:
@@ -70,7 +69,7 @@ class CorrelationExposure:
                 - max_correlation: highest correlation found
                 - correlated_cryptos: list of crypto_ids with high correlation
         """
-        current_trades = self.db_instance.select_all_trades_current()
+        current_trades = self.db_instance.select_all_trades_current(columns=("crypto_id",))
         
         if not current_trades:
             return {
@@ -116,7 +115,7 @@ class CorrelationExposure:
         if not can_trade:
             self.logger.warning(f"Crypto {new_crypto_id}: Correlation too high ({max_correlation:.2f} >= {self.max_correlation_exposure:.2f}) with {len(correlated_cryptos)} cryptos")
         else:
-            self.logger.debug(f"Crypto {new_crypto_id}: Max correlation {max_correlation:.2f} (limit: {self.max_correlation_exposure:.2f})")
+            self.logger.debug("Crypto %s: Max correlation %.2f (limit: %.2f)", new_crypto_id, max_correlation, self.max_correlation_exposure)
         
         return {
             'can_trade': can_trade,
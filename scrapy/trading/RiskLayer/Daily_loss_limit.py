@@ -83,7 +83,9 @@ class DailyLossLimit:
         
         total_pnl = 0.0
         
-        current_trades = self.db_instance.select_all_trades_current()
+        current_trades = self.db_instance.select_all_trades_current(
+            columns=("crypto_id", "direction", "entry_price", "position_size")
+        )
         
         for trade in current_trades:
             pnl = self.calculate_trade_pnl(trade)
@@ -114,7 +116,7 @@ class DailyLossLimit:
         if not can_trade:
             self.logger.warning(f"Daily loss limit REACHED: {current_loss:.2f} / {self.max_daily_loss:.2f}")
         else:
-            self.logger.debug(f"Daily loss: {current_loss:.2f} / {self.max_daily_loss:.2f} (remaining: {remaining_allowance:.2f})")
+            self.logger.debug("Daily loss: %.2f / %.2f (remaining: %.2f)", current_loss, self.max_daily_loss, remaining_allowance)
         
         return {
             'can_trade': can_trade,
@@ -52,7 +52,7 @@ class MaxDrawdownControl:
         if exceeded:
             self.logger.warning(f"Max drawdown EXCEEDED: {drawdown_percent:.2f}% (limit: {self.max_drawdown_percent:.2f}%)")
         else:
-            self.logger.debug(f"Drawdown: {drawdown_percent:.2f}% (peak: {self.peak_capital:.2f}, current: {current_capital:.2f})")
+            self.logger.debug("Drawdown: %.2f%% (peak: %.2f, current: %.2f)", drawdown_percent, self.peak_capital, current_capital)
         
         return exceeded
 
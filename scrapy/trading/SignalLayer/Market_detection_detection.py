@@ -78,7 +78,7 @@ class MarketDetection:
 
         return sum(trs[-period:]) / period
     
-    def detect_market_regime(self, crypto_id: int):
+    def detect_market_regime(self, crypto_id: int, data=None):
         """Detect current market regime for a cryptocurrency.
         
         Analyzes multiple market indicators to classify the current regime:
@@ -92,11 +92,14 @@ class MarketDetection:
         
         Args:
             crypto_id (int): Cryptocurrency ID to analyze
+            data (List[Dict], optional): Rows from get_all_crypto_informations already
+                fetched by the caller. Defaults to None, which queries them.
             
         Returns:
             MarketRegime: Detected market regime enum value
         """
-        data = self.dl.get_all_crypto_informations(crypto_id)
+        if data is None:
+            data = self.dl.get_all_crypto_informations(crypto_id)
 
         prices = [(r["price"]) for r in data][::-1]
         highs = [(r["high_24h"]) for r in data][::-1]
@@ -139,8 +142,8 @@ class MarketDetection:
             return MarketRegime.TREND_DOWN
 
         if self.range_rsi_lower <= rsi <= self.range_rsi_upper:
-            self.logger.debug(f"Crypto {crypto_id}: RANGE detected (RSI={rsi:.1f})")
+            self.logger.debug("Crypto %s: RANGE detected (RSI=%.1f)", crypto_id, rsi)
             return MarketRegime.RANGE
 
-        self.logger.debug(f"Crypto {crypto_id}: NO_TRADE - conditions not met")
+        self.logger.debug("Crypto %s: NO_TRADE - conditions not met", crypto_id)
         return MarketRegime.NO_TRADE
\ No newline at end of file
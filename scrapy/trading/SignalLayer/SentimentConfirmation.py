@@ -85,7 +85,7 @@ class SentimentConfirmation:
         trend_bonus = self.sentiment_trend_bonus(score_12h, score_24h)
         final_score = score_24h_weighted + trend_bonus
         
-        self.logger.debug(f"Sentiment: 24h={score_24h:.3f}, 12h={score_12h:.3f}, tweets={nb_tweets_24h}, weighted={score_24h_weighted:.3f}, bonus={trend_bonus:.2f}, final={final_score:.3f}")
+        self.logger.debug("Sentiment: 24h=%.3f, 12h=%.3f, tweets=%s, weighted=%.3f, bonus=%.2f, final=%.3f", score_24h, score_12h, nb_tweets_24h, score_24h_weighted, trend_bonus, final_score)
         
         if final_score > self.positive_threshold:
             self.logger.info(f"Sentiment confirmation: POSITIVE (score={final_score:.3f})")
@@ -94,5 +94,5 @@ class SentimentConfirmation:
             self.logger.info(f"Sentiment confirmation: NEGATIVE (score={final_score:.3f})")
             return -1
         else:
-            self.logger.debug(f"Sentiment confirmation: NEUTRAL (score={final_score:.3f})")
+            self.logger.debug("Sentiment confirmation: NEUTRAL (score=%.3f)", final_score)
             return 0
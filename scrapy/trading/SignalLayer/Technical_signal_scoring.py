@@ -8,6 +8,14 @@ class TechnicalSignalScoring:
         self.dl = DatabaseCryptoBot()
         self.logger = Logger.get_logger("TechnicalSignalScoring")
         self.weights = conf.TECHNICAL_WEIGHTS
+        # Unpacked once so the weighted sum does plain attribute reads instead of key lookups
+        self.weight_ema = self.weights['ema']
+        self.weight_macd = self.weights['macd']
+        self.weight_rsi = self.weights['rsi']
+        self.weight_sma = self.weights['sma']
+        self.weight_volatility = self.weights['volatility']
+        self.weight_pivot = self.weights['pivot']
+        self.weight_fibo = self.weights['fibo']
         self.rsi_oversold_extreme = conf.RSI_OVERSOLD_EXTREME
         self.rsi_overbought_extreme = conf.RSI_OVERBOUGHT_EXTREME
         self.rsi_oversold_moderate = conf.RSI_OVERSOLD_MODERATE
@@ -285,17 +293,17 @@ class TechnicalSignalScoring:
 
         # Weights configurable from settings.py
         weighted_score = (
-            ema_score * self.weights['ema'] +
-            macd_score * self.weights['macd'] + 
-            rsi_score * self.weights['rsi'] + 
-            sma_score * self.weights['sma'] + 
-            volatility_score * self.weights['volatility'] +
-            pivot_score * self.weights['pivot'] +
-            fibo_score * self.weights['fibo']
+            ema_score * self.weight_ema +
+            macd_score * self.weight_macd + 
+            rsi_score * self.weight_rsi + 
+            sma_score * self.weight_sma + 
+            volatility_score * self.weight_volatility +
+            pivot_score * self.weight_pivot +
+            fibo_score * self.weight_fibo
         )
         # Clamp final score to [-1, +1] range
         final_score = max(min(weighted_score, 1), -1)
         
-        self.logger.debug(f"Technical scoring: RSI={rsi_score:.2f}, MACD={macd_score:.2f}, EMA={ema_score:.2f}, Volatility={volatility_score:.2f} -> Final={final_score:.3f}")
+        self.logger.debug("Technical scoring: RSI=%.2f, MACD=%.2f, EMA=%.2f, Volatility=%.2f -> Final=%.3f", rsi_score, macd_score, ema_score, volatility_score, final_score)
         
         return final_score
\ No newline at end of file
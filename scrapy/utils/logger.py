@@ -19,7 +19,7 @@ class Logger:
         if self.logger.handlers:
             return
         
-        logs_dir = Path(__file__).parent.parent / "logs" / conf.logger_folder
+        logs_dir = Path(__file__).parent.parent / "logs" / conf.logger_folder.get()
         logs_dir.mkdir(parents=True, exist_ok=True)
         
         timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
@@ -44,29 +44,29 @@ class Logger:
         
         self.logger.info(f"Logger initialized - Log file: {log_filename}")
     
-    def debug(self, message):
-        """Log debug message"""
-        self.logger.debug(message)
+    def debug(self, message, *args):
+        """Log debug message, %-formatted with args only if the level is enabled"""
+        self.logger.debug(message, *args)
     
-    def info(self, message):
-        """Log info message"""
-        self.logger.info(message)
+    def info(self, message, *args):
+        """Log info message, %-formatted with args only if the level is enabled"""
+        self.logger.info(message, *args)
     
-    def warning(self, message):
-        """Log warning message"""
-        self.logger.warning(message)
+    def warning(self, message, *args):
+        """Log warning message, %-formatted with args only if the level is enabled"""
+        self.logger.warning(message, *args)
     
-    def error(self, message):
-        """Log error message"""
-        self.logger.error(message)
+    def error(self, message, *args):
+        """Log error message, %-formatted with args only if the level is enabled"""
+        self.logger.error(message, *args)
     
-    def critical(self, message):
-        """Log critical message"""
-        self.logger.critical(message)
+    def critical(self, message, *args):
+        """Log critical message, %-formatted with args only if the level is enabled"""
+        self.logger.critical(message, *args)
     
-    def exception(self, message):
+    def exception(self, message, *args):
         """Log exception with traceback"""
-        self.logger.exception(message)
+        self.logger.exception(message, *args)
     
     def close(self):
         """Close all logger handlers and flush buffers"""
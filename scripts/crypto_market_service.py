@@ -5,8 +5,11 @@ from CoinGecko and Binance APIs, performs technical analysis, and updates the da
 at configured intervals.
 """
 
+import contextvars
+import queue
+import threading
 import time
-import schedule
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
 from scrapy.market.services.coingecko_service import CoingeckoService
@@ -14,9 +17,42 @@ from scrapy.market.services.crypto_listing_service import CryptoListingService
 from scrapy.market.services.binance_service import BinanceService
 from scrapy.market.services.technical_analysis_service import TechnicalAnalysisService
 from scrapy.data.database import CryptoDatabase
+from scrapy.market.collectors.http_session import close_session
 import scrapy.utils.logger as Logger
 import scrapy.config.settings as conf
 
+_db = None
+# Table of each row list in a queued batch
+_MARKET_TABLES = ("crypto_ranks", "cyptos_data_base", "cyptos_data_details", "cyptos_data_binance")
+
+def _db_writer(db, batches, stats):
+    """Store queued row batches until a None sentinel is received.
+    
+    Runs on its own thread so PostgreSQL round-trips and commits overlap with the
+    technical analysis requests of the next batch. The four market tables of a batch
+    are written concurrently, each on its own pooled connection and transaction; a
+    crypto counts as an error if any of its rows could not be stored. A batch that
+    fails as a whole is counted as errors and the thread moves on to the next one.
+    
+    Args:
+        db (CryptoDatabase): Database instance, used only by this thread while it runs
+        batches (queue.Queue): Queue of (rank_rows, base_rows, details_rows, binance_rows)
+        stats (dict): 'success' and 'error' counters updated in place
+    """
+    logger = Logger.get_logger('ServiceManager')
+    with ThreadPoolExecutor(max_workers=len(_MARKET_TABLES)) as executor:
+        while (batch := batches.get()) is not None:
+            try:
+                failed = set().union(*executor.map(lambda args: db.bulk_insert_table(*args), zip(_MARKET_TABLES, batch)))
+            except Exception as e:
+                # Keep draining the queue so the remaining batches are still stored
+                stats['error'] += len(batch[1])
+                logger.error("Error storing market data for %d cryptos: %s", len(batch[1]), e)
+                continue
+            stats['success'] += len(batch[1]) - len(failed)
+            stats['error'] += len(failed)
+            logger.info("Market data for %d/%d cryptos inserted successfully.", len(batch[1]) - len(failed), len(batch[1]))
+
 def run_data_collection():
     """Execute a complete data collection cycle for all tracked cryptocurrencies.
     
@@ -25,24 +61,25 @@ def run_data_collection():
     2. Fetches crypto listings and market data from CoinGecko
     3. Fetches Binance trading data (order book, funding rates, open interest)
     4. Performs technical analysis (RSI, MACD, moving averages, etc.)
-    5. Stores all data in PostgreSQL database
+    5. Stores all data in PostgreSQL database, batch by batch on a writer thread
+       while the analysis of the following cryptos is still running
     
     Each cycle creates a new log folder with timestamp for debugging and tracking.
-    Errors are logged and handled per-crypto to ensure partial success.
+    Errors are logged and handled per-crypto to ensure partial success. The
+    database instance and its pooled connection are reused across cycles.
     """
+    global _db
     cycle_timestamp = datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
-    conf.logger_folder = f"cycle_{cycle_timestamp}"
+    token = conf.logger_folder.set(f"cycle_{cycle_timestamp}")
     
     try:
         logger = Logger.get_logger('ServiceManager')
         logger.info(f"START OF CYCLE - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         
-        db = CryptoDatabase()
-        db.create_table_listing()
-        db.create_table_crypto_ranks()
-        db.create_table_base()
-        db.create_table_detail()
-        db.create_table_data_binance()
+        if _db is None:
+            _db = CryptoDatabase()
+        db = _db
+        db.ensure_schema()
         logger.info("Database tables ensured.")
 
         listing_service = CryptoListingService(refresh_interval_minutes=conf.MARKET_DATA_COLLECTION_INTERVAL_MINUTES)
@@ -56,48 +93,79 @@ def run_data_collection():
 
         
         listing_service.list_all_cryptos()
-        logger.info(f"{len(listing_service.dico_crypto)} cryptos loaded into listing service.")
-        coingeko_instance.list_data()
-        logger.info("Coingecko data updated.")
-        binance_instance.list_data()
-        logger.info("Binance data updated.")
-        technical_analysis_instance.perform_analysis()
-        logger.info("Technical analysis performed.")
+        dico_crypto = listing_service.dico_crypto
+        total = len(dico_crypto)
+        logger.info("%d cryptos loaded into listing service.", total)
+        # CoinGecko and Binance are independent APIs writing disjoint Crypto.data keys
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = {
+                executor.submit(coingeko_instance.list_data): "Coingecko",
+                executor.submit(binance_instance.list_data): "Binance",
+            }
+            for future in as_completed(futures):
+                future.result()
+                logger.info("%s data updated.", futures[future])
+        # Listings are upserted before the analysis so the writer thread has every id
+        db.load_crypto_id_map()
+        id_map = db.upsert_cryptos([
+            (crypto.name, crypto.symbol, crypto.id_coingecko, crypto.symbol_binance)
+            for crypto in dico_crypto.values()
+        ])
         
-        success_count = 0
-        error_count = 0
+        # 'skipped' is only touched by this thread, 'success' and 'error' only by the writer
+        stats = {'success': 0, 'error': 0, 'skipped': 0}
+        batches = queue.Queue()
+        # Threads start with an empty context; run the writer in a copy of this cycle's
+        writer = threading.Thread(target=contextvars.copy_context().run, args=(_db_writer, db, batches, stats), daemon=True)
+        writer.start()
         
-        for crypto_id, crypto in listing_service.dico_crypto.items():
-            try:
-                db_id = db.insert_crypto(crypto.name, crypto.symbol, crypto.id_coingecko, crypto.symbol_binance)
-                if db_id is None:
-                    logger.error(f"Unable to get DB id for {crypto.id_coingecko}, skipping...")
-                    error_count += 1
+        def queue_batch(crypto_ids):
+            """Build the rows of freshly analyzed cryptos and hand them to the writer."""
+            rank_rows = []
+            base_rows = []
+            details_rows = []
+            binance_rows = []
+            for crypto_id in crypto_ids:
+                crypto = dico_crypto[crypto_id]
+                try:
+                    db_id = id_map.get(crypto.id_coingecko)
+                    if db_id is None:
+                        logger.error(f"Unable to get DB id for {crypto.id_coingecko}, skipping...")
+                        stats['skipped'] += 1
+                        continue
+                    # Rows are built up front so a bad value drops this crypto instead of the whole batch
+                    data = crypto.data
+                    rows = ((db_id, crypto.rank), db.base_row(db_id, data), db.details_row(db_id, data), db.binance_row(db_id, data))
+                    rank_rows.append(rows[0])
+                    base_rows.append(rows[1])
+                    details_rows.append(rows[2])
+                    binance_rows.append(rows[3])
+                    
+                except Exception as e:
+                    stats['skipped'] += 1
+                    logger.error(f"Error processing {crypto.name} ({crypto.symbol}): {e}")
                     continue
-                db.insert_or_update_rank(db_id, crypto.rank)
-                db.insert_cyptos_base(db_id, listing_service.dico_crypto[crypto_id].data)
-                db.insert_cyptos_data_details(db_id, listing_service.dico_crypto[crypto_id].data)
-                db.insert_cyptos_data_binance(db_id, listing_service.dico_crypto[crypto_id].data)
-                success_count += 1
-                logger.info(f"Data for {crypto.name} ({crypto.symbol}) inserted/updated successfully.")
-                
-            except Exception as e:
-                error_count += 1
-                logger.error(f"Error processing {crypto.name} ({crypto.symbol}): {e}")
-                db.conn.rollback()
-                continue
+            if base_rows:
+                batches.put((rank_rows, base_rows, details_rows, binance_rows))
+        
+        try:
+            technical_analysis_instance.perform_analysis(on_batch=queue_batch, batch_size=conf.MARKET_DB_BATCH_SIZE)
+            logger.info("Technical analysis performed.")
+        finally:
+            batches.put(None)
+            writer.join()
+        success_count = stats['success']
+        error_count = stats['error'] + stats['skipped']
         
         print(f"\n{'='*100}")
         print(f"CYCLE SUMMARY")
         print(f"{'='*100}")
-        print(f"Success: {success_count}/{len(listing_service.dico_crypto)}")
-        print(f"Errors: {error_count}/{len(listing_service.dico_crypto)}")
+        print(f"Success: {success_count}/{total}")
+        print(f"Errors: {error_count}/{total}")
 
         logger.info(f"Cycle completed at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        logger.info(f"Success: {success_count}/{len(listing_service.dico_crypto)}")
-        logger.info(f"Errors: {error_count}/{len(listing_service.dico_crypto)}")
-        
-        db.close()
+        logger.info("Success: %d/%d", success_count, total)
+        logger.info("Errors: %d/%d", error_count, total)
         
         print(f"\n{'='*100}")
         print(f"END OF CYCLE - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -108,11 +176,13 @@ def run_data_collection():
         print(f"CRITICAL ERROR in cycle: {e}")
         import traceback
         traceback.print_exc()
+    finally:
+        conf.logger_folder.reset(token)
 
 def main():
     """Main entry point for the crypto data collection service.
     
-    Runs an initial data collection cycle immediately, then schedules subsequent
+    Runs an initial data collection cycle immediately, then runs subsequent
     cycles at intervals defined by MARKET_DATA_COLLECTION_INTERVAL_MINUTES.
     
     The service runs continuously until interrupted with Ctrl+C. Each cycle:
@@ -135,20 +205,26 @@ def main():
     ╚═══════════════════════════════════════════════════════════╝
     """)
     
-    run_data_collection()
-    
-    schedule.every(INTERVAL_MINUTES).minutes.do(run_data_collection)
+    interval_seconds = INTERVAL_MINUTES * 60
     
     try:
+        # Sleep straight to a monotonic deadline instead of polling every second;
+        # a cycle that overruns its slot starts the next one immediately
+        next_run = time.monotonic()
         while True:
-            schedule.run_pending()
-            time.sleep(1)
+            run_data_collection()
+            next_run = max(next_run + interval_seconds, time.monotonic())
+            time.sleep(max(0.0, next_run - time.monotonic()))
             
     except KeyboardInterrupt:
         print("\n\n╔═══════════════════════════════════════════════════════════╗")
         print("║                 SERVICE STOP REQUESTED                    ║")
         print("╚═══════════════════════════════════════════════════════════╝\n")
         print("Service stopped cleanly. Goodbye!")
+    finally:
+        close_session()
+        if _db is not None:
+            _db.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
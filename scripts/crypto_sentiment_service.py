@@ -4,7 +4,6 @@ Scheduled service that continuously scrapes Twitter/social media, performs ABSA
 on cryptocurrency mentions, and aggregates sentiment scores at configured intervals.
 """
 
-import schedule
 from datetime import datetime
 import time
 
@@ -26,15 +25,22 @@ def Sentiment():
     Each cycle creates a new log folder with timestamp for debugging and tracking.
     """
     cycle_timestamp = datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
-    conf.logger_folder = f"cycle_{cycle_timestamp}"
-    db = SentimentDatabase()
-    db.create_sentiment_tables()
-    coordinator = SentimentCoordinator( conf.SCRAPER_CONFIG)
-    coordinator.service_run()
-    coordinator.close()
-    db.update_database()
-    sga =SentimentGeneralAnalyser()
-    sga.analyze_sentiments()
+    token = conf.logger_folder.set(f"cycle_{cycle_timestamp}")
+    db = coordinator = sga = None
+    try:
+        db = SentimentDatabase()
+        db.create_sentiment_tables()
+        coordinator = SentimentCoordinator( conf.SCRAPER_CONFIG)
+        coordinator.service_run()
+        db.update_database()
+        sga =SentimentGeneralAnalyser()
+        sga.analyze_sentiments()
+    finally:
+        # Pooled connections are only given back by close(), so every instance is closed each cycle
+        for resource in (sga, coordinator, db):
+            if resource is not None:
+                resource.close()
+        conf.logger_folder.reset(token)
 
 
 
@@ -65,14 +71,16 @@ def main():
     ╚═══════════════════════════════════════════════════════════╝
     """)
     
-    Sentiment()
-    
-    schedule.every(INTERVAL_MINUTES).minutes.do(Sentiment)
+    interval_seconds = INTERVAL_MINUTES * 60
     
     try:
+        # Sleep straight to a monotonic deadline instead of polling every second;
+        # a cycle that overruns its slot starts the next one immediately
+        next_run = time.monotonic()
         while True:
-            schedule.run_pending()
-            time.sleep(1)
+            Sentiment()
+            next_run = max(next_run + interval_seconds, time.monotonic())
+            time.sleep(max(0.0, next_run - time.monotonic()))
             
     except KeyboardInterrupt:
         print("\n\n╔═══════════════════════════════════════════════════════════╗")
@@ -8,7 +8,6 @@ cryptocurrencies and managing open positions with multi-level take-profit and st
 """
 
 import time
-import schedule
 from scrapy.data.database import CryptoDatabase as DatabaseCryptoBot
 from scrapy.trading.SignalLayer.Technical_signal_scoring import TechnicalSignalScoring
 from scrapy.trading.SignalLayer.Market_detection_detection import MarketDetection
@@ -55,11 +54,10 @@ class CryptoBotPipeline:
         self.db = DatabaseCryptoBot()
         
         self.db.drop_tables_scores_and_trade()
-        self.db.create_score_table()
-        self.db.create_trade_table()
-        self.db.create_portfolio_table()
+        self.db.ensure_trading_schema()
 
         self.initial_capital = conf.INITIAL_CAPITAL
+        self.cycle_data = {}
         self.base_sl = 0.6  # 0.6%
 
         self.MarketDetectionInstance = MarketDetection()
@@ -106,8 +104,8 @@ class CryptoBotPipeline:
         """Evaluate and execute trading decision for a specific cryptocurrency.
         
         Complete decision pipeline:
-        1. Detect market regime (skip if PANIC)
-        2. Fetch latest market data and sentiment
+        1. Take latest market data and sentiment (prefetched for the cycle)
+        2. Detect market regime (skip if PANIC)
         3. Calculate entry decision and score
         4. Determine dynamic stop-loss distance based on signal strength
         5. Calculate position sizing based on confidence and risk
@@ -118,11 +116,13 @@ class CryptoBotPipeline:
         Args:
             crypto_id (int): Cryptocurrency database ID to evaluate
         """
-        regime = self.MarketDetectionInstance.detect_market_regime(crypto_id)
+        data = self.cycle_data.get(crypto_id)
+        if data is None:
+            data = self.db.get_crypto_data(crypto_id)
+        regime = self.MarketDetectionInstance.detect_market_regime(crypto_id, data)
         if regime == MarketRegime.PANIC:
             print(f"Market in PANIC for crypto {crypto_id}. No trades executed.")
             return
-        data = self.db.get_crypto_data(crypto_id)
         if not data:
             print(f"No data available for crypto {crypto_id}.")
             return
@@ -202,10 +202,11 @@ class CryptoBotPipeline:
         """
         actions = self.StopTpLogicInstance.check_all_current_trades()
         for action in actions:
-            print(f"Executing action {action['action']} for trade ID {action['trade_id']} on take profit number {action['take_profit_number']}")
-            self.StopTpLogicInstance.update_trade_status(action['trade_id'], action['take_profit_number'])
+            print(f"Executing action {action['action'].name} for trade ID {action['trade_id']} on take profit number {action['take_profit_number']}")
             print(f"P&L for trade ID {action['trade_id']}: {action['profit_loss']} with fees applied : {action['profit_loss'] - self.FeesModelInstance.calculate_fee(action['last_price'])}")
             self.initial_capital += action['profit_loss'] - self.FeesModelInstance.calculate_fee(action['last_price'])
+        # Status updates of the whole cycle are written in one batch
+        self.StopTpLogicInstance.update_trades_status(actions)
     
     def calculate_portfolio_metrics(self):
         """Calculate comprehensive portfolio metrics from open positions.
@@ -219,7 +220,9 @@ class CryptoBotPipeline:
             tuple: (total_balance, free_cash, unrealized_pnl)
         """
         # Get all current open trades
-        open_trades = self.db.select_all_trades_current()
+        open_trades = self.db.select_all_trades_current(
+            columns=("crypto_id", "entry_price", "position_size", "direction")
+        )
         
         # Calculate unrealized PnL from open positions
         unrealized_pnl = 0.0
@@ -275,8 +278,14 @@ class CryptoBotPipeline:
             crypto_ids (list): List of cryptocurrency database IDs to evaluate
         """
         self.pipeline_step_stopTpManagement()
-        for crypto_id in crypto_ids:
-            self.pipeline_step_placeOrder(crypto_id)
+        # Market data of every crypto is fetched once per cycle in a single query
+        self.cycle_data = self.db.get_all_crypto_informations_bulk(crypto_ids)
+        try:
+            for crypto_id in crypto_ids:
+                self.pipeline_step_placeOrder(crypto_id)
+        finally:
+            # Scores of the whole cycle are written in one batch
+            self.EntryLogicInstance.flush_scores()
         
         # Save portfolio performance after all trades
         self.save_portfolio_performance()
@@ -349,14 +358,16 @@ def main():
     pipeline = CryptoBotPipeline()
     crypto_ids_to_trade = pipeline.get_all_ids()
 
-    run_trading_cycle()
-
-    schedule.every(INTERVAL_MINUTES).minutes.do(run_trading_cycle)
+    interval_seconds = INTERVAL_MINUTES * 60
     
     try:
+        # Sleep straight to a monotonic deadline instead of polling every second;
+        # a cycle that overruns its slot starts the next one immediately
+        next_run = time.monotonic()
         while True:
-            schedule.run_pending()
-            time.sleep(1)
+            run_trading_cycle()
+            next_run = max(next_run + interval_seconds, time.monotonic())
+            time.sleep(max(0.0, next_run - time.monotonic()))
             
     except KeyboardInterrupt:
         print("\n\n╔═══════════════════════════════════════════════════════════╗")
@@ -376,14 +376,9 @@ def reset_all():
         db.drop_tables_scores_and_trade()
     
     if conf.CREATE_ALL_TABLES_IF_MISSING:
-        db.create_table_listing()
-        db.create_table_crypto_ranks()
-        db.create_table_base()
-        db.create_table_detail()
-        db.create_table_data_binance()
+        db.ensure_schema()
         db.create_sentiment_tables()
-        db.create_score_table()
-        db.create_trade_table()
+        db.ensure_trading_schema()
     
     if conf.ADD_ALL_TWITTER_ACCOUNTS:
         accounts = conf.TWITTER_ACCOUNTS